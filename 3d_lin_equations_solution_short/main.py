@@ -44,6 +44,40 @@ class DoubleArrow3D(VGroup):
         self.add(arrow1, arrow2)
 
 
+class FlashColor(Animation):
+    """
+    Blends the fill and stroke colors of every part of mob towards color by
+    the rate function. Only those colors are kept, not a copy of the mobject.
+    """
+
+    def __init__(self, mob: Mobject, color: ManimColor, **kwargs):
+        self.color = ManimColor(color)
+        super().__init__(mob, **kwargs)
+
+    def create_starting_mobject(self) -> Mobject:
+        return Mobject()
+
+    def begin(self) -> None:
+        self.members = [m for m in self.mobject.get_family() if isinstance(m, VMobject)]
+        arrays = [
+            array
+            for m in self.members
+            for array in (m.get_fill_rgbas(), m.get_stroke_rgbas())
+        ]
+        self.bounds = np.cumsum([0] + [len(array) for array in arrays])
+        self.start = np.concatenate(arrays) if arrays else np.zeros((0, 4))
+        target = self.start.copy()
+        target[:, :3] = self.color.to_rgb()
+        self.change = target - self.start
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        rgbas = self.start + self.rate_func(alpha) * self.change
+        for i, m in enumerate(self.members):
+            m.fill_rgbas = rgbas[self.bounds[2 * i] : self.bounds[2 * i + 1]]
+            m.stroke_rgbas = rgbas[self.bounds[2 * i + 1] : self.bounds[2 * i + 2]]
+
+
 class LinEqSolutions(Scene):
     def construct(self):
         solutions_type: Text = (
@@ -83,13 +117,31 @@ class LinEqSolutions(Scene):
 
 class ThreeDSystems(ThreeDScene):
     def flash_color(
-        self, mob: Mobject, color: ManimColor, wait_time: int | float = 0, **kwargs
+        self,
+        mob: Mobject | list[Mobject],
+        color: ManimColor | list[ManimColor],
+        wait_time: int | float = 0,
+        run_time: float = 1,
+        **kwargs,
     ) -> None:
-        mob.save_state()
-        self.play(mob.animate.set_color(color), **kwargs)
-        if wait_time > 0:
-            self.wait(wait_time)
-        self.play(mob.animate.restore())
+        # one play there and back, holding the color for wait_time
+        mobs = mob if isinstance(mob, list) else [mob]
+        colors = color if isinstance(color, list) else [color] * len(mobs)
+        total_time = 2 * run_time + wait_time
+        self.play(
+            *[
+                FlashColor(
+                    m,
+                    c,
+                    rate_func=lambda t: there_and_back_with_pause(
+                        t, pause_ratio=wait_time / total_time
+                    ),
+                )
+                for m, c in zip(mobs, colors)
+            ],
+            run_time=total_time,
+            **kwargs,
+        )
 
         return
 
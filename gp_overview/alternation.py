@@ -0,0 +1,173 @@
+"""
+Alternation (Spector and Helmuth), the recombination of PushGP, for a
+whole population of parent pairs at once.
+
+A read head starts at the front of one parent and copies genes from it.
+On every step, with the alternation rate, it jumps to the other parent
+instead of copying, moving forward or back by a rounded Gaussian times the
+alignment deviation. It stops when it runs off the end of the parent it
+reads, or after as many steps as both parents have genes.
+
+Whether each step is a jump doesn't depend on where the head is, so the
+runs of copies between jumps are known from the random draws up front.
+Only the head's position has to be carried from one run to the next,
+which is a loop over jumps for all pairs together, not over genes.
+
+Genomes are in the padded integer form of `umad`.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from umad import PAD
+
+
+@dataclass
+class AlternationResult:
+    """
+    The children of every pair, arrays with a row per pair.
+
+    parameters:
+        children (np.ndarray): The children, padded with PAD
+        lengths (np.ndarray): The length of every child
+        sources (np.ndarray): Which parent, 0 or 1, every gene was copied from, PAD past the end
+        positions (np.ndarray): Where in that parent the read head was, PAD past the end
+        starts (np.ndarray): The parent, 0 or 1, the read head started on
+    """
+
+    children: np.ndarray
+    lengths: np.ndarray
+    sources: np.ndarray
+    positions: np.ndarray
+    starts: np.ndarray
+
+    def path(self, pair: int) -> list[tuple[int, int]]:
+        """
+        The read head's path for one pair: the parent and position of every
+        gene it copied.
+        """
+        length = self.lengths[pair]
+        return list(
+            zip(
+                self.sources[pair, :length].tolist(),
+                self.positions[pair, :length].tolist(),
+            )
+        )
+
+
+def alternation(
+    parents0: np.ndarray,
+    lengths0: np.ndarray,
+    parents1: np.ndarray,
+    lengths1: np.ndarray,
+    rng: np.random.Generator,
+    alternation_rate: float = 0.1,
+    alignment_deviation: float = 10.0,
+    max_length: Optional[int] = None,
+) -> AlternationResult:
+    """
+    Recombines every pair of parents, `parents0[i]` with `parents1[i]`.
+
+    parameters:
+        parents0 (np.ndarray): The first parent of every pair, padded with PAD
+        lengths0 (np.ndarray): Their lengths
+        parents1 (np.ndarray): The second parent of every pair, padded with PAD
+        lengths1 (np.ndarray): Their lengths
+        rng (np.random.Generator): Decides the starting parent, the jumps and how far they move
+        alternation_rate (float, default = 0.1): The chance of jumping on every step
+        alignment_deviation (float, default = 10.0): The standard deviation of how far a jump moves
+        max_length (Optional[int], default = None): Children are cut off at this length
+
+    returns:
+        (AlternationResult): The children and the read head's path through the parents
+    """
+    lengths = np.column_stack([lengths0, lengths1]).astype(np.int64)
+    num_pairs = len(lengths)
+    budgets = lengths.sum(axis=1)
+
+    # every step of every pair is drawn at once: which are jumps, and by how much
+    steps = np.arange(budgets.max(initial=0))
+    draws = rng.random((num_pairs, len(steps)), dtype=np.float32)
+    jumps = (draws < alternation_rate) & (steps < budgets[:, None])
+    jump_rows, jump_steps = np.nonzero(jumps)
+    num_jumps = jumps.sum(axis=1)
+    # jump_times[k, pair] is the step of the pair's k-th jump, its budget
+    # after the last. Jump-major, so every iteration below reads one row
+    num_runs = num_jumps.max(initial=0) + 1
+    jump_times = np.broadcast_to(budgets, (num_runs, num_pairs)).astype(np.int32)
+    first_jump = np.cumsum(num_jumps) - num_jumps
+    jump_index = np.arange(len(jump_rows)) - np.repeat(first_jump, num_jumps)
+    jump_times[jump_index, jump_rows] = jump_steps
+    moves = np.rint(
+        rng.standard_normal(jump_times.shape, dtype=np.float32) * alignment_deviation
+    ).astype(np.int32)
+
+    starts = rng.integers(0, 2, num_pairs)
+    parent = starts
+    position = np.zeros(num_pairs, dtype=np.int64)
+    previous_jump = np.full(num_pairs, -1, dtype=np.int64)
+    alive = budgets > 0
+    # the run of copies before every jump: which parent, from where, how many
+    run_parents = np.zeros((num_runs, num_pairs), dtype=np.int8)
+    run_starts = np.zeros((num_runs, num_pairs), dtype=np.int32)
+    run_copies = np.zeros((num_runs, num_pairs), dtype=np.int32)
+    for k in range(num_runs):
+        run_length = jump_times[k] - previous_jump - 1
+        available = np.where(parent == 0, lengths[:, 0], lengths[:, 1]) - position
+        alive &= available > 0
+        run_parents[k] = parent
+        run_starts[k] = position
+        run_copies[k] = np.where(alive, np.minimum(run_length, available), 0)
+
+        # off the end of its parent, or out of steps, before jump k
+        alive &= (run_length < available) & (jump_times[k] < budgets)
+        if not alive.any():
+            break
+        position = np.maximum(0, position + run_length + moves[k])
+        parent = 1 - parent
+        previous_jump = jump_times[k]
+
+    # the runs of every pair in order, and where each starts in its child
+    run_copies = run_copies[: k + 1].T.ravel()
+    runs = np.flatnonzero(run_copies)
+    run_copies = run_copies[runs]
+    run_parents = run_parents[: k + 1].T.ravel()[runs]
+    run_starts = run_starts[: k + 1].T.ravel()[runs]
+    run_pairs = runs // (k + 1)
+    child_lengths = np.bincount(
+        run_pairs, weights=run_copies, minlength=num_pairs
+    ).astype(np.int64)
+    run_offsets = np.cumsum(run_copies) - run_copies
+    pair_offsets = np.cumsum(child_lengths) - child_lengths
+    if max_length is not None:
+        child_lengths = np.minimum(child_lengths, max_length)
+
+    # one entry per copied gene
+    gene_pairs = np.repeat(run_pairs, run_copies)
+    within_run = np.arange(run_copies.sum()) - np.repeat(run_offsets, run_copies)
+    gene_parents = np.repeat(run_parents, run_copies)
+    gene_positions = np.repeat(run_starts, run_copies) + within_run
+    child_positions = np.arange(run_copies.sum()) - pair_offsets[gene_pairs]
+    kept = child_positions < child_lengths[gene_pairs]
+    gene_pairs, gene_parents, gene_positions, child_positions = (
+        gene_pairs[kept],
+        gene_parents[kept],
+        gene_positions[kept],
+        child_positions[kept],
+    )
+
+    width = child_lengths.max(initial=0)
+    children = np.full((num_pairs, width), PAD, dtype=parents0.dtype)
+    sources = np.full((num_pairs, width), PAD, dtype=np.int8)
+    positions = np.full((num_pairs, width), PAD, dtype=np.int32)
+    genes = np.where(
+        gene_parents == 0,
+        parents0[gene_pairs, np.minimum(gene_positions, parents0.shape[1] - 1)],
+        parents1[gene_pairs, np.minimum(gene_positions, parents1.shape[1] - 1)],
+    )
+    children[gene_pairs, child_positions] = genes
+    sources[gene_pairs, child_positions] = gene_parents
+    positions[gene_pairs, child_positions] = gene_positions
+    return AlternationResult(children, child_lengths, sources, positions, starts)
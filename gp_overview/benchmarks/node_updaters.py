@@ -0,0 +1,123 @@
+"""
+Per-frame cost of nodes whose label follows the circle with an updater,
+against `Node`, whose label moves with the circle as part of the group.
+
+Two things are timed for each node count:
+
+    update   one `Scene.update_mobjects` pass over the nodes, which the scene
+             runs on every frame of every play
+    frame    a rendered frame of a 1 second play that only moves a dot.
+             Mobjects with updaters count as moving, so every node is
+             redrawn on every frame instead of once into the background
+
+    python benchmarks/node_updaters.py --counts 10 100 1000
+"""
+
+from pathlib import Path
+from typing import Callable
+import argparse
+import statistics
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from manim import (  # noqa: E402
+    BLUE,
+    RIGHT,
+    Circle,
+    Dot,
+    Scene,
+    VGroup,
+    tempconfig,
+)
+
+from node import Node  # noqa: E402
+from text_cache import cached_text  # noqa: E402
+
+
+def updater_node(text: str) -> VGroup:
+    """
+    The old `create_node`, kept here to compare against.
+    """
+    node = Circle(radius=0.7, color=BLUE)
+    label = cached_text(text, font_size=30)
+    label.add_updater(lambda x: x.move_to(node.get_center()))
+    return VGroup(node, label)
+
+
+def node_grid(make_node: Callable[[str], VGroup], count: int) -> VGroup:
+    return (
+        VGroup(*[make_node(str(n % 10)) for n in range(count)])
+        .arrange_in_grid(buff=0.1)
+        .scale_to_fit_height(7)
+    )
+
+
+def time_updates(nodes: VGroup, frames: int) -> float:
+    """
+    Seconds per frame spent running updaters.
+    """
+    scene = Scene()
+    scene.add(nodes)
+    start = time.perf_counter()
+    for _ in range(frames):
+        scene.update_mobjects(1 / 30)
+    return (time.perf_counter() - start) / frames
+
+
+def time_frames(nodes: VGroup) -> float:
+    """
+    Seconds per rendered frame of a play that only moves a dot.
+    """
+
+    class NodeScene(Scene):
+        def construct(self) -> None:
+            self.add(nodes)
+            self.play(Dot().animate.shift(RIGHT), run_time=1)
+
+    with tempconfig(
+        {"quality": "low_quality", "dry_run": True, "disable_caching": True}
+    ):
+        scene = NodeScene()
+        start = time.perf_counter()
+        scene.render()
+        elapsed = time.perf_counter() - start
+        frames = scene.renderer.time * scene.renderer.camera.frame_rate
+    return elapsed / max(frames, 1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--counts", type=int, nargs="+", default=[10, 50, 100, 250, 500, 1000]
+    )
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--no-render", action="store_true", help="Only time the update step"
+    )
+    args = parser.parse_args()
+
+    columns = ["update (updater)", "update (Node)"]
+    if not args.no_render:
+        columns += ["frame (updater)", "frame (Node)"]
+    header = f"{'nodes':>6}" + "".join(f" {column:>17}" for column in columns)
+    print(header)
+    for count in args.counts:
+        row = f"{count:>6}"
+        for make_node in (updater_node, Node):
+            nodes = node_grid(make_node, count)
+            seconds = statistics.median(
+                time_updates(nodes, args.frames) for _ in range(args.repeat)
+            )
+            row += f" {seconds * 1000:>14.3f} ms"
+        if not args.no_render:
+            for make_node in (updater_node, Node):
+                seconds = time_frames(node_grid(make_node, count))
+                row += f" {seconds * 1000:>14.1f} ms"
+        print(row, flush=True)
+
+
+if __name__ == "__main__":
+    main()
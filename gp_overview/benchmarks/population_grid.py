@@ -0,0 +1,170 @@
+"""
+Per-frame cost of animating a population as a `PopulationGrid`, against a
+VGroup of RoundedRectangles with a Transform per individual, the way
+ShowPopulation used to.
+
+Each population, a square grid of the given side, is animated through one
+play each of
+
+    mutate   a tenth of the individuals recolored
+    merge    a tenth of the individuals merged with their right neighbor
+    sort     every individual moved to its place in order of fitness
+
+    python benchmarks/population_grid.py --sides 5 25 50 100
+"""
+
+from pathlib import Path
+import argparse
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from manim import (  # noqa: E402
+    BLUE,
+    PURPLE,
+    YELLOW,
+    AnimationGroup,
+    RoundedRectangle,
+    Scene,
+    Transform,
+    VGroup,
+    tempconfig,
+)
+
+import numpy as np  # noqa: E402
+
+from population_grid import PopulationGrid  # noqa: E402
+
+
+def population_plan(side: int, seed: int = 0):
+    """
+    Who mutates, which pairs merge and the fitness of every individual.
+    """
+    rng = np.random.default_rng(seed)
+    size = side * side
+    mutated = rng.choice(size, size // 10, replace=False)
+    # left halves of pairs of neighbors in a row, none of them taken twice
+    lefts = np.flatnonzero(np.arange(size) % side % 2 == 0)
+    lefts = lefts[lefts % side < side - 1]
+    lefts = rng.choice(lefts, min(len(lefts), size // 20), replace=False)
+    pairs = np.column_stack([lefts, lefts + 1])
+    fitness = rng.random(size)
+    return mutated, pairs, fitness
+
+
+def shape_scale(side: int) -> float:
+    """
+    How much the individuals, 1 high with 0.6 between them, are scaled so
+    the population is 7 high.
+    """
+    return 7 / (side + 0.6 * (side - 1))
+
+
+def grid_scene(side: int) -> type[Scene]:
+    mutated, pairs, fitness = population_plan(side)
+
+    class GridScene(Scene):
+        def construct(self) -> None:
+            scale = shape_scale(side)
+            population = PopulationGrid(
+                side,
+                side,
+                template=RoundedRectangle().scale(0.5 * scale),
+                buff=0.6 * scale,
+            )
+            self.add(population)
+            self.play(population.animate_recolor(mutated, YELLOW))
+            self.play(population.animate_merge(pairs, PURPLE))
+            self.play(population.animate_sort(fitness))
+
+    return GridScene
+
+
+def transform_scene(side: int) -> type[Scene]:
+    mutated, pairs, fitness = population_plan(side)
+
+    class TransformScene(Scene):
+        def construct(self) -> None:
+            scale = shape_scale(side)
+            rrects = VGroup(
+                *[
+                    RoundedRectangle(color=BLUE).scale(0.5 * scale)
+                    for _ in range(side * side)
+                ]
+            )
+            rrects.arrange_in_grid(rows=side, cols=side, buff=0.6 * scale)
+            slots = [rrect.get_center() for rrect in rrects]
+            self.add(rrects)
+
+            self.play(
+                AnimationGroup(
+                    *[
+                        Transform(rrects[i], rrects[i].copy().set_color(YELLOW))
+                        for i in mutated
+                    ]
+                )
+            )
+            self.play(
+                AnimationGroup(
+                    *[
+                        Transform(
+                            VGroup(rrects[i], rrects[j]),
+                            RoundedRectangle(color=PURPLE)
+                            .scale(0.5 * scale)
+                            .move_to((slots[i] + slots[j]) / 2),
+                        )
+                        for i, j in pairs
+                    ]
+                )
+            )
+            order = np.argsort(-fitness, kind="stable")
+            self.play(
+                *[
+                    rrects[individual].animate.move_to(slots[rank])
+                    for rank, individual in enumerate(order)
+                ]
+            )
+
+    return TransformScene
+
+
+def time_frames(scene_class: type[Scene]) -> float:
+    """
+    Seconds per rendered frame of the scene.
+    """
+    with tempconfig(
+        {"quality": "low_quality", "dry_run": True, "disable_caching": True}
+    ):
+        scene = scene_class()
+        start = time.perf_counter()
+        scene.render()
+        elapsed = time.perf_counter() - start
+        frames = scene.renderer.time * scene.renderer.camera.frame_rate
+    return elapsed / max(frames, 1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sides", type=int, nargs="+", default=[5, 25, 50, 100])
+    parser.add_argument(
+        "--no-transform",
+        action="store_true",
+        help="Only time PopulationGrid, the Transforms are slow at 100x100",
+    )
+    args = parser.parse_args()
+
+    columns = ["frame (grid)"]
+    if not args.no_transform:
+        columns.append("frame (Transform)")
+    print(f"{'side':>5}" + "".join(f" {column:>18}" for column in columns))
+    for side in args.sides:
+        row = f"{side:>5}"
+        row += f" {time_frames(grid_scene(side)) * 1000:>15.1f} ms"
+        if not args.no_transform:
+            row += f" {time_frames(transform_scene(side)) * 1000:>15.1f} ms"
+        print(row, flush=True)
+
+
+if __name__ == "__main__":
+    main()
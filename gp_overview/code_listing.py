@@ -0,0 +1,222 @@
+"""
+A code listing mobject with a line index, for highlighting lines of
+pseudocode or real source without hand counted character ranges.
+"""
+
+from manim import (
+    BLUE,
+    DEFAULT_MOBJECT_TO_EDGE_BUFFER,
+    WHITE,
+    Animation,
+    FadeToColor,
+    Mobject,
+    Rectangle,
+    VGroup,
+    interpolate,
+)
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final, Optional
+import hashlib
+
+import numpy as np
+
+import text_cache
+from text_cache import cached_text
+
+# the code that builds listings, part of every saved state's key so a
+# change to it never loads a listing built the old way
+LISTING_SOURCE_HASH: Final[str] = hashlib.sha256(
+    Path(__file__).read_bytes() + Path(text_cache.__file__).read_bytes()
+).hexdigest()
+
+
+class CodeListing(VGroup):
+    """
+    A listing built from a single Text, so it is laid out exactly like
+    `Text(code)`, with its glyphs grouped by line. `listing[n]` is the
+    n-th line, counted from the first non blank line.
+
+    Text only keeps a glyph per non whitespace character, so the glyphs of
+    each line are found by counting those once at construction.
+    Highlighting a line only touches that line's glyphs.
+
+    parameters:
+        code (str): The code to display
+        font_size (float, default = 30): The font size
+        color (default = WHITE): The color of lines that aren't highlighted
+        highlight_color (default = BLUE): The color of the highlighted line
+    """
+
+    def __init__(
+        self,
+        code: str,
+        font_size: float = 30,
+        color=WHITE,
+        highlight_color=BLUE,
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.code = code
+        self.font_size = font_size
+        self.base_color = color
+        self.highlight_color = highlight_color
+        self.highlighted: set[int] = set()
+
+        text = cached_text(code, font_size=font_size, color=color)
+        glyphs = text.submobjects
+        self.line_strings: list[str] = code.strip("\n").split("\n")
+        start = 0
+        for line in self.line_strings:
+            end = start + len("".join(line.split()))
+            self.add(VGroup(*glyphs[start:end]))
+            start = end
+
+    def line(self, line: int) -> Optional[VGroup]:
+        """
+        The glyphs of line `line`, or None for -1 (no line).
+        """
+        if line < 0:
+            return None
+        return self.submobjects[line]
+
+    def highlight(self, line: int, color=None) -> "CodeListing":
+        group = self.line(line)
+        if group is not None:
+            group.set_color(color or self.highlight_color)
+            self.highlighted.add(line)
+        return self
+
+    def unhighlight(self, line: int) -> "CodeListing":
+        group = self.line(line)
+        if group is not None:
+            group.set_color(self.base_color)
+            self.highlighted.discard(line)
+        return self
+
+    def move_highlight(self, start_line: int, end_line: int) -> list[Animation]:
+        """
+        Animations that turn `start_line` back to the base color and
+        highlight `end_line`. -1 skips either side.
+        """
+        animations: list[Animation] = []
+        start = self.line(start_line)
+        end = self.line(end_line)
+        if start is not None and start_line != end_line:
+            animations.append(FadeToColor(start, self.base_color))
+            self.highlighted.discard(start_line)
+        if end is not None:
+            animations.append(FadeToColor(end, self.highlight_color))
+            self.highlighted.add(end_line)
+        return animations
+
+    def placement(
+        self,
+        scale: float = 1.0,
+        center: bool = False,
+        edge: Optional[np.ndarray] = None,
+    ) -> tuple[float, np.ndarray]:
+        """
+        Where the listing ends up after scaling by `scale` about its center,
+        then optionally centering it and moving it to `edge`. Worked out on
+        a rectangle the size of the listing instead of a copy of it.
+
+        returns:
+            (tuple[float, np.ndarray]): The scale factor and the final center
+        """
+        proxy = Rectangle(width=self.width, height=self.height).move_to(self)
+        proxy.scale(scale)
+        if center:
+            proxy.center()
+        if edge is not None:
+            proxy.to_edge(edge, buff=DEFAULT_MOBJECT_TO_EDGE_BUFFER)
+        return scale, proxy.get_center()
+
+    def place(
+        self,
+        scale: float = 1.0,
+        center: bool = False,
+        edge: Optional[np.ndarray] = None,
+    ) -> "CodeListing":
+        factor, target = self.placement(scale, center, edge)
+        return self.scale(factor).move_to(target)
+
+    def animate_placement(
+        self,
+        scale: float = 1.0,
+        center: bool = False,
+        edge: Optional[np.ndarray] = None,
+        **kwargs,
+    ) -> "ScaleAndMove":
+        factor, target = self.placement(scale, center, edge)
+        return ScaleAndMove(self, factor, target, **kwargs)
+
+
+@dataclass(frozen=True)
+class ListingState:
+    """
+    Where a listing is and which lines are highlighted, relative to a new
+    listing at the center of the screen. Its key also changes with the
+    code of this module and text_cache.
+
+    parameters:
+        code (str): The code in the listing
+        font_size (float): Its font size
+        highlighted (tuple[int, ...], default = ()): The highlighted lines
+        scale (float, default = 1.0): How much it's been scaled
+        edge (Optional[tuple[float, float, float]], default = None): The edge it's been moved to
+    """
+
+    code: str
+    font_size: float
+    highlighted: tuple[int, ...] = ()
+    scale: float = 1.0
+    edge: Optional[tuple[float, float, float]] = None
+
+    @property
+    def key(self) -> str:
+        return hashlib.sha256((repr(self) + LISTING_SOURCE_HASH).encode()).hexdigest()
+
+    def build(self) -> CodeListing:
+        listing = CodeListing(self.code, font_size=self.font_size)
+        for line in self.highlighted:
+            listing.highlight(line)
+        edge = None if self.edge is None else np.array(self.edge)
+        return listing.place(scale=self.scale, edge=edge)
+
+
+class ScaleAndMove(Animation):
+    """
+    Scales a mobject about its center while moving that center to
+    `target_center`, in place. Unlike Transform and `.animate`, nothing is
+    copied, which matters for mobjects with thousands of submobjects.
+
+    parameters:
+        mobject (Mobject): The mobject to move
+        scale_factor (float): How much bigger it is at the end
+        target_center (np.ndarray): Where its center is at the end
+    """
+
+    def __init__(
+        self, mobject: Mobject, scale_factor: float, target_center: np.ndarray, **kwargs
+    ) -> None:
+        super().__init__(mobject, **kwargs)
+        self.scale_factor = scale_factor
+        self.target_center = np.array(target_center)
+
+    def begin(self) -> None:
+        self.start_center = self.mobject.get_center()
+        self.applied_scale = 1.0
+        super().begin()
+
+    def create_starting_mobject(self) -> Mobject:
+        # the start is kept as a center and a scale, not a copy
+        return Mobject()
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        t = self.rate_func(alpha)
+        scale = 1 + (self.scale_factor - 1) * t
+        self.mobject.scale(scale / self.applied_scale).move_to(
+            interpolate(self.start_center, self.target_center, t)
+        )
+        self.applied_scale = scale
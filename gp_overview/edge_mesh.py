@@ -0,0 +1,220 @@
+"""
+All the edges between two layers of a network as a handful of mobjects.
+
+One `Line` per edge means one VMobject per edge to copy, interpolate and
+draw, which is 4,096 of them between two 64 node layers. An EdgeMesh keeps
+every edge's endpoints in arrays, and draws all the edges that share a
+color and opacity as the subpaths of a single VMobject.
+"""
+
+from manim import (
+    DEFAULT_STROKE_WIDTH,
+    WHITE,
+    ManimColor,
+    Mobject,
+    VGroup,
+    VMobject,
+)
+from typing import Iterable, Optional, Sequence
+
+import numpy as np
+
+
+def line_curves(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """
+    The points of straight cubic Bezier curves from `starts` to `ends`,
+    four per curve.
+    """
+    direction = ends - starts
+    return np.stack(
+        [starts, starts + direction / 3, starts + 2 * direction / 3, ends], axis=1
+    ).reshape(-1, 3)
+
+
+def trimmed_segments(
+    centers0: np.ndarray,
+    radii0: np.ndarray,
+    centers1: np.ndarray,
+    radii1: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Segments from each of `centers0` to the matching one of `centers1`,
+    starting and ending on circles of the given radii around them, like
+    `Line(circle0, circle1)`.
+    """
+    direction = centers1 - centers0
+    length = np.linalg.norm(direction, axis=1, keepdims=True)
+    unit = np.divide(direction, length, out=np.zeros_like(direction), where=length > 0)
+    return centers0 + unit * radii0[:, None], centers1 - unit * radii1[:, None]
+
+
+class EdgeBucket(VMobject):
+    """
+    The edges of an EdgeMesh with one color and opacity. Every edge is one
+    cubic curve, so drawing it partially (Create, Write) grows every edge
+    at once instead of one after the other.
+
+    parameters:
+        edges (np.ndarray): The indices of these edges in the mesh
+    """
+
+    def __init__(self, edges: np.ndarray, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.edges = edges
+
+    def pointwise_become_partial(
+        self, vmobject: VMobject, a: float, b: float
+    ) -> "EdgeBucket":
+        curves = vmobject.points.reshape(-1, 4, 3)
+        starts = curves[:, 0]
+        direction = curves[:, 3] - starts
+        self.points = line_curves(starts + a * direction, starts + b * direction)
+        return self
+
+
+class EdgeMesh(VGroup):
+    """
+    A batch of straight edges stored as two arrays of endpoints, with a
+    color and an opacity per edge.
+
+    parameters:
+        starts (np.ndarray): The start point of every edge, shape (n, 3)
+        ends (np.ndarray): The end point of every edge, shape (n, 3)
+        color (default = WHITE): The color of every edge
+        stroke_width (float, default = DEFAULT_STROKE_WIDTH): The width of every edge
+        stroke_opacity (float, default = 1.0): The opacity of every edge
+    """
+
+    def __init__(
+        self,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        color=WHITE,
+        stroke_width: float = DEFAULT_STROKE_WIDTH,
+        stroke_opacity: float = 1.0,
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.starts = np.array(starts, dtype=float).reshape(-1, 3)
+        self.ends = np.array(ends, dtype=float).reshape(-1, 3)
+        self.stroke_width = stroke_width
+        self.edge_palette: list[ManimColor] = [ManimColor(color)]
+        self.edge_color_index = np.zeros(len(self.starts), dtype=int)
+        self.edge_opacity = np.full(len(self.starts), stroke_opacity, dtype=float)
+        self.build_buckets()
+
+    @classmethod
+    def between(
+        cls,
+        nodes0: Sequence[Mobject],
+        nodes1: Sequence[Mobject],
+        **kwargs,
+    ) -> "EdgeMesh":
+        """
+        Every edge from a node in `nodes0` to a node in `nodes1`, in the
+        order `nodes0[0] -> nodes1[0], nodes0[0] -> nodes1[1], ...`. Like
+        `Line(node0, node1)`, edges start and end on the nodes' outlines,
+        taking each node as a circle as wide as it is.
+        """
+        centers0 = np.array([node.get_center() for node in nodes0]).reshape(-1, 3)
+        centers1 = np.array([node.get_center() for node in nodes1]).reshape(-1, 3)
+        radii0 = np.array([node.width / 2 for node in nodes0])
+        radii1 = np.array([node.width / 2 for node in nodes1])
+
+        starts, ends = trimmed_segments(
+            np.repeat(centers0, len(centers1), axis=0),
+            np.repeat(radii0, len(centers1)),
+            np.tile(centers1, (len(centers0), 1)),
+            np.tile(radii1, len(centers0)),
+        )
+        return cls(starts, ends, **kwargs)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.starts)
+
+    def sync_endpoints(self) -> None:
+        """
+        Reads the endpoints back from the buckets, which is where moving,
+        scaling or rotating the mesh changes them.
+        """
+        for bucket in self.submobjects:
+            curves = bucket.points.reshape(-1, 4, 3)
+            if len(curves) == len(bucket.edges):
+                self.starts[bucket.edges] = curves[:, 0]
+                self.ends[bucket.edges] = curves[:, 3]
+
+    def build_buckets(self) -> None:
+        styles = np.column_stack([self.edge_color_index, self.edge_opacity])
+        unique_styles, inverse = np.unique(styles, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        buckets = []
+        for style, (color_index, opacity) in enumerate(unique_styles):
+            edges = np.flatnonzero(inverse == style)
+            bucket = EdgeBucket(
+                edges,
+                stroke_color=self.edge_palette[int(color_index)],
+                stroke_width=self.stroke_width,
+                stroke_opacity=opacity,
+            )
+            bucket.points = line_curves(self.starts[edges], self.ends[edges])
+            buckets.append(bucket)
+        self.submobjects = []
+        self.add(*buckets)
+
+    def set_edge_style(
+        self,
+        edges: int | Iterable[int] | np.ndarray,
+        color=None,
+        opacity: Optional[float] = None,
+    ) -> "EdgeMesh":
+        """
+        Changes the color and/or opacity of some of the edges.
+
+        parameters:
+            edges (int | Iterable[int] | np.ndarray): Edge indices, or a boolean mask over the edges
+            color (default = None): The new color, None to keep it
+            opacity (Optional[float], default = None): The new opacity, None to keep it
+        """
+        edges = self.edge_indices(edges)
+        self.sync_endpoints()
+        if color is not None:
+            color = ManimColor(color)
+            if color not in self.edge_palette:
+                self.edge_palette.append(color)
+            self.edge_color_index[edges] = self.edge_palette.index(color)
+        if opacity is not None:
+            self.edge_opacity[edges] = opacity
+        self.build_buckets()
+        return self
+
+    def highlight(self, edges, color) -> "EdgeMesh":
+        return self.set_edge_style(edges, color=color)
+
+    def edge_indices(self, edges: int | Iterable[int] | np.ndarray) -> np.ndarray:
+        if isinstance(edges, int):
+            edges = [edges]
+        edges = np.asarray(edges if isinstance(edges, np.ndarray) else list(edges))
+        if edges.dtype == bool:
+            return np.flatnonzero(edges)
+        return edges.astype(int).reshape(-1)
+
+    def edge_subset(self, edges, color=None) -> EdgeBucket:
+        """
+        A standalone mobject of some of the edges, e.g. to Create over them
+        in a highlight color.
+        """
+        edges = self.edge_indices(edges)
+        self.sync_endpoints()
+        if color is None and len(edges):
+            color = self.edge_palette[int(self.edge_color_index[edges[0]])]
+        subset = EdgeBucket(edges, stroke_color=color, stroke_width=self.stroke_width)
+        subset.points = line_curves(self.starts[edges], self.ends[edges])
+        return subset
+
+    def endpoints(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Copies of the start and end points of every edge, as they are now.
+        """
+        self.sync_endpoints()
+        return self.starts.copy(), self.ends.copy()
@@ -0,0 +1,146 @@
+"""
+Flashing mobjects a color and back, in one animation.
+
+`save_state` copies the whole mobject, points and all, to restore it
+afterwards, and `.animate` copies it again for every play. A flash only
+changes colors, so `ColorSnapshot` keeps the fill and stroke colors and
+opacities of every part of the mobject, as one array, and `FlashColor`
+blends that array towards the flash color and back.
+"""
+
+from manim import (
+    Animation,
+    AnimationGroup,
+    ManimColor,
+    Mobject,
+    VMobject,
+    smooth,
+    there_and_back,
+)
+from typing import Optional, Sequence
+
+import numpy as np
+
+
+class ColorSnapshot:
+    """
+    The fill and stroke colors and opacities of every VMobject in a
+    mobject's family, as they are when it is taken.
+
+    parameters:
+        mobject (Mobject): The mobject
+    """
+
+    def __init__(self, mobject: Mobject) -> None:
+        self.members = [
+            member for member in mobject.get_family() if isinstance(member, VMobject)
+        ]
+        arrays = [
+            array
+            for member in self.members
+            for array in (member.get_fill_rgbas(), member.get_stroke_rgbas())
+        ]
+        self.rgbas = np.concatenate(arrays) if arrays else np.zeros((0, 4))
+        self.bounds = np.cumsum([0] + [len(array) for array in arrays])
+
+    def tinted(self, color) -> np.ndarray:
+        """
+        The colors after `set_color(color)`, which keeps every opacity.
+        """
+        rgbas = self.rgbas.copy()
+        rgbas[:, :3] = ManimColor(color).to_rgb()
+        return rgbas
+
+    def apply(self, rgbas: np.ndarray) -> None:
+        for index, member in enumerate(self.members):
+            member.fill_rgbas = rgbas[
+                self.bounds[2 * index] : self.bounds[2 * index + 1]
+            ]
+            member.stroke_rgbas = rgbas[
+                self.bounds[2 * index + 1] : self.bounds[2 * index + 2]
+            ]
+
+
+class FlashColor(Animation):
+    """
+    Blends a mobject's colors towards `color` by the rate function, so the
+    default `there_and_back` flashes it and ends where it started.
+
+    To stop at the color, e.g. to go to the next slide, play it with a rate
+    function that ends at 1, and then another one with the first one's
+    `snapshot` and one that ends at 0.
+
+    parameters:
+        mobject (Mobject): The mobject to flash
+        color: The color to flash it
+        snapshot (Optional[ColorSnapshot], default = None): The colors to flash from,
+            the mobject's when the animation begins if None
+    """
+
+    def __init__(
+        self,
+        mobject: Mobject,
+        color,
+        snapshot: Optional[ColorSnapshot] = None,
+        rate_func=there_and_back,
+        **kwargs,
+    ) -> None:
+        self.color = color
+        self.snapshot = snapshot
+        super().__init__(mobject, rate_func=rate_func, **kwargs)
+
+    def create_starting_mobject(self) -> Mobject:
+        # the colors are blended from the snapshot, not from a copy
+        return Mobject()
+
+    def begin(self) -> None:
+        if self.snapshot is None:
+            self.snapshot = ColorSnapshot(self.mobject)
+        self.start = self.snapshot.rgbas
+        self.change = self.snapshot.tinted(self.color) - self.start
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        self.snapshot.apply(self.start + self.rate_func(alpha) * self.change)
+
+
+def flash_colors(
+    mobjects: Mobject | Sequence[Mobject],
+    colors,
+    **kwargs,
+) -> AnimationGroup:
+    """
+    Flashes every one of `mobjects` its color, all in one animation.
+
+    parameters:
+        mobjects (Mobject | Sequence[Mobject]): The mobjects to flash
+        colors: One color for all of them, or a color per mobject
+    """
+    if isinstance(mobjects, Mobject):
+        mobjects = [mobjects]
+    if isinstance(colors, (str, ManimColor)) or not isinstance(colors, Sequence):
+        colors = [colors] * len(mobjects)
+    return AnimationGroup(
+        *[
+            FlashColor(mobject, color, **kwargs)
+            for mobject, color in zip(mobjects, colors)
+        ]
+    )
+
+
+def flash_back(flash: AnimationGroup) -> AnimationGroup:
+    """
+    The second half of a flash played as two plays, after `flash_colors`
+    played with a rate function that ends at the colors.
+    """
+    return AnimationGroup(
+        *[
+            FlashColor(
+                animation.mobject,
+                animation.color,
+                snapshot=animation.snapshot,
+                rate_func=lambda t: smooth(1 - t),
+            )
+            for animation in flash.animations
+        ]
+    )
@@ -0,0 +1,358 @@
+"""
+An error/score matrix drawn as a heatmap.
+
+A Table is a Text per cell plus its grid lines, which is fine for 5x5 but
+not for the errors of a 500 individual population on 200 cases. A Heatmap
+maps its values onto a small palette, and draws all the cells that share
+a color as the subpaths of a single VMobject, like EdgeMesh does for
+edges. So it is a few dozen mobjects however big the matrix is.
+
+Highlighting and dimming rows, columns or single cells tints them with a
+second layer of the same kind drawn over the cells.
+"""
+
+from manim import (
+    BLACK,
+    BLUE_B,
+    BLUE_E,
+    DEFAULT_MOBJECT_TO_MOBJECT_BUFFER,
+    DOWN,
+    LEFT,
+    RIGHT,
+    UL,
+    Animation,
+    ManimColor,
+    Mobject,
+    Rectangle,
+    VGroup,
+    VMobject,
+    color_gradient,
+)
+from typing import Iterable, Optional, Sequence
+
+import numpy as np
+
+from particles import particle_points
+from text_cache import cached_text
+
+# Indices into the rows, columns or cells of a heatmap, or a boolean mask over them
+Selection = int | Iterable[int] | np.ndarray
+
+
+def as_indices(selection: Optional[Selection], size: int) -> np.ndarray:
+    if selection is None:
+        return np.arange(size)
+    if isinstance(selection, (int, np.integer)):
+        selection = [selection]
+    selection = np.asarray(
+        selection if isinstance(selection, np.ndarray) else list(selection)
+    )
+    if selection.dtype == bool:
+        return np.flatnonzero(selection)
+    return selection.astype(int).reshape(-1)
+
+
+class CellBucket(VMobject):
+    """
+    The cells of a Heatmap with one color and opacity.
+
+    parameters:
+        cells (np.ndarray): The flat indices of these cells, `row * num_cols + col`
+    """
+
+    def __init__(self, cells: np.ndarray, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.cells = cells
+
+
+class Heatmap(VGroup):
+    """
+    A matrix of values drawn as a grid of colored cells, row 0 at the top.
+
+    Cells are tinted with `tint` and its shorthands, or with a `TintCells`
+    animation. Don't use `heatmap.animate` to tint it, the cells are
+    regrouped by color every time they change.
+
+    parameters:
+        values (np.ndarray): The matrix, shape (rows, columns)
+        colors (Sequence, default = (BLUE_E, BLUE_B)): The colormap, from the lowest value to the highest
+        num_colors (int, default = 32): How many colors the colormap is cut into
+        vmin (Optional[float], default = None): The value mapped to the first color, the minimum if None
+        vmax (Optional[float], default = None): The value mapped to the last color, the maximum if None
+        cell_width (float, default = 1.0): The width of a cell
+        cell_height (float, default = 0.75): The height of a cell
+        cell_buff (float, default = 0.08): The gap between cells, as a fraction of their size
+        show_values (bool, default = False): Whether to write every value in its cell.
+            That is a Text per cell, only meant for small matrices
+        value_format (str, default = "{:g}"): How values are written
+        font_size (float, default = 30): The font size of the values
+        row_labels (Optional[Sequence[Mobject]], default = None): Placed left of every row
+    """
+
+    def __init__(
+        self,
+        values: np.ndarray,
+        colors: Sequence = (BLUE_E, BLUE_B),
+        num_colors: int = 32,
+        vmin: Optional[float] = None,
+        vmax: Optional[float] = None,
+        cell_width: float = 1.0,
+        cell_height: float = 0.75,
+        cell_buff: float = 0.08,
+        show_values: bool = False,
+        value_format: str = "{:g}",
+        font_size: float = 30,
+        row_labels: Optional[Sequence[Mobject]] = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.values = np.array(values, dtype=float, ndmin=2)
+        self.num_rows, self.num_cols = self.values.shape
+        self.cell_buff = cell_buff
+
+        vmin = np.nanmin(self.values) if vmin is None else vmin
+        vmax = np.nanmax(self.values) if vmax is None else vmax
+        levels = (self.values - vmin) / (vmax - vmin if vmax > vmin else 1.0)
+        levels = np.nan_to_num(np.clip(levels, 0, 1))
+        self.palette: list[ManimColor] = list(color_gradient(colors, num_colors))
+        self.cell_color_index = np.rint(levels * (num_colors - 1)).astype(int).ravel()
+        self.cell_opacity = np.ones(self.num_cells)
+
+        # -1 for untinted cells
+        self.tint_palette: list[ManimColor] = []
+        self.tint_color_index = np.full(self.num_cells, -1, dtype=int)
+        self.tint_opacity = np.zeros(self.num_cells)
+
+        # invisible, it only keeps track of where the grid is and how big
+        self.frame = Rectangle(
+            width=self.num_cols * cell_width,
+            height=self.num_rows * cell_height,
+            stroke_opacity=0,
+            fill_opacity=0,
+        )
+        self.cell_layer = VGroup()
+        self.tint_layer = VGroup()
+        self.labels = VGroup()
+        self.add(self.frame, self.cell_layer, self.tint_layer, self.labels)
+        self.build_buckets()
+
+        centers = self.cell_centers(np.arange(self.num_cells))
+        if show_values:
+            self.value_labels = VGroup(
+                *[
+                    cached_text(
+                        value_format.format(value), font_size=font_size
+                    ).move_to(center)
+                    for value, center in zip(self.values.ravel(), centers)
+                ]
+            )
+            self.labels.add(self.value_labels)
+        if row_labels is not None:
+            self.row_labels = VGroup(*row_labels)
+            for row, label in enumerate(self.row_labels):
+                label.next_to(
+                    centers[row * self.num_cols] + cell_width / 2 * LEFT,
+                    LEFT,
+                    buff=DEFAULT_MOBJECT_TO_MOBJECT_BUFFER,
+                )
+            self.labels.add(self.row_labels)
+
+    @property
+    def num_cells(self) -> int:
+        return self.num_rows * self.num_cols
+
+    def cell_indices(
+        self,
+        rows: Optional[Selection] = None,
+        columns: Optional[Selection] = None,
+    ) -> np.ndarray:
+        """
+        The flat indices of the cells in all of `rows` and `columns`, every
+        row or column if None.
+        """
+        rows = as_indices(rows, self.num_rows)
+        columns = as_indices(columns, self.num_cols)
+        return (rows[:, None] * self.num_cols + columns[None, :]).ravel()
+
+    def cell_centers(self, cells: np.ndarray) -> np.ndarray:
+        rows, columns = np.divmod(cells, self.num_cols)
+        width = self.frame.width / self.num_cols
+        height = self.frame.height / self.num_rows
+        return (
+            self.frame.get_corner(UL)
+            + np.outer((columns + 0.5) * width, RIGHT)
+            + np.outer((rows + 0.5) * height, DOWN)
+        )
+
+    def cell_points(self, cells: np.ndarray) -> np.ndarray:
+        shrink = 1 - self.cell_buff
+        template = Rectangle(
+            width=self.frame.width / self.num_cols * shrink,
+            height=self.frame.height / self.num_rows * shrink,
+        ).points
+        return particle_points(self.cell_centers(cells), template)
+
+    def style_buckets(
+        self,
+        cells: np.ndarray,
+        palette: list[ManimColor],
+        color_index: np.ndarray,
+        opacity: np.ndarray,
+    ) -> list[CellBucket]:
+        """
+        `cells` grouped by their color and opacity, a bucket per group.
+        """
+        if not len(cells):
+            return []
+        styles = np.column_stack([color_index[cells], opacity[cells]])
+        unique_styles, inverse = np.unique(styles, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        buckets = []
+        for style, (index, bucket_opacity) in enumerate(unique_styles):
+            bucket_cells = cells[inverse == style]
+            bucket = CellBucket(
+                bucket_cells,
+                fill_color=palette[int(index)],
+                fill_opacity=bucket_opacity,
+                stroke_width=0,
+            )
+            bucket.points = self.cell_points(bucket_cells)
+            buckets.append(bucket)
+        return buckets
+
+    def tint_buckets(self, cells: np.ndarray) -> list[CellBucket]:
+        cells = cells[self.tint_color_index[cells] >= 0]
+        return self.style_buckets(
+            cells, self.tint_palette, self.tint_color_index, self.tint_opacity
+        )
+
+    def build_buckets(self, hide_tint: Optional[np.ndarray] = None) -> None:
+        """
+        Regroups the cells and their tints by color.
+
+        parameters:
+            hide_tint (Optional[np.ndarray], default = None): Cells whose tint is left out
+        """
+        cells = np.arange(self.num_cells)
+        self.cell_layer.submobjects = []
+        self.cell_layer.add(
+            *self.style_buckets(
+                cells, self.palette, self.cell_color_index, self.cell_opacity
+            )
+        )
+        if hide_tint is not None:
+            cells = np.setdiff1d(cells, hide_tint)
+        self.tint_layer.submobjects = []
+        self.tint_layer.add(*self.tint_buckets(cells))
+
+    def set_tint(self, cells: np.ndarray, color=None, opacity: float = 0.75) -> None:
+        if color is None:
+            self.tint_color_index[cells] = -1
+            self.tint_opacity[cells] = 0
+            return
+        color = ManimColor(color)
+        if color not in self.tint_palette:
+            self.tint_palette.append(color)
+        self.tint_color_index[cells] = self.tint_palette.index(color)
+        self.tint_opacity[cells] = opacity
+
+    def tint(
+        self, cells: Optional[Selection] = None, color=None, opacity: float = 0.75
+    ) -> "Heatmap":
+        """
+        Tints cells, or clears their tint.
+
+        parameters:
+            cells (Optional[Selection], default = None): Flat cell indices (see `cell_indices`), all if None
+            color (default = None): The tint, None to clear it
+            opacity (float, default = 0.75): How strongly the cells are tinted
+        """
+        self.set_tint(as_indices(cells, self.num_cells), color, opacity)
+        self.build_buckets()
+        return self
+
+    def highlight_rows(
+        self, rows: Selection, color, opacity: float = 0.75
+    ) -> "Heatmap":
+        return self.tint(self.cell_indices(rows=rows), color, opacity)
+
+    def highlight_columns(
+        self,
+        columns: Selection,
+        color,
+        opacity: float = 0.75,
+        rows: Optional[Selection] = None,
+    ) -> "Heatmap":
+        return self.tint(self.cell_indices(rows, columns), color, opacity)
+
+    def dim_rows(self, rows: Selection, opacity: float = 0.6) -> "Heatmap":
+        return self.tint(self.cell_indices(rows=rows), BLACK, opacity)
+
+    def dim_columns(self, columns: Selection, opacity: float = 0.6) -> "Heatmap":
+        return self.tint(self.cell_indices(columns=columns), BLACK, opacity)
+
+    def clear_tint(self, cells: Optional[Selection] = None) -> "Heatmap":
+        return self.tint(cells)
+
+    def animate_tint(
+        self,
+        cells: Optional[Selection] = None,
+        color=None,
+        opacity: float = 0.75,
+        **kwargs,
+    ) -> "TintCells":
+        return TintCells(self, cells, color, opacity, **kwargs)
+
+
+class TintCells(Animation):
+    """
+    Fades the tint of some cells of a heatmap from what it is to `color`,
+    or out if `color` is None. Only the cells that change are redrawn as
+    the animation goes.
+
+    parameters:
+        heatmap (Heatmap): The heatmap
+        cells (Optional[Selection], default = None): Flat cell indices (see `cell_indices`), all if None
+        color (default = None): The new tint, None to clear it
+        opacity (float, default = 0.75): How strongly the cells are tinted
+    """
+
+    def __init__(
+        self,
+        heatmap: Heatmap,
+        cells: Optional[Selection] = None,
+        color=None,
+        opacity: float = 0.75,
+        **kwargs,
+    ) -> None:
+        self.cells = as_indices(cells, heatmap.num_cells)
+        self.color = color
+        self.opacity = opacity
+        super().__init__(heatmap, **kwargs)
+
+    def create_starting_mobject(self) -> Mobject:
+        # the tints fade from opacities kept here, not from a copy
+        return Mobject()
+
+    def begin(self) -> None:
+        heatmap = self.mobject
+        self.leaving = heatmap.tint_buckets(self.cells)
+        heatmap.set_tint(self.cells, self.color, self.opacity)
+        self.entering = heatmap.tint_buckets(self.cells)
+        heatmap.build_buckets(hide_tint=self.cells)
+        self.fades = [
+            (bucket, bucket.get_fill_opacity(), leaving)
+            for buckets, leaving in ((self.leaving, True), (self.entering, False))
+            for bucket in buckets
+        ]
+        heatmap.tint_layer.add(*self.leaving, *self.entering)
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        alpha = self.rate_func(alpha)
+        for bucket, opacity, leaving in self.fades:
+            bucket.set_fill(opacity=opacity * (1 - alpha if leaving else alpha))
+
+    def finish(self) -> None:
+        super().finish()
+        self.mobject.build_buckets()
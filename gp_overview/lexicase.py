@@ -0,0 +1,182 @@
+"""
+Lexicase and epsilon-lexicase selection over a population-by-cases error
+matrix.
+
+Each selection shuffles the cases and goes through them one at a time,
+keeping only the individuals that are best (or, with epsilon-lexicase,
+within epsilon of the best) on that case among those still left, until
+one is left or the cases run out.
+
+The first case of every selection filters the whole population, every
+later one only a handful of survivors. So the survivors of the first step
+of every case are computed once, for all cases together, and reused by
+every selection that starts with that case. The case orders of a batch of
+selections are shuffled together in one call.
+"""
+
+from dataclasses import dataclass
+from typing import Iterator, Optional, Sequence
+import warnings
+
+import numpy as np
+
+
+def case_epsilons(errors: np.ndarray) -> np.ndarray:
+    """
+    The epsilon of every case: the median absolute deviation of the
+    population's errors on it (La Cava et al. 2016). Only finite errors
+    count, so an individual with an infinite error never passes a case that
+    anyone has a finite error on, and a case with none gets 0.
+    """
+    finite = np.where(np.isfinite(errors), errors, np.nan)
+    with warnings.catch_warnings():
+        # cases without a finite error are all NaN
+        warnings.simplefilter("ignore", RuntimeWarning)
+        median = np.nanmedian(finite, axis=0)
+        epsilon = np.nanmedian(np.abs(finite - median), axis=0)
+    epsilon[np.isnan(epsilon)] = 0.0
+    return epsilon
+
+
+@dataclass
+class LexicaseTrace:
+    """
+    How one selection went.
+
+    parameters:
+        cases (list[int]): The cases used, in order
+        survivors (list[np.ndarray]): The individuals left before the first case and after every case
+        winner (int): The selected individual
+    """
+
+    cases: list[int]
+    survivors: list[np.ndarray]
+    winner: int
+
+    def steps(self) -> Iterator[tuple[int, np.ndarray, np.ndarray]]:
+        """
+        Every case with the individuals left before and after it.
+        """
+        for step, case in enumerate(self.cases):
+            yield case, self.survivors[step], self.survivors[step + 1]
+
+
+class LexicaseSelector:
+    """
+    Selects from a population by lexicase selection.
+
+    parameters:
+        errors (np.ndarray): The error of every individual on every case, shape (individuals, cases)
+        epsilon (bool | np.ndarray, default = False): Epsilon per case for epsilon-lexicase,
+            True for `case_epsilons(errors)`, False for plain lexicase
+        maximize (bool, default = False): Whether higher is better, e.g. for scores
+    """
+
+    def __init__(
+        self,
+        errors: np.ndarray,
+        epsilon: bool | np.ndarray = False,
+        maximize: bool = False,
+    ) -> None:
+        errors = np.asarray(errors, dtype=float)
+        self.errors = -errors if maximize else errors
+        if epsilon is True:
+            epsilon = case_epsilons(self.errors)
+        elif epsilon is False:
+            epsilon = np.zeros(self.errors.shape[1])
+        self.epsilon = np.asarray(epsilon, dtype=float)
+
+        # the first step of every case, against the whole population. fmin
+        # skips NaN errors, which never pass a case
+        self.elite = self.errors <= np.fmin.reduce(self.errors, axis=0) + self.epsilon
+        self.first_survivors: dict[int, np.ndarray] = {}
+
+    @property
+    def num_individuals(self) -> int:
+        return self.errors.shape[0]
+
+    @property
+    def num_cases(self) -> int:
+        return self.errors.shape[1]
+
+    def survivors_of(self, case: int) -> np.ndarray:
+        survivors = self.first_survivors.get(case)
+        if survivors is None:
+            survivors = self.first_survivors[case] = np.flatnonzero(self.elite[:, case])
+        return survivors
+
+    def select_one(
+        self,
+        case_order: Sequence[int],
+        rng: np.random.Generator,
+        trace: bool = False,
+    ) -> int | LexicaseTrace:
+        """
+        One selection going through the cases in `case_order`.
+
+        returns:
+            (int | LexicaseTrace): The winner, or how it was selected if `trace`
+        """
+        survivors = np.arange(self.num_individuals)
+        cases: list[int] = []
+        pools: list[np.ndarray] = [survivors]
+        for step, case in enumerate(case_order):
+            if len(survivors) == 1:
+                break
+            if step == 0:
+                kept = self.survivors_of(case)
+            else:
+                errors = self.errors[survivors, case]
+                kept = survivors[errors <= np.fmin.reduce(errors) + self.epsilon[case]]
+            # a case nobody passes, e.g. all NaN errors, filters nobody out
+            if len(kept) > 0:
+                survivors = kept
+            if trace:
+                cases.append(int(case))
+                pools.append(survivors)
+        winner = int(survivors[0] if len(survivors) == 1 else rng.choice(survivors))
+        if trace:
+            return LexicaseTrace(cases, pools, winner)
+        return winner
+
+    def select(
+        self,
+        num_selections: int,
+        rng: np.random.Generator,
+        case_orders: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        The winners of `num_selections` selections.
+
+        parameters:
+            num_selections (int): How many to select
+            rng (np.random.Generator): Shuffles the cases and breaks ties
+            case_orders (Optional[np.ndarray], default = None): The case order of every selection,
+                shuffled if None
+        """
+        if case_orders is None:
+            case_orders = self.shuffled_case_orders(num_selections, rng)
+        return np.array(
+            [self.select_one(order, rng) for order in case_orders], dtype=int
+        )
+
+    def traces(
+        self,
+        num_selections: int,
+        rng: np.random.Generator,
+        case_orders: Optional[np.ndarray] = None,
+    ) -> list[LexicaseTrace]:
+        """
+        Like `select`, but returns how every selection went.
+        """
+        if case_orders is None:
+            case_orders = self.shuffled_case_orders(num_selections, rng)
+        return [self.select_one(order, rng, trace=True) for order in case_orders]
+
+    def shuffled_case_orders(
+        self, num_selections: int, rng: np.random.Generator
+    ) -> np.ndarray:
+        cases = np.broadcast_to(
+            np.arange(self.num_cases), (num_selections, self.num_cases)
+        )
+        return rng.permuted(cases, axis=1)
@@ -4,8 +4,33 @@ These classes should all be in order of slides appearing
 
 from manim import *
 from manim_slides.slide import Slide
-from typing import Final, Optional
-import random
+from typing import Final, Optional, Sequence
+
+import numpy as np
+
+from alternation import alternation
+from code_listing import CodeListing, ListingState
+from edge_mesh import EdgeMesh
+from flash import flash_back, flash_colors
+from heatmap import Heatmap
+from lexicase import LexicaseSelector, LexicaseTrace
+from node import Node
+from particles import Particles, PropagateParticles
+from population_grid import PopulationGrid
+from push import trace_program
+from selection import roulette, selection_probabilities, tournament
+from slide_state import carry_over, save_slide_state
+from text_cache import cached_text
+from tree_gp import (
+    PrimitiveSet,
+    evaluate_population,
+    full,
+    grow,
+    ramped_half_and_half,
+)
+from tree_layout import TreeDiagram
+from umad import decode, encode, umad_traces
+from wheel import Wheel
 
 ARBITRARY_INSTRUCTION_LIST: list[str] = [
     "int_add",
@@ -19,12 +44,12 @@ ARBITRARY_INSTRUCTION_LIST: list[str] = [
     "int_dup",
     "int_div",
     "str_yank",
-    "str_dup",
-    "str_pop",
     "int_yank",
     "int_mult",
     "int_min",
     "int_max",
+    "int_pop",
+    "exec_while",
 ]
 CIRCLE_RADIUS: Final[float] = 0.7
 CIRCLE_FONT_SIZE: Final[int] = 30
@@ -40,15 +65,18 @@ while (loop count < threshold) do
     loop count++
 """
 PSEUDOCODE_FONT_SIZE: Final[int] = 30
-PSEUDOCODE_LINE_CHARS: Final[dict[int, tuple[int, int]]] = {
-    -1: (0, 0),  # do nothing
-    0: (0, 28),  # init pop
-    1: (28, 42),  # rank pop
-    2: (42, 70),  # while loop
-    3: (70, 83),  # select parents
-    4: (83, 99),  # generate children
-    5: (99, 110),  # loop count++
-}  # error if out of indicies
+# The example GP run shown on the EC loop slides
+GP_PRIMITIVES: Final[PrimitiveSet] = PrimitiveSet(
+    variables=("x", "y"), constants=(0.0, 1.0)
+)
+GP_SEED: Final[int] = 29
+# starts on one parent, switches, switches back, stays, then switches again
+ALTERNATION_SEED: Final[int] = 27
+# adds one gene to the UMAD slide's genome and deletes another
+UMAD_SEED: Final[int] = 44
+UMAD_ADDITION_RATE: Final[float] = 0.25
+# the wheel lands on individual 2, not the fittest one
+SELECTION_SEED: Final[int] = 1
 
 
 def pseudocode_transition(
@@ -59,22 +87,24 @@ def pseudocode_transition(
     from_up_left: bool,
     move_up_left: bool,
     slide: Slide,
-    pseudocode_mobject: Optional[Text] = None,
+    pseudocode_mobject: Optional[CodeListing] = None,
     pause_after: bool = True,
     write_text: bool = False,
     add_text: bool = False,
     to_play: bool = True,
     to_play_post: bool = True,
-) -> Text:
+) -> CodeListing:
     """
-    This function transitions the color of lines in a text mobject
-    containing the `PSEUDOCODE` string.
+    This function transitions the color of lines in a code listing
+    of the `PSEUDOCODE` string.
 
     If a pseudocode_mobject is passed, the function will use that one.
-    If it is left to none, nothing will happen
+    If it is left to none, a new one is created.
 
     If -1 is passed to start_line or end_line, no color changing happens.
 
+    The listing is scaled and moved in place, without copying it.
+
     parameters:
         start_line (int): The line to be turned white (transitioned from)
         end_line (int): The line to be turned blue (transition to)
@@ -83,7 +113,7 @@ def pseudocode_transition(
         from_up_left (bool): Move code to center of screen before color transition
         move_up_left (bool): Move pseudocode to the upper left corner after color transition
         slide (Slide): The slide in which to operate in
-        pseudocode_mobject (Optional[Text], default = None): The pseudocode mobject to use if provided.
+        pseudocode_mobject (Optional[CodeListing], default = None): The pseudocode mobject to use if provided.
             If one isn't provided, will just create one.
         pause_after (bool, default = True): Whether or not to call `self.next_slide()` before calling
             the "after" animations.
@@ -94,10 +124,10 @@ def pseudocode_transition(
             play : true, apply : false
 
     returns:
-        (Text): The modified pseudocode object
+        (CodeListing): The modified pseudocode object
     """
     if pseudocode_mobject is None:
-        pseudocode_mobject = Text(PSEUDOCODE, font_size=PSEUDOCODE_FONT_SIZE)
+        pseudocode_mobject = CodeListing(PSEUDOCODE, font_size=PSEUDOCODE_FONT_SIZE)
 
     if add_text:
         slide.add(pseudocode_mobject)
@@ -105,109 +135,185 @@ def pseudocode_transition(
     if write_text:
         slide.play(Write(pseudocode_mobject))
 
-    start_chars: tuple[int, int] = PSEUDOCODE_LINE_CHARS[start_line]
-    end_chars: tuple[int, int] = PSEUDOCODE_LINE_CHARS[end_line]
-
-    pseudocode_mobject[start_chars[0] : start_chars[1]].set_color(BLUE)
+    pseudocode_mobject.highlight(start_line)
 
     # Animations to play before the color transition
-    pre_anim = pseudocode_mobject.copy()
-    pre_anim_flag: bool = False  # no easy way to check for mobject equality
-    if to_scale:
-        pre_anim.scale(2.0)
-        pre_anim_flag = True
-    if from_up_left:
-        pre_anim.center()
-        pre_anim_flag = True
-    if pre_anim_flag:
-        slide.play(Transform(pseudocode_mobject, pre_anim))
+    if to_scale or from_up_left:
+        slide.play(
+            pseudocode_mobject.animate_placement(
+                scale=2.0 if to_scale else 1.0, center=from_up_left
+            )
+        )
 
     # Transition the color now
     if to_play:
-        slide.play(
-            pseudocode_mobject[start_chars[0] : start_chars[1]].animate.set_color(
-                WHITE
-            ),
-            pseudocode_mobject[end_chars[0] : end_chars[1]].animate.set_color(BLUE),
-        )
+        color_anims = pseudocode_mobject.move_highlight(start_line, end_line)
+        if color_anims:
+            slide.play(*color_anims)
+        else:
+            # keeps the pause of a transition between no lines
+            slide.wait()
     else:
-        pseudocode_mobject[start_chars[0] : start_chars[1]].set_color(WHITE)
-        pseudocode_mobject[end_chars[0] : end_chars[1]].set_color(BLUE)
-
-    post_anim = pseudocode_mobject.copy()
-    post_anim_flag = False
-    if from_scale:
-        post_anim.scale(0.5)
-        post_anim_flag = True
-    if move_up_left:
-        post_anim.to_edge(UL)
-        post_anim_flag = True
+        pseudocode_mobject.unhighlight(start_line)
+        pseudocode_mobject.highlight(end_line)
+
     if pause_after:
         slide.next_slide()
-    if post_anim_flag:
+    if from_scale or move_up_left:
+        scale = 0.5 if from_scale else 1.0
+        edge = UL if move_up_left else None
         if to_play_post:
-            slide.play(Transform(pseudocode_mobject, post_anim))
+            slide.play(pseudocode_mobject.animate_placement(scale=scale, edge=edge))
         else:
-            pseudocode_mobject = post_anim
+            pseudocode_mobject.place(scale=scale, edge=edge)
 
     return pseudocode_mobject
 
 
+def pseudocode_state(line: int, corner: bool = False) -> ListingState:
+    """
+    The state the pseudocode is left in between slides.
+
+    parameters:
+        line (int): The highlighted line
+        corner (bool, default = False): Whether it is in the upper left corner at half size
+            instead of in the center of the screen
+    """
+    return ListingState(
+        PSEUDOCODE,
+        PSEUDOCODE_FONT_SIZE,
+        highlighted=(line,),
+        scale=0.5 if corner else 1.0,
+        edge=tuple(float(x) for x in UL) if corner else None,
+    )
+
+
+def carry_pseudocode(slide: Slide, state: ListingState) -> CodeListing:
+    """
+    Adds the pseudocode the previous slide left on screen, loaded from disk
+    if that slide has been rendered, and returns it.
+    """
+    pseudocode_mobject = carry_over("pseudocode", state.key, state.build)
+    slide.add(pseudocode_mobject)
+    return pseudocode_mobject
+
+
+def leave_pseudocode(pseudocode_mobject: CodeListing, state: ListingState) -> None:
+    """
+    Saves the pseudocode this slide ends with for the next slide.
+    """
+    save_slide_state("pseudocode", state.key, pseudocode_mobject)
+
+
+def gp_fitness_cases() -> tuple[dict[str, np.ndarray], np.ndarray]:
+    """
+    The fitness cases of the example GP run: x^2 + y on a 10x10 grid over
+    [-1, 1]^2.
+
+    returns:
+        (tuple[dict[str, np.ndarray], np.ndarray]): The inputs and the target outputs
+    """
+    x, y = np.meshgrid(np.linspace(-1, 1, 10), np.linspace(-1, 1, 10))
+    inputs = {"x": x.ravel(), "y": y.ravel()}
+    return inputs, inputs["x"] ** 2 + inputs["y"]
+
+
+def gp_sample(count: int = 4) -> tuple[list[list[str]], np.ndarray]:
+    """
+    `count` random individuals of the example run's initial population, a
+    ramped half-and-half population of 100, and their mean squared errors.
+    """
+    rng = np.random.default_rng(GP_SEED)
+    population = ramped_half_and_half(rng, GP_PRIMITIVES, 100, min_depth=1, max_depth=2)
+    errors = evaluate_population(population, GP_PRIMITIVES, *gp_fitness_cases())
+    picks = rng.choice(len(population), size=count, replace=False)
+    return [population[n] for n in picks], errors[picks]
+
+
 def create_node(
     text: str | int | float,
     radius=CIRCLE_RADIUS,
     color=BLUE,
     font_size=CIRCLE_FONT_SIZE,
-    group: Optional[VGroup] = None,
-) -> VGroup:
+) -> Node:
+    """
+    Creates a circle with text centered in it. The two are moved together
+    as one group, so no updater is needed to keep the text centered.
+    """
+    return Node(text, radius=radius, color=color, font_size=font_size)
+
+
+def layer_nodes(layer: VGroup) -> list[Mobject]:
     """
-    Creates a circle and text, adds an updater to text to the center of the
-    circle.
+    The nodes in a layer. A single node is a layer of one.
     """
-    node = Circle(radius=radius, color=color)
-    text: Text = Text(str(text), font_size=font_size)
-    text.add_updater(lambda x: x.move_to(node.get_center()))
-    return VGroup(node, text)
+    if isinstance(layer, Node):
+        return [layer]
+    return [node for node in layer if isinstance(node, (Circle, VGroup))]
 
 
-def connect_layers(layer0: VGroup, layer1: VGroup) -> VGroup:
-    temp_vgroup = VGroup()
-    for node0 in layer0:
-        for node1 in layer1:
-            if (
-                isinstance(node0, Circle)
-                or isinstance(node0, VGroup)
-                and isinstance(node1, Circle)
-                or isinstance(node1, VGroup)
-            ):
-                temp_vgroup.add(Line(node0, node1))
+def connect_layers(layer0: VGroup, layer1: VGroup) -> EdgeMesh:
+    """
+    Connects every node in `layer0` to every node in `layer1`.
 
-    return temp_vgroup
+    returns:
+        (EdgeMesh): The edges, `layer0[i] -> layer1[j]` being edge `i * len(layer1) + j`
+    """
+    return EdgeMesh.between(layer_nodes(layer0), layer_nodes(layer1))
 
 
 def flash_color(
-    mobject,
-    color,
+    mobjects: Mobject | Sequence[Mobject],
+    colors,
     scene: Slide | Scene,
     run_time: float = 0.5,
     next_slide: bool = False,
 ) -> None:
     """
-    A shorthand function to change a mobjects color.
+    A shorthand function to flash mobjects a color and back.
 
     parameters:
-        mobject: The mobject to change color
-        color: The color to switch to
+        mobjects (Mobject | Sequence[Mobject]): The mobjects to flash, all at once
+        colors: The color to switch to, or a color per mobject
         scene (Slide | Scene): The scene in which the mobjects are a part of
+        run_time (float, default = 0.5): The run_time of each half of the flash
+        next_slide (bool, default=False): Whether or not to use `self.next_slide()` between the color transitions.
+            Will only work if the scene object is a Slide
+    """
+    if not (next_slide and isinstance(scene, Slide)):
+        scene.play(flash_colors(mobjects, colors), run_time=2 * run_time)
+        return
+    flash = flash_colors(mobjects, colors, rate_func=smooth)
+    scene.play(flash, run_time=run_time)
+    scene.next_slide()
+    scene.play(flash_back(flash), run_time=run_time)
+
+
+def flash_cells(
+    heatmap: Heatmap,
+    cells,
+    color,
+    scene: Slide | Scene,
+    run_time: float = 0.5,
+    next_slide: bool = False,
+) -> None:
+    """
+    flash_color for the cells of a heatmap, which are tinted rather than
+    recolored.
+
+    parameters:
+        heatmap (Heatmap): The heatmap the cells are in
+        cells: The flat indices of the cells, see `Heatmap.cell_indices`
+        color: The color to tint them
+        scene (Slide | Scene): The scene in which the heatmap is a part of
         run_time (float, default = 0.5): The run_time the play functions use
         next_slide (bool, default=False): Whether or not to use `self.next_slide()` between the color transitions.
             Will only work if the scene object is a Slide
     """
-    mobject.save_state()
-    scene.play(mobject.animate.set_color(color), run_time=run_time)
+    scene.play(heatmap.animate_tint(cells, color), run_time=run_time)
     if next_slide and isinstance(scene, Slide):
         scene.next_slide()
-    scene.play(mobject.animate.restore(), run_time=run_time)
+    scene.play(heatmap.animate_tint(cells), run_time=run_time)
 
 
 # This class is test class. It is not intuitive to change the color
@@ -215,7 +321,9 @@ def flash_color(
 class PseudocodeTest(Slide):
     def construct(self):
         ptext = (
-            Text(PSEUDOCODE, font_size=PSEUDOCODE_FONT_SIZE).move_to(LEFT).scale(0.5)
+            CodeListing(PSEUDOCODE, font_size=PSEUDOCODE_FONT_SIZE)
+            .move_to(LEFT)
+            .scale(0.5)
         )
         self.play(Write(ptext))
         ptext = pseudocode_transition(-1, 1, True, True, True, False, self, ptext)
@@ -251,32 +359,22 @@ class NNSlide(Slide):
 
         self.next_slide()
 
-        # Create dots and their move-along-path animations in one go
-        one_two_dots_animations = [
-            MoveAlongPath(
-                Dot(color=YELLOW).move_to(line.get_start()), line, remover=True
-            )
-            for line in one_two_lines
-        ]
-        one_two_dots = [anim.mobject for anim in one_two_dots_animations]
+        # One dot per edge, all moved along their edges by one animation
+        starts, ends = one_two_lines.endpoints()
+        one_two_dots = Particles(starts, color=YELLOW)
 
         # Write the dots, play the animations, and then unwrite them
-        self.play(Write(VGroup(*one_two_dots)))
-        self.play(AnimationGroup(*one_two_dots_animations, lag_ratio=0.2))
+        self.play(Write(one_two_dots))
+        self.play(PropagateParticles(one_two_dots, starts, ends, lag_ratio=0.2))
         self.next_slide()
-        self.play(Unwrite(VGroup(*one_two_dots)))
+        self.play(Unwrite(one_two_dots))
 
         # second layer to output layer
-        two_three_dots_animations = [
-            MoveAlongPath(
-                Dot(color=YELLOW).move_to(line.get_start()), line, remover=True
-            )
-            for line in two_three_lines
-        ]
-        two_three_dots = [anim.mobject for anim in two_three_dots_animations]
-        self.play(Write(VGroup(*two_three_dots)))
-        self.play(AnimationGroup(*two_three_dots_animations), lag_ratio=0.2)
-        self.play(Unwrite(VGroup(*two_three_dots)))
+        starts, ends = two_three_lines.endpoints()
+        two_three_dots = Particles(starts, color=YELLOW)
+        self.play(Write(two_three_dots))
+        self.play(PropagateParticles(two_three_dots, starts, ends))
+        self.play(Unwrite(two_three_dots))
 
         self.play(
             Unwrite(layer_one),
@@ -292,61 +390,30 @@ class NNSlide(Slide):
 # Slide 2
 class ShowPopulation(Slide):
     def construct(self):
-        rrects = VGroup()
-        for _ in range(25):
-            rrect = RoundedRectangle(color=BLUE).scale(0.5)
-            rrects.add(rrect)
-
-        rrects.arrange_in_grid(rows=5, cols=5, buff=0.6)
-        self.play(Write(rrects))
+        population = PopulationGrid(rows=5, cols=5, color=BLUE, buff=0.6)
+        self.play(Write(population))
 
         self.next_slide()
 
-        recomb_lines: list[Line] = [
-            Line(rrects[0].get_right(), rrects[1].get_left()),
-            Line(rrects[6].get_bottom(), rrects[11].get_top()),
-            Line(rrects[18].get_right(), rrects[19].get_left()),
-        ]
-        self.play(Write(VGroup(*recomb_lines)))
-
         # now to demonstrate recombination visually
-        recomb_groups = [
-            VGroup(rrects[0], rrects[1], recomb_lines[0]),
-            VGroup(rrects[6], rrects[11], recomb_lines[1]),
-            VGroup(rrects[18], rrects[19], recomb_lines[2]),
-        ]
-
-        recomb_anims = []
-        for group in recomb_groups:
-            recomb_anims.append(
-                Transform(
-                    group,
-                    RoundedRectangle(color=PURPLE)
-                    .scale(0.5)
-                    .move_to((group[0].get_center() + group[1].get_center()) / 2),
-                )
-            )
+        recomb_pairs = np.array([[0, 1], [6, 11], [18, 19]])
+        recomb_lines = EdgeMesh(*population.pair_segments(recomb_pairs))
+        self.play(Write(recomb_lines))
 
-        self.play(AnimationGroup(*recomb_anims))
+        self.play(
+            population.animate_merge(recomb_pairs, PURPLE),
+            FadeOut(recomb_lines),
+        )
 
         self.next_slide()
 
-        # Change the color of one of the rounded rectangles
+        # Change the color of some of the individuals
         # to demonstrate mutation
-
-        self.play(
-            Transform(
-                rrects[20],
-                RoundedRectangle(color=YELLOW).scale(0.5).move_to(rrects[20]),
-            ),
-            Transform(
-                rrects[3], RoundedRectangle(color=YELLOW).scale(0.5).move_to(rrects[3])
-            ),
-        )
+        self.play(population.animate_recolor([20, 3], YELLOW))
 
         self.next_slide()
 
-        self.play(Unwrite(rrects))
+        self.play(Unwrite(population))
         self.wait()
 
 
@@ -368,20 +435,20 @@ class QuoteSlide(Slide):
         # quote from: https://en.wikisource.org/wiki/Mendel%27s_Principles_of_Heredity;_a_Defence/Chapter_2
         # Paper Title: Experiments in Plant-Hybridisation by Gregor Mendel
         # Translated from the original 1865 paper in 1901
-        text0 = Text(
+        text0 = cached_text(
             '"...it is now clear that the hybrids form seeds having',
             font_size=font_size,
             slant=ITALIC,
         )
-        text1 = Text(
+        text1 = cached_text(
             "one or other of the two differentiating characters, and of these one-half",
             font_size=font_size,
             slant=ITALIC,
         )
-        text2 = Text(
+        text2 = cached_text(
             'develop again the hybrid form..."', font_size=font_size, slant=ITALIC
         )
-        gregor_mendel = Text(
+        gregor_mendel = cached_text(
             "-Gregor Mendel", font_size=font_size + 10, weight=BOLD, color=BLUE
         )
 
@@ -399,10 +466,10 @@ class QuoteSlide(Slide):
 # Slide 4
 class TitleSlide(Slide):
     def construct(self):
-        title = Text(
+        title = cached_text(
             "An Overview of Genetic Programming: Tree-Based GP and PushGP", font_size=30
         )
-        name = Text("Rowan Torbitzky-Lane", font_size=25, color=BLUE)
+        name = cached_text("Rowan Torbitzky-Lane", font_size=25, color=BLUE)
 
         name.next_to(title, DOWN)
 
@@ -423,19 +490,19 @@ class GeneticProgrammingDescription(Slide):
         circle_radius: float = 0.7
         circle_font_size: int = 30
 
-        full_code = Text("print((1 + 2) - 4)")
+        full_code = cached_text("print((1 + 2) - 4)")
         print_circle = Circle(radius=circle_radius, color=BLUE)
-        print_text = Text("print", font_size=circle_font_size)
+        print_text = cached_text("print", font_size=circle_font_size)
         minus_circle = Circle(radius=circle_radius, color=BLUE)
-        minus_text = Text("-", font_size=circle_font_size)
+        minus_text = cached_text("-", font_size=circle_font_size)
         four_minus_circle = Circle(radius=circle_radius, color=BLUE)
-        four_minus_text = Text("4", font_size=circle_font_size)
+        four_minus_text = cached_text("4", font_size=circle_font_size)
         plus_circle = Circle(radius=circle_radius, color=BLUE)
-        plus_text = Text("+", font_size=circle_font_size)
+        plus_text = cached_text("+", font_size=circle_font_size)
         left_one_circle = Circle(radius=circle_radius, color=BLUE)
-        left_one_text = Text("1", font_size=circle_font_size)
+        left_one_text = cached_text("1", font_size=circle_font_size)
         right_two_circle = Circle(radius=circle_radius, color=BLUE)
-        right_two_text = Text("2", font_size=circle_font_size)
+        right_two_text = cached_text("2", font_size=circle_font_size)
 
         full_code.shift(LEFT * 4)
 
@@ -504,12 +571,14 @@ class GeneticProgrammingDescription(Slide):
         # Throughout the populations, the AST changes
         # The actual program itself could change too
         # This section animates those
-        mult_text = Text("*", font_size=circle_font_size).move_to(minus_text)
-        log_text = Text("log", font_size=circle_font_size).move_to(print_text)
-        big_num_text = Text("9999", font_size=circle_font_size).move_to(right_two_text)
-        full_mult_text = Text("print((1 + 2) * 4)").move_to(full_code)
-        full_log_text = Text("log((1 + 2) * 4)").move_to(full_code)
-        full_big_num_text = Text("log((1 + 9999) * 4)").move_to(full_code)
+        mult_text = cached_text("*", font_size=circle_font_size).move_to(minus_text)
+        log_text = cached_text("log", font_size=circle_font_size).move_to(print_text)
+        big_num_text = cached_text("9999", font_size=circle_font_size).move_to(
+            right_two_text
+        )
+        full_mult_text = cached_text("print((1 + 2) * 4)").move_to(full_code)
+        full_log_text = cached_text("log((1 + 2) * 4)").move_to(full_code)
+        full_big_num_text = cached_text("log((1 + 9999) * 4)").move_to(full_code)
 
         self.play(
             Transform(minus_text, mult_text),
@@ -559,9 +628,6 @@ class GeneticProgrammingDescription(Slide):
 # Slide 6
 class ECLoopTreeInit(Slide):
     def construct(self):
-        circle_radius: float = 0.7
-        circle_font_size: int = 30
-
         # EC loop pseudocode
         # see the best possible individual in minimization problems personally
         ptext = pseudocode_transition(
@@ -578,14 +644,14 @@ class ECLoopTreeInit(Slide):
         # Only going to a depth of 2 here
         # Can think about this as a depth first creation of sorts
 
-        full_text = Text("Full").to_edge(UR)
+        full_text = cached_text("Full").to_edge(UR)
 
-        def gen_time_text(time: int | str) -> Text:
-            return Text(f"t={time}", color=GREEN).next_to(full_text, LEFT)
+        def gen_time_text(time: int | str, title: Text = full_text) -> Text:
+            return cached_text(f"t={time}", color=GREEN).next_to(title, LEFT)
 
         self.play(Write(full_text))
 
-        depth_text = Text("Max Depth=2", font_size=20)
+        depth_text = cached_text("Max Depth=2", font_size=20)
         depth_text.next_to(full_text, DOWN)
         self.play(Write(depth_text))
 
@@ -595,229 +661,61 @@ class ECLoopTreeInit(Slide):
 
         self.next_slide()
 
-        # Start of t=1
-        time1_text = gen_time_text(1)
-        self.play(TransformMatchingShapes(time0_text, time1_text))
-
-        root_node = Circle(radius=circle_radius, color=BLUE).shift(UP * 3 + RIGHT)
-        root_text = Text("+", font_size=circle_font_size)
-        root_text.move_to(root_node.get_center())
-
-        self.play(Write(root_node), Write(root_text), run_time=0.5)
-
-        # end t=1
-        # start t=2
-        time2_text = gen_time_text(2)
-        self.play(TransformMatchingShapes(time1_text, time2_text))
-
-        mult_node = Circle(radius=circle_radius, color=BLUE).next_to(
-            root_node, DOWN + LEFT
-        )
-        mult_text = Text("*", font_size=circle_font_size)
-        mult_text.move_to(mult_node.get_center())
-        self.play(Write(mult_node), Write(mult_text), run_time=0.5)
-
-        root_mult_line = Line(root_node, mult_node)
-        self.play(Write(root_mult_line), run_time=0.5)
-
-        # end t=2
-        # start t=3
-        time3_text = gen_time_text(3)
-        self.play(TransformMatchingShapes(time2_text, time3_text), run_time=0.5)
-
-        x_node = Circle(radius=circle_radius, color=BLUE).next_to(
-            mult_node, DOWN + LEFT
-        )
-        x_text = Text("x", font_size=circle_font_size)
-        x_text.move_to(x_node.get_center())
-        self.play(Write(x_node), Write(x_text), run_time=0.5)
-
-        mult_x_line = Line(mult_node, x_node)
-        self.play(Write(mult_x_line), run_time=0.5)
-
-        # end t=3
-        # start t=4
-        time4_text = gen_time_text(4)
-        self.play(TransformMatchingShapes(time3_text, time4_text), run_time=0.5)
-
-        y_node = Circle(radius=circle_radius, color=BLUE).next_to(mult_node, DOWN * 2)
-        y_text = Text("y", font_size=circle_font_size)
-        y_text.move_to(y_node.get_center())
-        self.play(Write(y_node), Write(y_text), run_time=0.5)
-
-        mult_y_line = Line(mult_node, y_node)
-        self.play(Write(mult_y_line), run_time=0.5)
-
-        # end t=4
-        # start t=5
-        time5_text = gen_time_text(5)
-        self.play(TransformMatchingShapes(time4_text, time5_text))
-
-        div_node = Circle(radius=circle_radius, color=BLUE).next_to(
-            root_node, DOWN + RIGHT
-        )
-        div_text = Text("/", font_size=circle_font_size)
-        div_text.move_to(div_node.get_center())
-        self.play(Write(div_text), Write(div_node), run_time=0.5)
-
-        root_div_line = Line(root_node, div_node)
-        self.play(Write(root_div_line), run_time=0.5)
-
-        # end t=5
-        # start t=6
-        time6_text = gen_time_text(6)
-        self.play(TransformMatchingShapes(time5_text, time6_text))
-
-        one_node = Circle(radius=circle_radius, color=BLUE).next_to(div_node, DOWN * 2)
-        one_text = Text("1", font_size=circle_font_size)
-        one_text.move_to(one_node.get_center())
-        self.play(Write(one_text), Write(one_node), run_time=0.5)
-
-        div_one_line = Line(div_node, one_node)
-        self.play(Write(div_one_line), run_time=0.5)
+        def build_tree(diagram: TreeDiagram, time_text: Text, title: Text) -> Text:
+            """
+            Writes `diagram` one node per time step, in depth first order.
 
-        # end t=6
-        # start t=7
-        time7_text = gen_time_text(7)
-        self.play(TransformMatchingShapes(time6_text, time7_text))
+            returns:
+                (Text): The time text of the last step
+            """
+            steps = diagram.construction_steps()
+            for time, (node, edge) in enumerate(steps, start=1):
+                next_time_text = gen_time_text(time, title)
+                self.play(TransformMatchingShapes(time_text, next_time_text))
+                time_text = next_time_text
+                self.play(Write(node), run_time=0.5)
+                if edge is not None:
+                    self.play(Write(edge), run_time=0.5)
+            diagram.assemble(self)
+            return time_text
 
-        zero_node = Circle(radius=circle_radius, color=BLUE).next_to(
-            div_node, DOWN + RIGHT
+        # the same trees the example run would start from
+        rng = np.random.default_rng(GP_SEED)
+        full_tree = TreeDiagram(
+            full(rng, GP_PRIMITIVES, 2),
+            prefix=True,
+            arity=GP_PRIMITIVES.arity,
+            root_position=UP * 3 + RIGHT,
         )
-        zero_text = Text("0", font_size=circle_font_size)
-        zero_text.move_to(zero_node.get_center())
-        self.play(Write(zero_text), Write(zero_node), run_time=0.5)
-
-        div_zero_line = Line(div_node, zero_node)
-        self.play(Write(div_zero_line), run_time=0.5)
+        time_text = build_tree(full_tree, time0_text, full_text)
 
         self.next_slide()
 
-        # end t=7
         # fade the full tree out
-        full_group = VGroup(
-            root_node,
-            root_text,
-            mult_node,
-            mult_text,
-            div_node,
-            div_text,
-            x_node,
-            x_text,
-            y_node,
-            y_text,
-            one_node,
-            one_text,
-            zero_node,
-            zero_text,
-            root_mult_line,
-            root_div_line,
-            mult_x_line,
-            mult_y_line,
-            div_one_line,
-            div_zero_line,
-        )
-        self.play(Unwrite(full_group), TransformMatchingShapes(time7_text, time0_text))
+        self.play(Unwrite(full_tree), TransformMatchingShapes(time_text, time0_text))
 
         # Onto grow
         # Like full but random chance to be a terminal anywhere
         # in the tree.
-        grow_text = Text("Grow").to_edge(UR)
+        grow_text = cached_text("Grow").to_edge(UR)
         self.play(
             TransformMatchingShapes(full_text, grow_text),
             time0_text.animate.next_to(grow_text, LEFT),
         )
 
-        # start t=1
-        time1_text.next_to(grow_text, LEFT)
-        self.play(TransformMatchingShapes(time0_text, time1_text))
-
-        root_node = Circle(radius=circle_radius, color=BLUE).shift(UP * 3 + RIGHT)
-        root_text = Text("+", font_size=circle_font_size)
-        root_text.move_to(root_node.get_center())
-
-        self.play(Write(root_node), Write(root_text), run_time=0.5)
-
-        # end t=1
-        # start t=2
-        time2_text.next_to(grow_text, LEFT)
-        self.play(TransformMatchingShapes(time1_text, time2_text))
-
-        x_node = Circle(radius=circle_radius, color=BLUE).next_to(
-            root_node, DOWN + LEFT
+        grow_tree = TreeDiagram(
+            grow(rng, GP_PRIMITIVES, 2),
+            prefix=True,
+            arity=GP_PRIMITIVES.arity,
+            root_position=UP * 3 + RIGHT,
         )
-        x_text = Text("x", font_size=circle_font_size)
-        x_text.move_to(x_node.get_center())
-        self.play(Write(x_node), Write(x_text), run_time=0.5)
-
-        root_x_line = Line(root_node, x_node)
-        self.play(Write(root_x_line), run_time=0.5)
-
-        # end t=2
-        # start t=3
-        time3_text.next_to(grow_text, LEFT)
-        self.play(TransformMatchingShapes(time2_text, time3_text))
-
-        minus_node = Circle(radius=circle_radius, color=BLUE).next_to(
-            root_node, DOWN + RIGHT
-        )
-        minus_text = Text("-", font_size=circle_font_size)
-        minus_text.move_to(minus_node.get_center())
-        self.play(Write(minus_text), Write(minus_node), run_time=0.5)
-
-        root_minus_line = Line(root_node, minus_node)
-        self.play(Write(root_minus_line), run_time=0.5)
-
-        # end t=3
-        # start t=4 and t=5
-        time5_text.next_to(grow_text, LEFT)
-        self.play(TransformMatchingShapes(time3_text, time5_text))
-
-        one_node = Circle(radius=circle_radius, color=BLUE).next_to(
-            minus_node, DOWN * 2
-        )
-        one_text = Text("1", font_size=circle_font_size)
-        one_text.move_to(one_node.get_center())
-        minus_one_line = Line(minus_node, one_node)
-
-        zero_node = Circle(radius=circle_radius, color=BLUE).next_to(
-            minus_node, DOWN + RIGHT
-        )
-        zero_text = Text("0", font_size=circle_font_size)
-        zero_text.move_to(zero_node.get_center())
-        minus_zero_line = Line(minus_node, zero_node)
-
-        self.play(
-            Write(one_text),
-            Write(one_node),
-            Write(zero_node),
-            Write(zero_text),
-            run_time=0.5,
-        )
-        self.play(Write(minus_one_line), Write(minus_zero_line), run_time=0.5)
+        time_text = build_tree(grow_tree, time0_text, grow_text)
 
         self.next_slide()
 
-        # end t=4 and t=5
-        grow_group = VGroup(
-            root_node,
-            root_text,
-            x_node,
-            x_text,
-            minus_node,
-            minus_text,
-            one_node,
-            one_text,
-            zero_node,
-            zero_text,
-            root_x_line,
-            root_minus_line,
-            minus_one_line,
-            minus_zero_line,
-        )
         self.play(
-            Unwrite(grow_group),
-            Unwrite(time5_text),
+            Unwrite(grow_tree),
+            Unwrite(time_text),
             Unwrite(depth_text),
             Unwrite(grow_text),
         )
@@ -825,8 +723,8 @@ class ECLoopTreeInit(Slide):
         # Need to mention ramped half and half somewhere
         # First half constructed with full then rest constructed
         # with grow
-        rhandh_text = Text("Ramped Half-and-Half")
-        rhandh_description_text = Text(
+        rhandh_text = cached_text("Ramped Half-and-Half")
+        rhandh_description_text = cached_text(
             "Generate 1st half with Full and 2nd half with Grow", font_size=20
         ).next_to(rhandh_text, DOWN)
         self.play(Write(rhandh_text), Write(rhandh_description_text))
@@ -837,6 +735,7 @@ class ECLoopTreeInit(Slide):
         pseudocode_transition(
             -1, -1, False, True, True, False, self, ptext, pause_after=False
         )
+        leave_pseudocode(ptext, pseudocode_state(0))
 
 
 # Slide 7
@@ -844,43 +743,22 @@ class ECLoopTreeInit(Slide):
 class ECLoopRankPop(Slide):
     def construct(self):
         # ---------- Switch to rank population next
-        ptext = pseudocode_transition(0, 1, True, False, True, True, self)
+        ptext = carry_pseudocode(self, pseudocode_state(0))
+        ptext = pseudocode_transition(0, 1, True, False, True, True, self, ptext)
 
         # Will need to talk about fitness functions in this section.
 
+        # Four individuals of the example run, with their real errors
+        sample, errors = gp_sample()
+
         # Idea is to compress an arbitrary individual into a
         # rounded rectangle
-        temp_group = VGroup()
-
-        temp_root = Circle(radius=CIRCLE_RADIUS, color=BLUE).shift(UP * 3)
-        temp_root_text = Text("+", font_size=CIRCLE_FONT_SIZE).move_to(
-            temp_root.get_center()
-        )
-        temp_group.add(temp_root)
-        temp_group.add(temp_root_text)
-
-        temp_left = Circle(radius=CIRCLE_RADIUS, color=BLUE).next_to(
-            temp_root, DOWN + LEFT
-        )
-        temp_left_text = Text("3", font_size=CIRCLE_FONT_SIZE).move_to(
-            temp_left.get_center()
+        temp_group = TreeDiagram(
+            sample[0],
+            prefix=True,
+            arity=GP_PRIMITIVES.arity,
+            root_position=UP * 3 + RIGHT,
         )
-        temp_group.add(temp_left)
-        temp_group.add(temp_left_text)
-
-        temp_right = Circle(radius=CIRCLE_RADIUS, color=BLUE).next_to(
-            temp_root, DOWN + RIGHT
-        )
-        temp_right_text = Text("4", font_size=CIRCLE_FONT_SIZE).move_to(
-            temp_right.get_center()
-        )
-        temp_group.add(temp_right)
-        temp_group.add(temp_right_text)
-
-        temp_root_left_line = Line(temp_root, temp_left)
-        temp_root_right_line = Line(temp_root, temp_right)
-        temp_group.add(temp_root_left_line)
-        temp_group.add(temp_root_right_line)
 
         self.play(Write(temp_group))
 
@@ -891,7 +769,7 @@ class ECLoopRankPop(Slide):
         # In animation: have fitness and individual explicitly shown in animation
 
         ind_0 = RoundedRectangle(color=BLUE).scale(0.5).move_to(UP * 3)
-        ind_0_text = Text("individual 0", font_size=IND_TEXT_SIZE)
+        ind_0_text = cached_text("individual 0", font_size=IND_TEXT_SIZE)
         ind_0_text.add_updater(lambda x: x.move_to(temp_group.get_center()))
         # Display arbitrary individual as a rounded rectangle
         self.play(Transform(temp_group, ind_0), Write(ind_0_text))
@@ -899,16 +777,16 @@ class ECLoopRankPop(Slide):
         self.next_slide()
 
         ind_1 = RoundedRectangle(color=BLUE).scale(0.5).move_to(DOWN * 2 + LEFT * 1.5)
-        ind_1_text = Text("individual 1", font_size=IND_TEXT_SIZE)
+        ind_1_text = cached_text("individual 1", font_size=IND_TEXT_SIZE)
         ind_1_text.add_updater(lambda x: x.move_to(ind_1.get_center()))
         ind_2 = RoundedRectangle(color=BLUE).scale(0.5).move_to(DOWN * 2 + LEFT * -1.0)
-        ind_2_text = Text("individual 2", font_size=IND_TEXT_SIZE)
+        ind_2_text = cached_text("individual 2", font_size=IND_TEXT_SIZE)
         ind_2_text.add_updater(lambda x: x.move_to(ind_2.get_center()))
         ind_3 = RoundedRectangle(color=BLUE).scale(0.5).move_to(DOWN * 2 + LEFT * -3.5)
-        ind_3_text = Text("individual 3", font_size=IND_TEXT_SIZE)
+        ind_3_text = cached_text("individual 3", font_size=IND_TEXT_SIZE)
         ind_3_text.add_updater(lambda x: x.move_to(ind_3.get_center()))
 
-        fitness_text = Text("Fitness:", font_size=FITNESS_FONT_SIZE).move_to(
+        fitness_text = cached_text("Fitness:", font_size=FITNESS_FONT_SIZE).move_to(
             DOWN + LEFT * 6
         )
 
@@ -926,13 +804,13 @@ class ECLoopRankPop(Slide):
 
         self.next_slide()
 
-        ind_0_fitness = Text("0.0", font_size=FITNESS_FONT_SIZE)
+        ind_0_fitness = cached_text(f"{errors[0]:.2f}", font_size=FITNESS_FONT_SIZE)
         ind_0_fitness.add_updater(lambda x: x.next_to(temp_group, UP))
-        ind_1_fitness = Text("23.3", font_size=FITNESS_FONT_SIZE)
+        ind_1_fitness = cached_text(f"{errors[1]:.2f}", font_size=FITNESS_FONT_SIZE)
         ind_1_fitness.add_updater(lambda x: x.next_to(ind_1, UP))
-        ind_2_fitness = Text("9999.0", font_size=FITNESS_FONT_SIZE)
+        ind_2_fitness = cached_text(f"{errors[2]:.2f}", font_size=FITNESS_FONT_SIZE)
         ind_2_fitness.add_updater(lambda x: x.next_to(ind_2, UP))
-        ind_3_fitness = Text("10.0", font_size=FITNESS_FONT_SIZE)
+        ind_3_fitness = cached_text(f"{errors[3]:.2f}", font_size=FITNESS_FONT_SIZE)
         ind_3_fitness.add_updater(lambda x: x.next_to(ind_3, UP))
 
         self.play(
@@ -945,18 +823,17 @@ class ECLoopRankPop(Slide):
         self.next_slide()
 
         # direction of search. Minimization or maximization
-        direction_text = Text("Minimization")
+        direction_text = cached_text("Minimization")
 
         # mention negative error function question for minimization
 
-        # transition to minimzation
-        # ind_3 to ind_1
-        # ind_2 to ind_3
+        # transition to minimzation, lowest error on the left
+        individuals = [temp_group, ind_1, ind_2, ind_3]
+        slots = [DOWN * 2 + LEFT * x for x in [4.0, 1.5, -1.0, -3.5]]
+        ranking = np.argsort(errors, kind="stable")
         self.play(
             FadeIn(direction_text),
-            ind_3.animate.move_to(DOWN * 2 + LEFT * 1.5),
-            ind_1.animate.move_to(DOWN * 2 + LEFT * -1.0),
-            ind_2.animate.move_to(DOWN * 2 + LEFT * -3.5),
+            *[individuals[n].animate.move_to(slot) for n, slot in zip(ranking, slots)],
             run_time=2,
         )
 
@@ -964,11 +841,11 @@ class ECLoopRankPop(Slide):
 
         # transition to maximization
         self.play(
-            temp_group.animate.move_to(DOWN * 2 + LEFT * -3.5),
-            ind_1.animate.move_to(DOWN * 2 + LEFT * 1.5),
-            ind_2.animate.move_to(DOWN * 2 + LEFT * 4),
-            ind_3.animate.move_to(DOWN * 2 + LEFT * -1.0),
-            Transform(direction_text, Text("Maximization")),
+            *[
+                individuals[n].animate.move_to(slot)
+                for n, slot in zip(ranking[::-1], slots)
+            ],
+            Transform(direction_text, cached_text("Maximization")),
             run_time=2,
         )
 
@@ -996,6 +873,7 @@ class ECLoopRankPop(Slide):
         pseudocode_transition(
             -1, -1, False, True, True, False, self, ptext, pause_after=False
         )
+        leave_pseudocode(ptext, pseudocode_state(1))
 
 
 # Slide 8
@@ -1004,10 +882,10 @@ class ECLoopParentSelect(Slide):
         # Now that population is ranked, enter while loop.
         # Going to be a quick transition into *select parents for reproduction*
 
-        # TODO: Switch these out to pseudocode_transition function.
         # Highlights the while loop
+        ptext = carry_pseudocode(self, pseudocode_state(1))
         ptext = pseudocode_transition(
-            1, 2, False, False, False, False, self, pause_after=False, add_text=True
+            1, 2, False, False, False, False, self, ptext, pause_after=False
         )
         self.next_slide()
         # highlights the generate children line and moves pseudocode to the corner
@@ -1027,22 +905,23 @@ class ECLoopParentSelect(Slide):
             DOWN * 2 + LEFT * -3.5,
         ]
         names = [f"individiual {x}" for x in [0, 1, 2, 3]]
-        fitness_scores = [f"{x}.0" for x in [1, 2, 3, 4]]
+        fitness_scores = np.array([1.0, 2.0, 3.0, 4.0])
 
+        # nothing here moves, so the labels are placed once
         for n in range(len(positions)):
             rrect: RoundedRectangle = (
                 RoundedRectangle(color=BLUE).scale(0.5).move_to(positions[n])
             )
-            label = Text(names[n], font_size=IND_TEXT_SIZE)
-            label.add_updater(lambda m, r=rrect: m.move_to(r.get_center()))
-            fitness = Text(fitness_scores[n], font_size=FITNESS_FONT_SIZE)
-            fitness.add_updater(lambda m, r=rrect: m.next_to(r, UP))
+            label = cached_text(names[n], font_size=IND_TEXT_SIZE).move_to(rrect)
+            fitness = cached_text(
+                f"{fitness_scores[n]:.1f}", font_size=FITNESS_FONT_SIZE
+            ).next_to(rrect, UP)
 
             individuals.append(rrect)
             labels.append(label)
             fitness_labels.append(fitness)
 
-        fitness_text = Text("Fitness:", font_size=FITNESS_FONT_SIZE).move_to(
+        fitness_text = cached_text("Fitness:", font_size=FITNESS_FONT_SIZE).move_to(
             DOWN + LEFT * 6
         )
 
@@ -1051,7 +930,7 @@ class ECLoopParentSelect(Slide):
         # end selection group creation
         # May need to copy selection_group
 
-        selection_text = Text("Fitness Proportionate").to_edge(UR)
+        selection_text = cached_text("Fitness Proportionate").to_edge(UR)
 
         self.play(Write(selection_group), Write(selection_text), run_time=2)
 
@@ -1059,17 +938,17 @@ class ECLoopParentSelect(Slide):
         # proportional to their fitness. Is ran multiple times to select the
         # desired amount of parents. Repeats are allowed.
 
-        selection_percs = ["10%", "20%", "30%", "40%"]
-        sel_percs_mobjects = []
-        # TODO: add updaters for selection percentages to each invididual
-        for n in range(len(individuals)):
-            temp_text = Text(selection_percs[n], font_size=FITNESS_FONT_SIZE)
-            temp_text.add_updater(lambda x, ind=individuals[n]: x.next_to(ind, UP * 3))
-            sel_percs_mobjects.append(temp_text)
+        selection_percs = selection_probabilities(fitness_scores)
+        sel_percs_mobjects = [
+            cached_text(f"{perc:.0%}", font_size=FITNESS_FONT_SIZE).next_to(
+                individual, UP * 3
+            )
+            for perc, individual in zip(selection_percs, individuals)
+        ]
 
         # This isn't perfectly aligned horizontally
         # TODO: Fix this later. I'm going to continue for now.
-        percentage_text = Text("% Chance:", font_size=FITNESS_FONT_SIZE).next_to(
+        percentage_text = cached_text("% Chance:", font_size=FITNESS_FONT_SIZE).next_to(
             fitness_text, UP
         )
         percs_group = VGroup(*sel_percs_mobjects, percentage_text)
@@ -1078,13 +957,30 @@ class ECLoopParentSelect(Slide):
 
         self.next_slide()
 
+        # each individual gets a slice of the wheel as big as its chance
+        rng = np.random.default_rng(SELECTION_SEED)
+        spin = roulette(fitness_scores, 1, rng, trace=True)
+        wheel = Wheel(
+            fitness_scores, radius=1.2, labels=[str(n) for n in range(4)]
+        ).move_to(UP * 1.3 + RIGHT * 3)
+        self.play(FadeIn(wheel))
+        self.play(wheel.spin_trace(spin), run_time=3)
+        winner = int(spin.winners[0])
+        wheel.highlight(winner, YELLOW)
+        flash_color(individuals[winner], YELLOW, self)
+
+        self.next_slide()
+
         # Onto tournament selection
         # Tournament selection pulled from https://en.wikipedia.org/wiki/Tournament_selection
         # Also 4 random individuals from the population
         #   Tournament size being 4 here
         self.play(
             Unwrite(percs_group),
-            selection_text.animate.become(Text("Tournament").move_to(selection_text)),
+            FadeOut(wheel),
+            selection_text.animate.become(
+                cached_text("Tournament").move_to(selection_text)
+            ),
         )
 
         # self.play(Unwrite(selection_group))
@@ -1092,7 +988,9 @@ class ECLoopParentSelect(Slide):
         # basically, this just takes the best individual from a tournament and returns in.
         # The tournament is randomly selected from the population.
 
-        self.play(individuals[3].animate.set_color(YELLOW))
+        bracket = tournament(fitness_scores, 1, 4, rng, trace=True)
+        flash_color([individuals[n] for n in bracket.entrants[0]], GREEN, self)
+        self.play(individuals[int(bracket.winners[0])].animate.set_color(YELLOW))
 
         self.next_slide()
 
@@ -1101,15 +999,15 @@ class ECLoopParentSelect(Slide):
         pseudocode_transition(
             -1, -1, False, True, True, False, self, ptext, pause_after=False
         )
+        leave_pseudocode(ptext, pseudocode_state(3))
 
 
 # Slide 9
 class ECLoopGenChildren(Slide):
     def construct(self):
         # Onto generate children from selected parents
-        ptext = pseudocode_transition(
-            3, 4, True, False, False, True, self, add_text=True
-        )
+        ptext = carry_pseudocode(self, pseudocode_state(3))
+        ptext = pseudocode_transition(3, 4, True, False, False, True, self, ptext)
 
         # Going to have some sort of tree based recombination.
         # Will probably steal from the field guide
@@ -1117,17 +1015,6 @@ class ECLoopGenChildren(Slide):
         # Page 16 (30 if online)
 
         # Will probably need to have a different size tree for this :(
-        def create_node(
-            text: str, radius=CIRCLE_RADIUS, color=BLUE, font_size=CIRCLE_FONT_SIZE
-        ) -> VGroup:
-            """
-            Creates a circle and text, adds an updater to text to the center of the
-            circle
-            """
-            node = Circle(radius=radius, color=color)
-            text: Text = Text(text, font_size=font_size)
-            text.add_updater(lambda x: x.move_to(node.get_center()))
-            return VGroup(node, text)
 
         # parent 0
         p0_root = create_node("+", color=BLUE).move_to(UP + LEFT * 3)
@@ -1189,7 +1076,7 @@ class ECLoopGenChildren(Slide):
             p1_plus_one_line,
         )
 
-        recombination_text = Text("Recombination").to_edge(UR)
+        recombination_text = cached_text("Recombination").to_edge(UR)
 
         # red is to delete, blue is to combine
         self.play(
@@ -1224,7 +1111,7 @@ class ECLoopGenChildren(Slide):
 
         # Next part about mutation
 
-        mutation_text = Text("Mutation").to_edge(UR)
+        mutation_text = cached_text("Mutation").to_edge(UR)
 
         root_node = create_node("+").move_to(UP * 3)
         x_node = create_node("x").next_to(root_node, DOWN + LEFT)
@@ -1284,14 +1171,23 @@ class ECLoopGenChildren(Slide):
 # A description of the push programming language
 class PushDescription(Slide):
     def construct(self):
-        push_text = Text("Push").to_edge(UP, buff=0.1)
+        push_text = cached_text("Push").to_edge(UP, buff=0.1)
+
+        # run the slide's program, the values shown below all come from this
+        steps = trace_program(
+            ["int_add", "float_to_int", "int_div"],
+            {"int": [3, 4], "float": [0.0], "str": ["tf2"]},
+        )
+        start = steps[0].stacks
 
         lines = [Line() for _ in range(4)]
         stack_labels: list[str] = ["exec", "int", "float", "str"]
         stack_groups: VGroup = VGroup()
 
         for line, label in zip(lines, stack_labels):
-            stack_groups.add(VGroup(line, Text(label, color=BLUE).next_to(line, DOWN)))
+            stack_groups.add(
+                VGroup(line, cached_text(label, color=BLUE).next_to(line, DOWN))
+            )
 
         stack_groups.arrange(RIGHT, buff=1.5).move_to(DOWN * 3.5)
 
@@ -1299,10 +1195,16 @@ class PushDescription(Slide):
 
         self.next_slide()
 
-        int_three = Text("3").next_to(stack_groups[1], UP, buff=0.5)
-        int_four = Text("4").next_to(int_three, UP, buff=0.5)
-        float_zero = Text("0.0").next_to(stack_groups[2], UP, buff=0.5)
-        str_example = Text('"tf2"').next_to(stack_groups[3], UP, buff=0.5)
+        int_three = cached_text(str(start["int"][0])).next_to(
+            stack_groups[1], UP, buff=0.5
+        )
+        int_four = cached_text(str(start["int"][1])).next_to(int_three, UP, buff=0.5)
+        float_zero = cached_text(str(start["float"][0])).next_to(
+            stack_groups[2], UP, buff=0.5
+        )
+        str_example = cached_text(f'"{start["str"][0]}"').next_to(
+            stack_groups[3], UP, buff=0.5
+        )
 
         self.play(
             Write(int_three), Write(int_four), Write(float_zero), Write(str_example)
@@ -1311,9 +1213,9 @@ class PushDescription(Slide):
         self.next_slide()
 
         # time to introduce the exec stack
-        exec_0 = Text("int_div").next_to(stack_groups[0], UP, buff=0.5)
-        exec_1 = Text("float_to_int").next_to(exec_0, UP, buff=0.5)
-        exec_2 = Text("int_add").next_to(exec_1, UP, buff=0.5)
+        exec_0 = cached_text(start["exec"][0]).next_to(stack_groups[0], UP, buff=0.5)
+        exec_1 = cached_text(start["exec"][1]).next_to(exec_0, UP, buff=0.5)
+        exec_2 = cached_text(start["exec"][2]).next_to(exec_1, UP, buff=0.5)
 
         self.play(Write(exec_0), Write(exec_1), Write(exec_2))
 
@@ -1324,7 +1226,9 @@ class PushDescription(Slide):
         self.play(exec_2.animate.next_to(push_text, DOWN))
 
         add_group = VGroup(int_three, int_four)
-        add_text = Text("3 + 4").next_to(exec_2, DOWN * 2)
+        add_text = cached_text(" + ".join(map(str, start["int"]))).next_to(
+            exec_2, DOWN * 2
+        )
 
         # Moves 3 and 4 to near center of screen
         self.play(Transform(add_group, add_text))
@@ -1334,7 +1238,10 @@ class PushDescription(Slide):
         # Execuate the transaction
         self.play(
             Unwrite(exec_2),
-            Transform(add_group, Text("7").next_to(exec_2, DOWN * 2)),
+            Transform(
+                add_group,
+                cached_text(str(steps[1].stacks["int"][-1])).next_to(exec_2, DOWN * 2),
+            ),
         )
 
         self.play(add_group.animate.next_to(stack_groups[1], UP, buff=0.5))
@@ -1349,7 +1256,12 @@ class PushDescription(Slide):
         # float_zero on int stack after this
         self.play(
             Unwrite(exec_1),
-            Transform(float_zero, Text("0").next_to(add_group, UP, buff=0.5)),
+            Transform(
+                float_zero,
+                cached_text(str(steps[2].stacks["int"][-1])).next_to(
+                    add_group, UP, buff=0.5
+                ),
+            ),
         )
         self.wait()
 
@@ -1362,7 +1274,9 @@ class PushDescription(Slide):
         self.next_slide()
 
         # add_group is 7, float_zero is 0
-        div_text = Text("7 / 0").next_to(exec_0, DOWN * 2)
+        div_text = cached_text(" / ".join(map(str, steps[2].stacks["int"]))).next_to(
+            exec_0, DOWN * 2
+        )
         div_group = VGroup(add_group, float_zero)
         div_group_copy = div_group.copy()
 
@@ -1379,9 +1293,11 @@ class PushDescription(Slide):
         # Unlike Rust's unwinding or a C++ developer's code being part of
         # 70%, Push just noops
 
-        # exec0 becomes no-op
+        # exec0 becomes no-op, int_div left the stacks as they were
         self.play(
-            Transform(exec_0, Text("No-Op", color=GREEN).next_to(push_text, DOWN))
+            Transform(
+                exec_0, cached_text("No-Op", color=GREEN).next_to(push_text, DOWN)
+            )
         )
         self.next_slide()
         self.play(Transform(div_group, div_group_copy), Unwrite(exec_0))
@@ -1401,16 +1317,18 @@ class PushDescription(Slide):
 # a push program is represented and loaded
 class PushGenome(Slide):
     def construct(self):
+        # the genome is loaded with its last gene on top of the exec stack,
+        # and runs until exec_if has picked a branch
+        steps = trace_program(["True", "exec_if", "1", "-1"], step_limit=2)
+        genes: list[str] = steps[0].stacks["exec"]
         genome = (
-            VGroup(
-                [Text(instruction) for instruction in ["-1", "1", "exec_if", "True"]]
-            )
+            VGroup([cached_text(instruction) for instruction in genes])
             .arrange(RIGHT, buff=1.0)
             .move_to(UP * 3)
         )
         exec_line = Line()
         exec_stack = VGroup(
-            exec_line, Text("exec", color=BLUE).next_to(exec_line, DOWN)
+            exec_line, cached_text("exec", color=BLUE).next_to(exec_line, DOWN)
         ).move_to(DOWN * 3.5)
         exec_instructions = genome.copy().arrange(UP).next_to(exec_stack, UP * 0.5)
 
@@ -1431,7 +1349,9 @@ class PushGenome(Slide):
         lines = [Line() for _ in range(2)]
         labels: list[str] = ["int", "bool"]
         for line, label in zip(lines, labels):
-            stacks_group.add(VGroup(line, Text(label, color=BLUE).next_to(line, DOWN)))
+            stacks_group.add(
+                VGroup(line, cached_text(label, color=BLUE).next_to(line, DOWN))
+            )
 
         stacks_group.arrange(RIGHT, buff=3.0).move_to(DOWN * 3.5)
 
@@ -1461,11 +1381,10 @@ class PushGenome(Slide):
 
         # remove `exec_if`, `True` on bool stack, and `-1` on the exec stack
         # left with 1 on the exec stack
+        kept = genes.index(steps[-1].stacks["exec"][-1])
         self.play(
-            Unwrite(genome[2]),
-            Unwrite(genome[3]),
-            Unwrite(genome[0]),
-            genome[1].animate.next_to(exec_stack_copy, UP * 0.5),
+            *[Unwrite(gene) for i, gene in enumerate(genome) if i != kept],
+            genome[kept].animate.next_to(exec_stack_copy, UP * 0.5),
         )
         self.wait()
 
@@ -1481,9 +1400,11 @@ class PushGenome(Slide):
 class PushUMAD(Slide):
     def construct(self):
         # Bring the code back for showing the new PushGP renditions
-        pseudocode_transition(-1, 4, True, False, False, True, self, write_text=True)
+        ptext = pseudocode_transition(
+            -1, 4, True, False, False, True, self, write_text=True
+        )
 
-        umad_text = Text(
+        umad_text = cached_text(
             "Uniform Mutation by Addition and Deletion", font_size=CIRCLE_FONT_SIZE
         ).to_edge(UR)
 
@@ -1491,86 +1412,85 @@ class PushUMAD(Slide):
 
         self.next_slide()
 
-        new_umad_text = Text("UMAD", font_size=CIRCLE_FONT_SIZE).to_edge(UR)
-        umad_description = Text("Addition", font_size=DESCRIPTION_FONT_SIZE).next_to(
-            new_umad_text, DOWN
-        )
-        umad_deletion = Text("Deletion", font_size=DESCRIPTION_FONT_SIZE).next_to(
-            new_umad_text, DOWN
-        )
+        new_umad_text = cached_text("UMAD", font_size=CIRCLE_FONT_SIZE).to_edge(UR)
+        umad_description = cached_text(
+            "Addition", font_size=DESCRIPTION_FONT_SIZE
+        ).next_to(new_umad_text, DOWN)
+        umad_deletion = cached_text(
+            "Deletion", font_size=DESCRIPTION_FONT_SIZE
+        ).next_to(new_umad_text, DOWN)
 
         # turn full umad text into UMAD shortened
         self.play(Transform(umad_text, new_umad_text), Write(umad_description))
 
-        # Create a push genome
-        genome_0: VGroup = (
-            VGroup(
-                *[
-                    Text("int_pop"),
-                    Text("exec_while"),
-                    Text("int_sub"),
-                ]
-            )
-            .arrange(RIGHT, buff=0.75)
-            .shift(UP)
+        # Create a push genome and mutate it
+        parent, length = encode(
+            [["int_pop", "exec_while", "int_sub"]], ARBITRARY_INSTRUCTION_LIST
+        )
+        trace = umad_traces(
+            parent,
+            length,
+            np.random.default_rng(UMAD_SEED),
+            len(ARBITRARY_INSTRUCTION_LIST),
+            addition_rate=UMAD_ADDITION_RATE,
+        )[0]
+
+        def genome_group(genes: list[Mobject]) -> VGroup:
+            return VGroup(*genes).arrange(RIGHT, buff=0.75).shift(UP)
+
+        genome = genome_group(
+            [
+                cached_text(gene)
+                for gene in decode(trace.parent, ARBITRARY_INSTRUCTION_LIST)
+            ]
         )
-        self.play(Write(genome_0))
+        self.play(Write(genome))
 
         self.next_slide()
 
         # Will do uniform addition
-        gene_0_bottom = genome_0[0].get_bottom()
+        gene_0_bottom = genome[0].get_bottom()
         arrow = Arrow(
             start=gene_0_bottom + DOWN, end=gene_0_bottom, color=YELLOW
-        ).next_to(genome_0[0], LEFT + DOWN)
+        ).next_to(genome[0], LEFT + DOWN)
         arrow_copy = arrow.copy()
-        wall = Line(start=gene_0_bottom, end=genome_0[0].get_top(), color=YELLOW)
+        wall = Line(start=gene_0_bottom, end=genome[0].get_top(), color=YELLOW)
         wall.add_updater(lambda x: x.next_to(arrow, UP))
 
         self.play(Write(arrow), Write(wall))
 
         self.next_slide()
 
-        # random chance for addition failed
-        flash_color(wall, RED, self, next_slide=True)
+        # the gene the arrow is in front of
+        position = 0
+        for added, added_gene in zip(trace.added, trace.added_genes):
+            if position:
+                self.play(arrow.animate.next_to(genome[position], LEFT + DOWN))
 
-        self.next_slide()
-
-        # genome_0[0] flashed red, now addition
-        # genome_0[1] will be different
+                self.next_slide()
 
-        self.play(arrow.animate.next_to(genome_0[1], DOWN + LEFT))
-
-        self.next_slide()
-
-        # random chance for insertion infront has succeeded
-        flash_color(wall, GREEN, self, next_slide=True)
-
-        self.next_slide()
-
-        # random gene added, replace original genome_0 with new genome
-        random_gene = Text(random.choice(ARBITRARY_INSTRUCTION_LIST))
-        new_genome = VGroup(genome_0[0].copy())
-        new_genome.add(random_gene)
-        new_genome.add(genome_0[1].copy())
-        new_genome.add(genome_0[2].copy())
-        new_genome.arrange(RIGHT, buff=0.75).shift(UP)
-
-        self.play(
-            Transform(genome_0, new_genome),
-            arrow.animate.next_to(new_genome[2], LEFT + DOWN),
-        )
+            # random chance for insertion in front of it
+            flash_color(wall, GREEN if added else RED, self, next_slide=True)
 
-        self.next_slide()
-
-        self.play(arrow.animate.next_to(new_genome[3], LEFT + DOWN))
-
-        self.next_slide()
+            self.next_slide()
 
-        # chance for addition failed here too
-        flash_color(wall, RED, self, next_slide=True)
+            if added:
+                # random gene added, replace the genome with the new one
+                new_genome = genome_group(
+                    [
+                        *[gene.copy() for gene in genome[:position]],
+                        cached_text(ARBITRARY_INSTRUCTION_LIST[added_gene]),
+                        *[gene.copy() for gene in genome[position:]],
+                    ]
+                )
+                position += 1
+                self.play(
+                    Transform(genome, new_genome),
+                    arrow.animate.next_to(new_genome[position], LEFT + DOWN),
+                )
 
-        self.next_slide()
+                self.next_slide()
+            position += 1
 
         self.play(Unwrite(arrow), Unwrite(wall))
         self.wait()
@@ -1585,7 +1505,7 @@ class PushUMAD(Slide):
 
         self.next_slide()
 
-        arrow_copy.next_to(genome_0[0], DOWN)
+        arrow_copy.next_to(genome[0], DOWN)
 
         self.play(
             Write(arrow_copy),
@@ -1593,44 +1513,39 @@ class PushUMAD(Slide):
 
         self.next_slide()
 
-        # 1st gene of 4 is good
-        flash_color(genome_0[0], GREEN, self)
+        position = 0
+        arrow_moved = True
+        for deleted in trace.deleted:
+            if not arrow_moved:
+                self.play(arrow_copy.animate.next_to(genome[position], DOWN))
 
-        # 2nd gene of 4 is good
+                self.next_slide()
+            arrow_moved = False
 
-        self.play(
-            arrow_copy.animate.next_to(genome_0[1], DOWN),
-        )
-
-        self.next_slide()
-
-        flash_color(genome_0[1], GREEN, self)
-
-        # 3rd gene of 4 is not good
-        self.play(arrow_copy.animate.next_to(genome_0[2], DOWN))
-
-        self.next_slide()
+            if not deleted:
+                # this gene is good
+                flash_color(genome[position], GREEN, self)
+                position += 1
+                continue
 
-        flash_color(genome_0[2], RED, self)
+            # this gene is not good
+            flash_color(genome[position], RED, self)
 
-        self.next_slide()
-
-        genome_0_del = (
-            VGroup(genome_0[0].copy(), genome_0[1].copy(), genome_0[3].copy())
-            .arrange(RIGHT, buff=0.75)
-            .shift(UP)
-        )
-
-        self.play(
-            ReplacementTransform(genome_0, genome_0_del),
-            arrow_copy.animate.next_to(genome_0_del[2], DOWN),
-        )
-
-        self.next_slide()
+            self.next_slide()
 
-        # 3rd gene of now 3 is good
+            new_genome = genome_group(
+                [gene.copy() for i, gene in enumerate(genome) if i != position]
+            )
+            animations = [ReplacementTransform(genome, new_genome)]
+            if position < len(new_genome):
+                animations.append(
+                    arrow_copy.animate.next_to(new_genome[position], DOWN)
+                )
+                arrow_moved = True
+            self.play(*animations)
+            genome = new_genome
 
-        flash_color(genome_0[3], GREEN, self)
+            self.next_slide()
 
         self.next_slide()
 
@@ -1638,13 +1553,13 @@ class PushUMAD(Slide):
 
         self.play(
             Unwrite(arrow_copy),
-            Unwrite(genome_0_del),
-            Unwrite(genome_0),
+            Unwrite(genome),
             Unwrite(umad_text),
             Unwrite(umad_deletion),
         )
 
         self.wait()
+        leave_pseudocode(ptext, pseudocode_state(4, corner=True))
 
 
 # Slide 13
@@ -1652,25 +1567,35 @@ class PushUMAD(Slide):
 # May want to put this before UMAD and alternation
 class PushAlternation(Slide):
     def construct(self):
-        # transition pseudocode nicely from the previous slide
-        ptext = pseudocode_transition(
-            -1,
-            4,
-            True,
-            False,
-            False,
-            True,
-            self,
-            pause_after=False,
-            to_play=False,
-            to_play_post=False,
-        )
-        self.add(ptext)
+        # carry the pseudocode over from the previous slide
+        ptext = carry_pseudocode(self, pseudocode_state(4, corner=True))
         self.next_slide()
 
+        # I want this alternation to be random
+        alternation_rate = 0.65
+        rng = np.random.default_rng(ALTERNATION_SEED)
+        genomes = rng.integers(0, len(ARBITRARY_INSTRUCTION_LIST), (2, 4))
+        lengths = np.full(1, genomes.shape[1])
+        # the parents line up, the slide doesn't go into alignment deviation
+        path = alternation(
+            genomes[:1],
+            lengths,
+            genomes[1:],
+            lengths,
+            rng,
+            alternation_rate=alternation_rate,
+            alignment_deviation=0,
+        )
+        read_head = path.path(0)
+
         # First four are parent 0 and the last four are parent 1
         parents = (
-            VGroup(*[Text(random.choice(ARBITRARY_INSTRUCTION_LIST)) for _ in range(8)])
+            VGroup(
+                *[
+                    cached_text(ARBITRARY_INSTRUCTION_LIST[gene])
+                    for gene in genomes.ravel()
+                ]
+            )
             .arrange_in_grid(2, 4)
             .shift(UP)
         )
@@ -1685,21 +1610,18 @@ class PushAlternation(Slide):
             .set_opacity(0)
         )
 
-        alternation_text = Text("Alternation").to_edge(UR)
+        alternation_text = cached_text("Alternation").to_edge(UR)
 
         self.play(Write(parents), Write(alternation_text))
 
         self.next_slide()
 
-        # I want this alternation to be random
-        alternation_rate = 0.65
-        alt_rate_text = Text(
+        alt_rate_text = cached_text(
             f"Alternation Rate: {alternation_rate:.0%}", font_size=DESCRIPTION_FONT_SIZE
         ).to_edge(DOWN)
         self.play(Write(alt_rate_text))
         self.next_slide()
 
-        rand_dec: float = random.random()
         self.add(top_arrow, bottom_arrow)
 
         self.next_slide()
@@ -1707,17 +1629,19 @@ class PushAlternation(Slide):
         # need some way to align the children. Come back to this later TODO
         # need to track so can unwrite later
         copied_genes: list = []
-        is_top_active: bool = random.choice([True, False])
+        is_top_active: bool = path.starts[0] == 0
 
-        for p0_gene, p1_gene in zip(parents[:4], parents[4:8]):
+        for parent, position in read_head:
+            p0_gene = parents[position]
+            p1_gene = parents[genomes.shape[1] + position]
             self.play(
                 top_arrow.animate.next_to(p0_gene, UP),
                 bottom_arrow.animate.next_to(p1_gene, DOWN),
             )
 
-            # go to bottom if random decimal less than alternation rate
+            # the read head switched parents before copying this gene
             # swap sides here
-            if rand_dec < alternation_rate:
+            if is_top_active != (parent == 0):
                 if is_top_active:
                     self.play(
                         bottom_arrow.animate.set_opacity(1),
@@ -1749,8 +1673,6 @@ class PushAlternation(Slide):
 
             self.next_slide()
 
-            rand_dec = random.random()
-
         # loop over
         self.next_slide()
 
@@ -1764,13 +1686,15 @@ class PushAlternation(Slide):
         )
 
         pseudocode_transition(4, 3, False, True, True, False, self, ptext)
+        leave_pseudocode(ptext, pseudocode_state(3))
 
 
 # Slide 14
 class PushLexicase(Slide):
     def construct(self):
+        ptext = carry_pseudocode(self, pseudocode_state(3))
         ptext = pseudocode_transition(
-            3, 3, True, False, True, True, self, add_text=True, pause_after=False
+            3, 3, True, False, True, True, self, ptext, pause_after=False
         )
 
         # first: think about error functions in general
@@ -1814,7 +1738,7 @@ class PushLexicase(Slide):
         self.next_slide()
 
         # mse of this function would be (9 + 16 + 4) / 3 = 9.666666666
-        error_tex = Text("Error: 9.6666").to_edge(UR)
+        error_tex = cached_text("Error: 9.6666").to_edge(UR)
 
         self.play(Write(error_tex))
 
@@ -1825,14 +1749,14 @@ class PushLexicase(Slide):
 
         self.next_slide()
 
-        vector_error_text = Text("Error: [3, 4, 2]").to_edge(UR)
+        vector_error_text = cached_text("Error: [3, 4, 2]").to_edge(UR)
 
         # reveal individual error right here. BIG REVEAL pog
         self.play(Transform(error_tex, vector_error_text))
 
         self.next_slide()
 
-        error_alone_text = Text("3   4   2").scale(2.0)
+        error_alone_text = cached_text("3   4   2").scale(2.0)
         # Make error_tex bigger to illustrate how cool this is
         self.play(
             Unwrite(axes),
@@ -1870,61 +1794,63 @@ class PushLexicase(Slide):
             [1, 1, 1, 1, 1],
             [15, 1, 0, 0, 0],
         ]
-        scores_str: list[list[str]] = [
-            [str(element) for element in row] for row in scores
-        ]
-        ind_labels = [Text(f"ind{n}") for n in range(5)]
+        ind_labels = [cached_text(f"ind{n}") for n in range(5)]
 
-        lexicase_table = Table(scores_str, ind_labels, include_outer_lines=True)
-        # save to show off specialist retention later
-        lexicase_table.save_state()
-        lexicase_label = Text("Lexicase Selection", font_size=CIRCLE_FONT_SIZE).next_to(
-            lexicase_table, UP
+        lexicase_table = Heatmap(
+            np.array(scores), show_values=True, row_labels=ind_labels
         )
+        lexicase_label = cached_text(
+            "Lexicase Selection", font_size=CIRCLE_FONT_SIZE
+        ).next_to(lexicase_table, UP)
 
         self.play(Write(lexicase_table), Write(lexicase_label))
 
-        self.next_slide()
-
-        # select col 2 for case #1
-        # self.play(lexicase_table.get_columns()[2].animate.set_color(YELLOW))
-        flash_color(lexicase_table.get_columns()[2], YELLOW, self, next_slide=True)
-
-        # disregard other cases that aren't good enough
-        self.play(lexicase_table.get_rows()[3:5].animate.set_color(RED))
-
-        self.next_slide()
-
-        # select col 3 for case #2
-        flash_color(lexicase_table.get_columns()[3][:3], YELLOW, self, next_slide=True)
-
-        self.play(lexicase_table.get_rows()[1].animate.set_color(RED))
-
-        self.next_slide()
+        # the cases in the order they are walked through, the rest only
+        # matter if a selection got that far
+        selector = LexicaseSelector(np.array(scores), maximize=True)
+        traces = selector.traces(
+            2,
+            np.random.default_rng(GP_SEED),
+            case_orders=np.array([[1, 2, 4, 0, 3], [0, 1, 2, 3, 4]]),
+        )
+
+        def play_trace(trace: LexicaseTrace) -> None:
+            for case, before, after in trace.steps():
+                self.next_slide()
+
+                # select the case's column for whoever is left
+                flash_cells(
+                    lexicase_table,
+                    lexicase_table.cell_indices(before, case),
+                    YELLOW,
+                    self,
+                    next_slide=True,
+                )
 
-        # select col 5 for case #4
-        fifth_column = lexicase_table.get_columns()[5]
-        flash_color(
-            VGroup(fifth_column[0], fifth_column[2]), YELLOW, self, next_slide=True
-        )
+                # disregard those that aren't good enough on it
+                eliminated = np.setdiff1d(before, after)
+                if len(eliminated):
+                    self.play(
+                        lexicase_table.animate_tint(
+                            lexicase_table.cell_indices(rows=eliminated), RED
+                        )
+                    )
 
-        self.play(lexicase_table.get_rows()[2].animate.set_color(RED))
+            # declare the winner
+            self.play(
+                lexicase_table.animate_tint(
+                    lexicase_table.cell_indices(rows=trace.winner), GREEN
+                )
+            )
 
-        # declare ind 0 the winner
-        self.play(lexicase_table.get_rows()[0].animate.set_color(GREEN))
+        play_trace(traces[0])
 
         self.next_slide()
 
         # Show off specialist retention here
-        self.play(lexicase_table.animate.restore())
-
-        self.next_slide()
-
-        # select col 1 for case #0
-        flash_color(lexicase_table.get_columns()[1], YELLOW, self, next_slide=True)
+        self.play(lexicase_table.animate_tint())
 
-        self.play(lexicase_table.get_rows()[0:4].animate.set_color(RED))
-        self.play(lexicase_table.get_rows()[4].animate.set_color(GREEN))
+        play_trace(traces[1])
 
         # Done with lexicase selection
         self.next_slide()
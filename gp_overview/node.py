@@ -0,0 +1,39 @@
+"""
+A tree/network node: a circle with a label in its center.
+"""
+
+from manim import BLUE, Circle, VGroup
+
+from text_cache import cached_text
+
+
+class Node(VGroup):
+    """
+    A circle with its label centered in it.
+
+    The label is positioned once, and stays centered because the circle and
+    label are always moved, scaled and animated together as one group. There
+    is no updater, so nodes that aren't animated cost nothing per frame and
+    can be drawn into the static background. Move `node`, not `node.circle`.
+
+    parameters:
+        label (str | int | float): The text in the node
+        radius (float, default = 0.7): The radius of the circle
+        color (default = BLUE): The color of the circle
+        font_size (float, default = 30): The font size of the label
+    """
+
+    def __init__(
+        self,
+        label: str | int | float,
+        radius: float = 0.7,
+        color=BLUE,
+        font_size: float = 30,
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.circle = Circle(radius=radius, color=color)
+        self.label = cached_text(str(label), font_size=font_size).move_to(
+            self.circle.get_center()
+        )
+        self.add(self.circle, self.label)
@@ -0,0 +1,133 @@
+"""
+Many dots as one mobject, moved along straight segments by one animation.
+
+A Dot and a MoveAlongPath per signal means two Python objects to begin,
+interpolate and finish for every edge of the network. Here every particle
+is a copy of the same circle, placed at a row of a position array, and
+moving them is a few array operations per frame however many there are.
+"""
+
+from manim import (
+    DEFAULT_DOT_RADIUS,
+    WHITE,
+    Animation,
+    Circle,
+    Mobject,
+    VMobject,
+    linear,
+    smooth,
+)
+from typing import Callable, Optional
+
+import numpy as np
+
+RATE_FUNC_SAMPLES: int = 1024
+
+
+def particle_points(positions: np.ndarray, template: np.ndarray) -> np.ndarray:
+    """
+    The points of `template` moved to every one of `positions`.
+    """
+    return (positions[:, None, :] + template[None, :, :]).reshape(-1, 3)
+
+
+class Particles(VMobject):
+    """
+    Filled dots at `positions`, drawn as the subpaths of a single VMobject.
+
+    parameters:
+        positions (np.ndarray): The center of every particle, shape (n, 3)
+        radius (float, default = DEFAULT_DOT_RADIUS): The radius of every particle
+        color (default = WHITE): The color of every particle
+    """
+
+    def __init__(
+        self,
+        positions: np.ndarray,
+        radius: float = DEFAULT_DOT_RADIUS,
+        color=WHITE,
+        **kwargs,
+    ) -> None:
+        super().__init__(fill_color=color, fill_opacity=1.0, stroke_width=0, **kwargs)
+        self.template = Circle(radius=radius).points.copy()
+        self.set_positions(positions)
+
+    @property
+    def num_particles(self) -> int:
+        return len(self.points) // len(self.template)
+
+    def get_positions(self) -> np.ndarray:
+        blocks = self.points.reshape(-1, len(self.template), 3)
+        return blocks[:, 0] - self.template[0]
+
+    def set_positions(self, positions: np.ndarray) -> "Particles":
+        positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+        self.points = particle_points(positions, self.template)
+        return self
+
+    def pointwise_become_partial(
+        self, vmobject: VMobject, a: float, b: float
+    ) -> "Particles":
+        # draws every particle partially at once, rather than one after another
+        template = VMobject()
+        template.points = self.template
+        partial = VMobject()
+        partial.pointwise_become_partial(template, a, b)
+        if isinstance(vmobject, Particles):
+            positions = vmobject.get_positions()
+        else:
+            positions = self.get_positions()
+        self.points = particle_points(positions, partial.points)
+        return self
+
+
+class PropagateParticles(Animation):
+    """
+    Moves particle i from `starts[i]` to `ends[i]`. Each particle moves for
+    one unit of time, particle i starting `lags[i]` units after the first,
+    like an AnimationGroup of MoveAlongPath animations.
+
+    parameters:
+        particles (Particles): The particles to move
+        starts (np.ndarray): Where every particle starts, shape (n, 3)
+        ends (np.ndarray): Where every particle ends, shape (n, 3)
+        lag_ratio (float, default = 0.0): The lag between one particle and the next
+        lags (Optional[np.ndarray], default = None): The start of every particle, overrides lag_ratio
+        particle_rate_func (Callable[[float], float], default = smooth): The rate function of every particle
+    """
+
+    def __init__(
+        self,
+        particles: Particles,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        lag_ratio: float = 0.0,
+        lags: Optional[np.ndarray] = None,
+        particle_rate_func: Callable[[float], float] = smooth,
+        **kwargs,
+    ) -> None:
+        self.starts = np.asarray(starts, dtype=float).reshape(-1, 3)
+        self.ends = np.asarray(ends, dtype=float).reshape(-1, 3)
+        if lags is None:
+            lags = np.arange(len(self.starts)) * lag_ratio
+        self.lags = np.asarray(lags, dtype=float)
+        self.duration = self.lags.max(initial=0.0) + 1
+
+        # rate functions take one float, so they are sampled once up front
+        self.rate_x = np.linspace(0, 1, RATE_FUNC_SAMPLES + 1)
+        self.rate_y = np.array([particle_rate_func(x) for x in self.rate_x])
+
+        kwargs.setdefault("run_time", self.duration)
+        kwargs.setdefault("rate_func", linear)
+        super().__init__(particles, **kwargs)
+
+    def create_starting_mobject(self) -> Mobject:
+        # positions are computed from starts and ends, not from a copy
+        return Mobject()
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        t = np.clip(self.rate_func(alpha) * self.duration - self.lags, 0, 1)
+        eased = np.interp(t, self.rate_x, self.rate_y)
+        self.mobject.set_positions(
+            self.starts + eased[:, None] * (self.ends - self.starts)
+        )
@@ -0,0 +1,369 @@
+"""
+A population of individuals drawn as a grid of outlines.
+
+A RoundedRectangle per individual, and a Transform per individual to
+recolor or move it, is fine for 25 individuals but not for a 100x100
+population. A PopulationGrid keeps the position, color and opacity of
+every individual in arrays, draws every individual from the same template
+shape, and draws all the individuals that share a color and opacity as
+the subpaths of a single VMobject, like EdgeMesh does for edges.
+
+Mutation (recoloring), recombination (merging pairs) and sorting by
+fitness are all one `ChangeIndividuals` animation, which moves and
+recolors any number of individuals with a few array operations per frame.
+"""
+
+from manim import (
+    BLUE,
+    DOWN,
+    RIGHT,
+    Animation,
+    ManimColor,
+    Mobject,
+    RoundedRectangle,
+    VGroup,
+    VMobject,
+    interpolate_color,
+)
+from typing import Optional
+
+import numpy as np
+
+from heatmap import Selection, as_indices
+from particles import particle_points
+
+
+class IndividualBucket(VMobject):
+    """
+    The individuals of a PopulationGrid with one color and opacity. Drawing
+    it partially (Write, Create) draws every individual at once, rather than
+    one after the other.
+
+    parameters:
+        individuals (np.ndarray): The indices of these individuals in the grid
+        template (np.ndarray): The points of the shape every individual is drawn as, centered on the origin
+    """
+
+    def __init__(self, individuals: np.ndarray, template: np.ndarray, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.individuals = individuals
+        self.template = template
+
+    def get_positions(self) -> np.ndarray:
+        blocks = self.points.reshape(-1, len(self.template), 3)
+        return blocks[:, 0] - self.template[0]
+
+    def pointwise_become_partial(
+        self, vmobject: VMobject, a: float, b: float
+    ) -> "IndividualBucket":
+        template = VMobject()
+        template.points = self.template
+        partial = VMobject()
+        partial.pointwise_become_partial(template, a, b)
+        if isinstance(vmobject, IndividualBucket):
+            positions = vmobject.get_positions()
+        else:
+            positions = self.get_positions()
+        self.points = particle_points(positions, partial.points)
+        return self
+
+
+class PopulationGrid(VGroup):
+    """
+    A population laid out in a grid, individual 0 at the top left and row
+    by row from there, like `arrange_in_grid`.
+
+    Change individuals with `ChangeIndividuals`, or with `animate_recolor`,
+    `animate_merge` and `animate_sort`. Don't use `grid.animate` on single
+    individuals, they are regrouped by color every time they change. The
+    grid can be moved as a whole, but not scaled.
+
+    parameters:
+        rows (int): The number of rows
+        cols (int): The number of columns
+        template (Optional[VMobject], default = None): The shape of every individual,
+            `RoundedRectangle().scale(0.5)` if None. Its stroke width is used for every individual
+        color (default = BLUE): The color of every individual
+        buff (float, default = 0.6): The gap between neighboring individuals
+    """
+
+    def __init__(
+        self,
+        rows: int,
+        cols: int,
+        template: Optional[VMobject] = None,
+        color=BLUE,
+        buff: float = 0.6,
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
+        if template is None:
+            template = RoundedRectangle().scale(0.5)
+        self.template = template.points - template.get_center()
+        self.shape_width = template.width
+        self.shape_height = template.height
+        self.stroke_width = template.get_stroke_width()
+        self.num_rows, self.num_cols = rows, cols
+
+        # every slot of the grid, row by row, centered on the origin
+        rows_, cols_ = np.divmod(np.arange(rows * cols), cols)
+        self.slots = np.outer(cols_ - (cols - 1) / 2, RIGHT) * (
+            self.shape_width + buff
+        ) + np.outer(rows_ - (rows - 1) / 2, DOWN) * (self.shape_height + buff)
+        self.positions = self.slots.copy()
+        self.palette: list[ManimColor] = [ManimColor(color)]
+        self.color_index = np.zeros(self.num_individuals, dtype=int)
+        self.opacity = np.ones(self.num_individuals)
+        # merged individuals are gone, but keep their index
+        self.alive = np.ones(self.num_individuals, dtype=bool)
+        self.build_buckets()
+
+    @property
+    def num_individuals(self) -> int:
+        return len(self.positions)
+
+    def individual_indices(self, individuals: Optional[Selection] = None) -> np.ndarray:
+        """
+        Indices of individuals, every living one if None.
+        """
+        if individuals is None:
+            return np.flatnonzero(self.alive)
+        return as_indices(individuals, self.num_individuals)
+
+    def sync_positions(self) -> None:
+        """
+        Reads the positions back from the buckets, which is where moving the
+        grid changes them.
+        """
+        shift = np.zeros(3)
+        for bucket in self.submobjects:
+            if len(bucket.points) == len(bucket.individuals) * len(self.template):
+                positions = bucket.get_positions()
+                if len(positions):
+                    shift = positions[0] - self.positions[bucket.individuals[0]]
+                self.positions[bucket.individuals] = positions
+        # the empty slots move with the individuals
+        self.slots += shift
+
+    def color_id(self, color) -> int:
+        color = ManimColor(color)
+        if color not in self.palette:
+            self.palette.append(color)
+        return self.palette.index(color)
+
+    def style_buckets(self, individuals: np.ndarray) -> list[IndividualBucket]:
+        """
+        `individuals` grouped by their color and opacity, a bucket per group.
+        """
+        if not len(individuals):
+            return []
+        styles = np.column_stack(
+            [self.color_index[individuals], self.opacity[individuals]]
+        )
+        unique_styles, inverse = np.unique(styles, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        buckets = []
+        for style, (index, opacity) in enumerate(unique_styles):
+            bucket_individuals = individuals[inverse == style]
+            bucket = IndividualBucket(
+                bucket_individuals,
+                self.template,
+                stroke_color=self.palette[int(index)],
+                stroke_width=self.stroke_width,
+                stroke_opacity=opacity,
+                fill_opacity=0,
+            )
+            bucket.points = particle_points(
+                self.positions[bucket_individuals], self.template
+            )
+            buckets.append(bucket)
+        return buckets
+
+    def build_buckets(self, hide: Optional[np.ndarray] = None) -> None:
+        """
+        Regroups the living individuals by color.
+
+        parameters:
+            hide (Optional[np.ndarray], default = None): Individuals left out
+        """
+        individuals = np.flatnonzero(self.alive)
+        if hide is not None:
+            individuals = np.setdiff1d(individuals, hide)
+        self.submobjects = []
+        self.add(*self.style_buckets(individuals))
+
+    def recolor(
+        self,
+        individuals: Selection,
+        color=None,
+        opacity: Optional[float] = None,
+    ) -> "PopulationGrid":
+        """
+        Changes the color and/or opacity of some individuals.
+        """
+        individuals = self.individual_indices(individuals)
+        self.sync_positions()
+        if color is not None:
+            self.color_index[individuals] = self.color_id(color)
+        if opacity is not None:
+            self.opacity[individuals] = opacity
+        self.build_buckets()
+        return self
+
+    def pair_segments(self, pairs: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Segments between the individuals of every pair, starting and ending
+        on the edges of their bounding boxes, like `Line(a.get_right(),
+        b.get_left())` for neighbors in a row. For an EdgeMesh.
+
+        parameters:
+            pairs (np.ndarray): Pairs of individual indices, shape (n, 2)
+        """
+        self.sync_positions()
+        pairs = np.asarray(pairs, dtype=int).reshape(-1, 2)
+        centers0 = self.positions[pairs[:, 0]]
+        centers1 = self.positions[pairs[:, 1]]
+        direction = centers1 - centers0
+        # how far along the direction the edge of the box is
+        with np.errstate(divide="ignore"):
+            reach = np.minimum(
+                self.shape_width / 2 / np.abs(direction[:, 0]),
+                self.shape_height / 2 / np.abs(direction[:, 1]),
+            )
+        reach = np.where(np.isfinite(reach), reach, 0)[:, None]
+        return centers0 + reach * direction, centers1 - reach * direction
+
+    def animate_recolor(
+        self, individuals: Selection, color, **kwargs
+    ) -> "ChangeIndividuals":
+        """
+        Recolors some individuals, e.g. the ones that mutated.
+        """
+        return ChangeIndividuals(self, individuals, color=color, **kwargs)
+
+    def animate_merge(self, pairs: np.ndarray, color, **kwargs) -> "ChangeIndividuals":
+        """
+        Moves both individuals of every pair to their midpoint and recolors
+        them, leaving one individual per pair in the first one's place,
+        e.g. the children of recombination.
+
+        parameters:
+            pairs (np.ndarray): Pairs of individual indices, shape (n, 2)
+            color: The color of the merged individuals
+        """
+        self.sync_positions()
+        pairs = np.asarray(pairs, dtype=int).reshape(-1, 2)
+        midpoints = self.positions[pairs].mean(axis=1)
+        return ChangeIndividuals(
+            self,
+            pairs.ravel(),
+            positions=np.repeat(midpoints, 2, axis=0),
+            color=color,
+            remove=pairs[:, 1],
+            **kwargs,
+        )
+
+    def animate_sort(
+        self, fitness: np.ndarray, descending: bool = True, **kwargs
+    ) -> "ChangeIndividuals":
+        """
+        Moves the living individuals into the slots of the grid in order of
+        fitness, the best at the top left.
+
+        parameters:
+            fitness (np.ndarray): The fitness of every individual, living or not
+            descending (bool, default = True): Whether higher fitness is better
+        """
+        self.sync_positions()
+        individuals = np.flatnonzero(self.alive)
+        fitness = np.asarray(fitness, dtype=float)[individuals]
+        order = np.argsort(-fitness if descending else fitness, kind="stable")
+        positions = np.empty((len(individuals), 3))
+        positions[order] = self.slots[: len(individuals)]
+        return ChangeIndividuals(self, individuals, positions=positions, **kwargs)
+
+
+class ChangeIndividuals(Animation):
+    """
+    Moves and/or recolors some individuals of a grid, and removes some when
+    it's done. Only the individuals that change are redrawn as the animation
+    goes.
+
+    parameters:
+        grid (PopulationGrid): The grid
+        individuals (Selection): The individuals to change
+        positions (Optional[np.ndarray], default = None): Where each of `individuals` ends, shape (n, 3),
+            None to leave them where they are
+        color (default = None): The color they end as, None to keep it
+        remove (Optional[Selection], default = None): Individuals gone at the end, e.g. merged into another
+    """
+
+    def __init__(
+        self,
+        grid: PopulationGrid,
+        individuals: Selection,
+        positions: Optional[np.ndarray] = None,
+        color=None,
+        remove: Optional[Selection] = None,
+        **kwargs,
+    ) -> None:
+        self.individuals = grid.individual_indices(individuals)
+        self.end_positions = positions
+        self.color = color
+        self.remove = None if remove is None else grid.individual_indices(remove)
+        super().__init__(grid, **kwargs)
+
+    def create_starting_mobject(self) -> Mobject:
+        # positions and colors are interpolated from arrays kept here
+        return Mobject()
+
+    def begin(self) -> None:
+        grid = self.mobject
+        grid.sync_positions()
+        individuals = self.individuals
+        self.starts = grid.positions[individuals].copy()
+        self.ends = (
+            self.starts
+            if self.end_positions is None
+            else np.asarray(self.end_positions, dtype=float).reshape(-1, 3)
+        )
+        start_colors = grid.color_index[individuals].copy()
+        if self.color is not None:
+            grid.color_index[individuals] = grid.color_id(self.color)
+        grid.positions[individuals] = self.ends
+        if self.remove is not None:
+            grid.alive[self.remove] = False
+
+        # the changing individuals are drawn apart from the rest, a bucket
+        # per color they go from and to
+        grid.build_buckets(hide=individuals)
+        styles = np.column_stack(
+            [start_colors, grid.color_index[individuals], grid.opacity[individuals]]
+        )
+        unique_styles, inverse = np.unique(styles, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        self.moving = []
+        for style, (start, end, opacity) in enumerate(unique_styles):
+            rows = np.flatnonzero(inverse == style)
+            bucket = IndividualBucket(
+                individuals[rows],
+                grid.template,
+                stroke_width=grid.stroke_width,
+                stroke_opacity=opacity,
+                fill_opacity=0,
+            )
+            colors = (grid.palette[int(start)], grid.palette[int(end)])
+            self.moving.append((bucket, rows, colors))
+        grid.add(*[bucket for bucket, _, _ in self.moving])
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        alpha = self.rate_func(alpha)
+        positions = self.starts + alpha * (self.ends - self.starts)
+        for bucket, rows, (start, end) in self.moving:
+            bucket.points = particle_points(positions[rows], bucket.template)
+            bucket.set_stroke(color=interpolate_color(start, end, alpha))
+
+    def finish(self) -> None:
+        super().finish()
+        self.mobject.build_buckets()
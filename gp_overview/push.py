@@ -0,0 +1,687 @@
+"""
+A Push interpreter that runs a whole batch of programs on every test case
+at once.
+
+Every program/test case pair is a lane, and every stack is one
+preallocated array with a row per lane and a stack pointer per lane. A
+step pops the top of every lane's exec stack and runs each instruction
+once, as array operations over all the lanes that popped it, so the
+Python overhead is per step and per distinct instruction, not per lane.
+
+The exec and code stacks hold item ids: instructions, literals and blocks
+(nested lists of items) are interned in an `Items` table shared by all
+lanes. Strings are interned too, the str stack holds their ids.
+
+Instructions that can't run, because a stack is too shallow, a stack is
+full or the divisor is zero, do nothing (a no-op), as in Push.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Final, Iterator, Mapping, Optional, Sequence
+
+import numpy as np
+
+STACK_TYPES: Final[dict[str, type]] = {
+    "exec": np.int32,
+    "code": np.int32,
+    "int": np.int64,
+    "float": np.float64,
+    "bool": np.bool_,
+    "str": np.int32,
+}
+
+# kinds of items on the exec and code stacks
+INSTRUCTION: Final[int] = 0
+INT: Final[int] = 1
+FLOAT: Final[int] = 2
+BOOL: Final[int] = 3
+STR: Final[int] = 4
+BLOCK: Final[int] = 5
+LITERAL_STACKS: Final[dict[int, str]] = {
+    INT: "int",
+    FLOAT: "float",
+    BOOL: "bool",
+    STR: "str",
+}
+
+InstructionFunction = Callable[["PushState", np.ndarray], None]
+INSTRUCTIONS: dict[str, InstructionFunction] = {}
+
+
+def instruction(name: str) -> Callable[[InstructionFunction], InstructionFunction]:
+    """
+    Registers a function as the instruction `name`. It is called with the
+    state and the lanes that execute it in this step, exec item already
+    popped.
+    """
+
+    def register(function: InstructionFunction) -> InstructionFunction:
+        INSTRUCTIONS[name] = function
+        return function
+
+    return register
+
+
+class Items:
+    """
+    Everything that can be on the exec and code stacks, by id, and the
+    strings on the str stack.
+    """
+
+    def __init__(self) -> None:
+        self.kind = np.zeros(64, dtype=np.int8)
+        # instruction index, int, bool, string id, or where a block's items start
+        self.value = np.zeros(64, dtype=np.int64)
+        self.float_value = np.zeros(64)
+        self.block_length = np.zeros(64, dtype=np.int32)
+        self.block_items = np.zeros(256, dtype=np.int32)
+        self.size = 0
+        self.block_items_size = 0
+        self.ids: dict[Any, int] = {}
+        self.strings: list[str] = []
+        self.string_ids: dict[str, int] = {}
+        self.instruction_names = list(INSTRUCTIONS)
+        self.instruction_functions = list(INSTRUCTIONS.values())
+        self.instruction_ids = {name: i for i, name in enumerate(INSTRUCTIONS)}
+
+    def reserve(self, items: int, block_items: int) -> None:
+        """
+        Grows the tables, doubling them, to fit that many more items.
+        """
+        while self.size + items > len(self.kind):
+            for name in ("kind", "value", "float_value", "block_length"):
+                array = getattr(self, name)
+                setattr(self, name, np.concatenate([array, np.zeros_like(array)]))
+        while self.block_items_size + block_items > len(self.block_items):
+            self.block_items = np.concatenate(
+                [self.block_items, np.zeros_like(self.block_items)]
+            )
+
+    def add(
+        self,
+        kind: int,
+        value: int = 0,
+        float_value: float = 0.0,
+        block: Sequence[int] = (),
+    ) -> int:
+        self.reserve(1, len(block))
+        item = self.size
+        self.size += 1
+        self.kind[item] = kind
+        self.value[item] = value
+        self.float_value[item] = float_value
+        if kind == BLOCK:
+            start = self.block_items_size
+            self.block_items[start : start + len(block)] = block
+            self.block_items_size += len(block)
+            self.value[item] = start
+            self.block_length[item] = len(block)
+        return item
+
+    def add_blocks(self, blocks: np.ndarray) -> np.ndarray:
+        """
+        New blocks, one per row of item ids, all at once.
+        """
+        count, length = blocks.shape
+        self.reserve(count, blocks.size)
+        items = np.arange(self.size, self.size + count)
+        self.kind[items] = BLOCK
+        self.value[items] = self.block_items_size + np.arange(count) * length
+        self.block_length[items] = length
+        start = self.block_items_size
+        self.block_items[start : start + blocks.size] = blocks.ravel()
+        self.size += count
+        self.block_items_size += blocks.size
+        return items
+
+    def string(self, value: str) -> int:
+        string = self.string_ids.get(value)
+        if string is None:
+            string = self.string_ids[value] = len(self.strings)
+            self.strings.append(value)
+        return string
+
+    def intern(self, token: Any) -> int:
+        """
+        The id of a program token: an instruction name, a literal (True,
+        False, an int, a float, or a string in double quotes) or a list of
+        tokens for a block.
+        """
+        if isinstance(token, (list, tuple)):
+            children = [self.intern(child) for child in token]
+            key = ("block", *children)
+        else:
+            key = (type(token).__name__, token)
+        item = self.ids.get(key)
+        if item is not None:
+            return item
+
+        if isinstance(token, (list, tuple)):
+            item = self.add(BLOCK, block=children)
+        elif isinstance(token, bool) or token in ("True", "False"):
+            item = self.add(BOOL, int(token in (True, "True")))
+        elif isinstance(token, (int, np.integer)):
+            item = self.add(INT, int(token))
+        elif isinstance(token, (float, np.floating)):
+            item = self.add(FLOAT, float_value=float(token))
+        elif token in self.instruction_ids:
+            item = self.add(INSTRUCTION, self.instruction_ids[token])
+        elif len(token) >= 2 and token[0] == token[-1] == '"':
+            item = self.add(STR, self.string(token[1:-1]))
+        else:
+            try:
+                item = self.add(INT, int(token))
+            except ValueError:
+                try:
+                    item = self.add(FLOAT, float_value=float(token))
+                except ValueError:
+                    raise ValueError(f"Unknown Push token: {token!r}") from None
+        self.ids[key] = item
+        return item
+
+    def describe(self, item: int) -> Any:
+        """
+        An item the way it is written in a program.
+        """
+        kind = self.kind[item]
+        value = int(self.value[item])
+        if kind == INSTRUCTION:
+            return self.instruction_names[value]
+        if kind == INT:
+            return str(value)
+        if kind == FLOAT:
+            return str(float(self.float_value[item]))
+        if kind == BOOL:
+            return str(bool(value))
+        if kind == STR:
+            return f'"{self.strings[value]}"'
+        block = self.block_items[value : value + self.block_length[item]]
+        return [self.describe(child) for child in block]
+
+
+class PushState:
+    """
+    The stacks of every lane.
+
+    parameters:
+        num_lanes (int): How many programs/test case pairs run together
+        items (Items): The item table of the exec and code stacks
+        max_stack (int, default = 100): How many items fit on a stack
+        max_exec (Optional[int], default = None): How many items fit on the exec and code stacks,
+            max_stack if None
+    """
+
+    def __init__(
+        self,
+        num_lanes: int,
+        items: Items,
+        max_stack: int = 100,
+        max_exec: Optional[int] = None,
+    ) -> None:
+        self.items = items
+        max_exec = max_stack if max_exec is None else max_exec
+        self.stacks = {
+            name: np.zeros(
+                (num_lanes, max_exec if name in ("exec", "code") else max_stack),
+                dtype=dtype,
+            )
+            for name, dtype in STACK_TYPES.items()
+        }
+        self.sizes = {name: np.zeros(num_lanes, dtype=np.int32) for name in STACK_TYPES}
+        self.steps = np.zeros(num_lanes, dtype=np.int32)
+
+    @property
+    def num_lanes(self) -> int:
+        return len(self.steps)
+
+    def depth(self, stack: str, lanes: np.ndarray) -> np.ndarray:
+        return self.sizes[stack][lanes]
+
+    def room(self, stack: str, lanes: np.ndarray, count: int = 1) -> np.ndarray:
+        return self.sizes[stack][lanes] + count <= self.stacks[stack].shape[1]
+
+    def slots(self, stack: str, lanes: np.ndarray, offset: int = 0) -> np.ndarray:
+        """
+        Flat indices into `stacks[stack]` of the slot `offset` above the top
+        of every lane, which is a lot faster than pairs of index arrays.
+        """
+        sizes = self.sizes[stack][lanes]
+        return lanes * self.stacks[stack].shape[1] + sizes + offset
+
+    def peek(self, stack: str, lanes: np.ndarray, depth: int = 0) -> np.ndarray:
+        return self.stacks[stack].ravel()[self.slots(stack, lanes, -1 - depth)]
+
+    def pop(self, stack: str, lanes: np.ndarray) -> np.ndarray:
+        values = self.peek(stack, lanes)
+        self.sizes[stack][lanes] -= 1
+        return values
+
+    def push(self, stack: str, lanes: np.ndarray, values: np.ndarray) -> None:
+        self.stacks[stack].ravel()[self.slots(stack, lanes)] = values
+        self.sizes[stack][lanes] += 1
+
+    def values(self, stack: str, lane: int) -> list:
+        """
+        One lane's stack, bottom first, the way the slides write it.
+        """
+        values = self.stacks[stack][lane, : self.sizes[stack][lane]]
+        if stack in ("exec", "code"):
+            return [self.items.describe(item) for item in values]
+        if stack == "str":
+            return [self.items.strings[string] for string in values]
+        return values.tolist()
+
+    def snapshot(self, lane: int) -> dict[str, list]:
+        return {stack: self.values(stack, lane) for stack in STACK_TYPES}
+
+    def load(
+        self,
+        lanes: np.ndarray,
+        program: Sequence[Any],
+        inputs: Optional[Mapping[str, np.ndarray]] = None,
+    ) -> None:
+        """
+        Puts a program on the exec stack of `lanes`, its first token on
+        top, and pushes the inputs of every lane.
+
+        parameters:
+            lanes (np.ndarray): The lanes that run the program
+            program (Sequence[Any]): Its tokens, see `Items.intern`
+            inputs (Optional[Mapping[str, np.ndarray]], default = None): Values pushed on every stack,
+                shape (len(lanes), n), the last column ends on top
+        """
+        program_items = [self.items.intern(token) for token in program]
+        if not self.room("exec", lanes[:1], len(program_items)).all():
+            raise ValueError(f"Program of {len(program_items)} items overflows exec")
+        sizes = self.sizes["exec"][lanes]
+        if len(lanes) and (sizes == 0).all():
+            self.stacks["exec"][lanes, : len(program_items)] = program_items[::-1]
+            self.sizes["exec"][lanes] = len(program_items)
+        else:
+            for item in reversed(program_items):
+                self.push("exec", lanes, item)
+        for stack, values in (inputs or {}).items():
+            values = np.asarray(values)
+            values = values.reshape(len(lanes), -1)
+            if stack == "str":
+                values = np.vectorize(self.items.string, otypes=[int])(values)
+            for column in values.T:
+                self.push(stack, lanes, column)
+
+    def step(self, lanes: np.ndarray) -> None:
+        """
+        Executes the top exec item of every one of `lanes`.
+        """
+        items = self.items
+        self.steps[lanes] += 1
+        popped = self.pop("exec", lanes)
+        kinds = items.kind[popped]
+
+        for kind, stack in LITERAL_STACKS.items():
+            literal = kinds == kind
+            if not literal.any():
+                continue
+            literal_lanes = lanes[literal]
+            literal_items = popped[literal]
+            room = self.room(stack, literal_lanes)
+            values = items.float_value if kind == FLOAT else items.value
+            self.push(stack, literal_lanes[room], values[literal_items[room]])
+
+        block = kinds == BLOCK
+        if block.any():
+            self.expand_blocks(lanes[block], popped[block])
+
+        instruction = kinds == INSTRUCTION
+        if instruction.any():
+            ids = items.value[popped[instruction]]
+            order = np.argsort(ids, kind="stable")
+            ids = ids[order]
+            grouped = lanes[instruction][order]
+            unique, starts = np.unique(ids, return_index=True)
+            for function, group in zip(unique, np.split(grouped, starts[1:])):
+                items.instruction_functions[function](self, group)
+
+    def expand_blocks(self, lanes: np.ndarray, blocks: np.ndarray) -> None:
+        """
+        Pushes the items of every block onto the exec stack of its lane,
+        the first on top. A lane whose exec stack can't fit them stops.
+        """
+        lengths = self.items.block_length[blocks].astype(np.int64)
+        room = self.sizes["exec"][lanes] + lengths <= self.stacks["exec"].shape[1]
+        self.sizes["exec"][lanes[~room]] = 0
+        lanes, blocks, lengths = lanes[room], blocks[room], lengths[room]
+
+        # one entry per block item: its lane, and its place in the block
+        lane_of = np.repeat(lanes, lengths)
+        first = np.cumsum(lengths) - lengths
+        offsets = np.arange(lengths.sum()) - np.repeat(first, lengths)
+        starts = np.repeat(self.items.value[blocks], lengths)
+        ends = np.repeat(lengths, lengths)
+        positions = np.repeat(self.sizes["exec"][lanes], lengths) + offsets
+        self.stacks["exec"][lane_of, positions] = self.items.block_items[
+            starts + ends - 1 - offsets
+        ]
+        self.sizes["exec"][lanes] += lengths.astype(np.int32)
+
+    def run(self, step_limit: int) -> None:
+        """
+        Steps every lane until its exec stack is empty or it took
+        `step_limit` steps.
+        """
+        running = np.flatnonzero(self.sizes["exec"] > 0)
+        while len(running):
+            self.step(running)
+            running = running[
+                (self.sizes["exec"][running] > 0) & (self.steps[running] < step_limit)
+            ]
+
+
+def binary(
+    stack: str, operation: Callable[[np.ndarray, np.ndarray], np.ndarray]
+) -> InstructionFunction:
+    """
+    An instruction that pops b and then a and pushes `operation(a, b)`.
+    """
+
+    def run(state: PushState, lanes: np.ndarray) -> None:
+        lanes = lanes[state.depth(stack, lanes) >= 2]
+        b = state.pop(stack, lanes)
+        a = state.pop(stack, lanes)
+        state.push(stack, lanes, operation(a, b))
+
+    return run
+
+
+def dup(stack: str) -> InstructionFunction:
+    def run(state: PushState, lanes: np.ndarray) -> None:
+        lanes = lanes[(state.depth(stack, lanes) >= 1) & state.room(stack, lanes)]
+        state.push(stack, lanes, state.peek(stack, lanes))
+
+    return run
+
+
+def pop(stack: str) -> InstructionFunction:
+    def run(state: PushState, lanes: np.ndarray) -> None:
+        state.pop(stack, lanes[state.depth(stack, lanes) >= 1])
+
+    return run
+
+
+def swap(stack: str) -> InstructionFunction:
+    def run(state: PushState, lanes: np.ndarray) -> None:
+        lanes = lanes[state.depth(stack, lanes) >= 2]
+        b = state.pop(stack, lanes)
+        a = state.pop(stack, lanes)
+        state.push(stack, lanes, b)
+        state.push(stack, lanes, a)
+
+    return run
+
+
+def yank(stack: str) -> InstructionFunction:
+    """
+    Pops an index off the int stack and moves the item that deep in
+    `stack` to its top, the index clamped to the stack.
+    """
+
+    def run(state: PushState, lanes: np.ndarray) -> None:
+        needed = 2 if stack == "int" else 1
+        lanes = lanes[state.depth("int", lanes) >= 1]
+        lanes = lanes[state.depth(stack, lanes) >= needed]
+        index = state.pop("int", lanes)
+        size = state.depth(stack, lanes)
+        position = size - 1 - np.clip(index, 0, size - 1)
+
+        # shift everything above the item down by one and put it on top
+        values = state.stacks[stack][lanes]
+        columns = np.arange(values.shape[1])
+        shifted = (columns >= position[:, None]) & (columns < size[:, None] - 1)
+        sources = np.where(shifted, columns + 1, columns)
+        sources[columns == size[:, None] - 1] = np.broadcast_to(
+            position[:, None], sources.shape
+        )[columns == size[:, None] - 1]
+        state.stacks[stack][lanes] = np.take_along_axis(values, sources, axis=1)
+
+    return run
+
+
+def truncating_divide(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Integer division rounding toward zero, like Push's (and Clojure's quot).
+    """
+    quotient = a // b
+    inexact = (quotient * b != a) & ((a < 0) != (b < 0))
+    return quotient + inexact
+
+
+instruction("int_add")(binary("int", np.add))
+instruction("int_sub")(binary("int", np.subtract))
+instruction("int_mult")(binary("int", np.multiply))
+instruction("int_min")(binary("int", np.minimum))
+instruction("int_max")(binary("int", np.maximum))
+instruction("int_dup")(dup("int"))
+instruction("int_pop")(pop("int"))
+instruction("int_swap")(swap("int"))
+instruction("int_yank")(yank("int"))
+instruction("str_dup")(dup("str"))
+instruction("str_pop")(pop("str"))
+instruction("str_yank")(yank("str"))
+
+
+@instruction("int_div")
+def int_div(state: PushState, lanes: np.ndarray) -> None:
+    lanes = lanes[state.depth("int", lanes) >= 2]
+    lanes = lanes[state.peek("int", lanes) != 0]
+    b = state.pop("int", lanes)
+    a = state.pop("int", lanes)
+    state.push("int", lanes, truncating_divide(a, b))
+
+
+@instruction("float_to_int")
+def float_to_int(state: PushState, lanes: np.ndarray) -> None:
+    lanes = lanes[(state.depth("float", lanes) >= 1) & state.room("int", lanes)]
+    values = np.trunc(np.nan_to_num(state.pop("float", lanes)))
+    limit = np.iinfo(np.int64)
+    state.push("int", lanes, np.clip(values, limit.min, limit.max).astype(np.int64))
+
+
+@instruction("exec_if")
+def exec_if(state: PushState, lanes: np.ndarray) -> None:
+    """
+    Keeps the first of the next two exec items if the top bool is True,
+    the second otherwise.
+    """
+    lanes = lanes[(state.depth("bool", lanes) >= 1) & (state.depth("exec", lanes) >= 2)]
+    condition = state.pop("bool", lanes)
+    first = state.pop("exec", lanes)
+    second = state.pop("exec", lanes)
+    state.push("exec", lanes, np.where(condition, first, second))
+
+
+@instruction("exec_when")
+def exec_when(state: PushState, lanes: np.ndarray) -> None:
+    """
+    Runs the next exec item only if the top bool is True.
+    """
+    lanes = lanes[(state.depth("bool", lanes) >= 1) & (state.depth("exec", lanes) >= 1)]
+    condition = state.pop("bool", lanes)
+    state.pop("exec", lanes[~condition])
+
+
+@instruction("exec_while")
+def exec_while(state: PushState, lanes: np.ndarray) -> None:
+    """
+    Runs the next exec item, then exec_while again, for as long as the top
+    bool is True.
+    """
+    lanes = lanes[state.depth("exec", lanes) >= 1]
+    has_bool = state.depth("bool", lanes) >= 1
+    state.pop("exec", lanes[~has_bool])
+    lanes = lanes[has_bool]
+    condition = state.peek("bool", lanes)
+    # a loop that can't fit on the exec stack doesn't start
+    lanes = lanes[~condition | state.room("exec", lanes, 2)]
+    condition = state.pop("bool", lanes)
+    state.pop("exec", lanes[~condition])
+    lanes = lanes[condition]
+    body = state.peek("exec", lanes)
+    state.push("exec", lanes, state.items.intern("exec_while"))
+    state.push("exec", lanes, body)
+
+
+@instruction("exec_s")
+def exec_s(state: PushState, lanes: np.ndarray) -> None:
+    """
+    The S combinator: pops A, B and C and pushes (B C), C and A.
+    """
+    lanes = lanes[state.depth("exec", lanes) >= 3]
+    a = state.pop("exec", lanes)
+    b = state.pop("exec", lanes)
+    c = state.pop("exec", lanes)
+    state.push("exec", lanes, state.items.add_blocks(np.column_stack([b, c])))
+    state.push("exec", lanes, c)
+    state.push("exec", lanes, a)
+
+
+@instruction("code_if")
+def code_if(state: PushState, lanes: np.ndarray) -> None:
+    """
+    Runs the second code item if the top bool is True, the first
+    otherwise.
+    """
+    lanes = lanes[(state.depth("bool", lanes) >= 1) & (state.depth("code", lanes) >= 2)]
+    condition = state.pop("bool", lanes)
+    first = state.pop("code", lanes)
+    second = state.pop("code", lanes)
+    state.push("exec", lanes, np.where(condition, second, first))
+
+
+@dataclass
+class PushResults:
+    """
+    The stacks every program ended with on every test case, arrays of
+    shape (programs, cases).
+
+    parameters:
+        tops (dict[str, np.ndarray]): The top of every stack, 0 where it is empty
+        sizes (dict[str, np.ndarray]): How many items are on every stack
+        steps (np.ndarray): How many steps every run took
+    """
+
+    tops: dict[str, np.ndarray] = field(default_factory=dict)
+    sizes: dict[str, np.ndarray] = field(default_factory=dict)
+    steps: np.ndarray = field(default_factory=lambda: np.zeros((0, 0), dtype=int))
+
+
+def lane_chunks(num_programs: int, num_cases: int, max_lanes: int) -> Iterator[range]:
+    programs_per_chunk = max(1, max_lanes // max(num_cases, 1))
+    for start in range(0, num_programs, programs_per_chunk):
+        yield range(start, min(start + programs_per_chunk, num_programs))
+
+
+def run_programs(
+    programs: Sequence[Sequence[Any]],
+    num_cases: int,
+    inputs: Optional[Mapping[str, np.ndarray]] = None,
+    step_limit: int = 1000,
+    max_stack: int = 100,
+    max_lanes: int = 65536,
+) -> PushResults:
+    """
+    Runs every program on every test case.
+
+    parameters:
+        programs (Sequence[Sequence[Any]]): The programs, see `Items.intern` for their tokens
+        num_cases (int): How many test cases there are
+        inputs (Optional[Mapping[str, np.ndarray]], default = None): What every test case starts with
+            on every stack, shape (num_cases, n), the last column ends on top
+        step_limit (int, default = 1000): How many steps a run can take
+        max_stack (int, default = 100): How many items fit on a stack, the exec stack also fits
+            the longest program
+        max_lanes (int, default = 65536): How many runs go at once, to bound memory
+
+    returns:
+        (PushResults): What every program left on its stacks on every test case
+    """
+    items = Items()
+    max_exec = max([max_stack, *(len(program) for program in programs)])
+    results = PushResults(
+        tops={
+            stack: np.zeros((len(programs), num_cases), dtype=dtype)
+            for stack, dtype in STACK_TYPES.items()
+        },
+        sizes={
+            stack: np.zeros((len(programs), num_cases), dtype=int)
+            for stack in STACK_TYPES
+        },
+        steps=np.zeros((len(programs), num_cases), dtype=int),
+    )
+    for chunk in lane_chunks(len(programs), num_cases, max_lanes):
+        state = PushState(len(chunk) * num_cases, items, max_stack, max_exec)
+        for lane, program in enumerate(chunk):
+            lanes = np.arange(lane * num_cases, (lane + 1) * num_cases)
+            state.load(lanes, programs[program], inputs)
+        state.run(step_limit)
+
+        rows = slice(chunk.start, chunk.stop)
+        for stack, sizes in state.sizes.items():
+            lanes = np.flatnonzero(sizes > 0)
+            tops = np.zeros(state.num_lanes, dtype=STACK_TYPES[stack])
+            tops[lanes] = state.peek(stack, lanes)
+            results.tops[stack][rows] = tops.reshape(len(chunk), num_cases)
+            results.sizes[stack][rows] = sizes.reshape(len(chunk), num_cases)
+        results.steps[rows] = state.steps.reshape(len(chunk), num_cases)
+    return results
+
+
+@dataclass
+class PushStep:
+    """
+    One step of a traced run.
+
+    parameters:
+        item (Any): The exec item it executed, None for the state before the first step
+        stacks (dict[str, list]): Every stack after it, bottom first
+        noop (bool): Whether it changed nothing but popping its item
+    """
+
+    item: Any
+    stacks: dict[str, list]
+    noop: bool = False
+
+
+def trace_program(
+    program: Sequence[Any],
+    inputs: Optional[Mapping[str, Sequence]] = None,
+    step_limit: int = 1000,
+    max_stack: int = 100,
+) -> list[PushStep]:
+    """
+    Runs one program on one test case and records every step, for the
+    slides to animate.
+
+    parameters:
+        program (Sequence[Any]): The program's tokens, see `Items.intern`
+        inputs (Optional[Mapping[str, Sequence]], default = None): What every stack starts with,
+            the last value on top
+        step_limit (int, default = 1000): How many steps the run can take
+        max_stack (int, default = 100): How many items fit on a stack
+
+    returns:
+        (list[PushStep]): The state before the first step and after every step
+    """
+    state = PushState(1, Items(), max_stack, max(max_stack, len(program)))
+    lane = np.zeros(1, dtype=int)
+    state.load(
+        lane,
+        program,
+        {stack: np.array(values)[None, :] for stack, values in (inputs or {}).items()},
+    )
+    steps = [PushStep(None, state.snapshot(0))]
+    while state.sizes["exec"][0] > 0 and state.steps[0] < step_limit:
+        before = state.snapshot(0)
+        item = before["exec"].pop()
+        state.step(lane)
+        stacks = state.snapshot(0)
+        steps.append(PushStep(item, stacks, noop=stacks == before))
+    return steps
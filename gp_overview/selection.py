@@ -0,0 +1,200 @@
+"""
+Fitness proportionate (roulette wheel), stochastic universal sampling and
+tournament selection over a population's fitness array, higher is better.
+
+Every selection of a batch is drawn at once. The roulette wheel is the
+cumulative sum of the fitnesses, and spinning it is a uniform draw looked
+up in that sum with `searchsorted`, so a million spins of a million
+individuals are a binary search each. Tournaments are an array of
+entrants, a row per tournament, and their winners an argmax along rows.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+def selection_probabilities(fitness: np.ndarray) -> np.ndarray:
+    """
+    The chance of every individual being picked by one spin of the wheel.
+    """
+    fitness = wheel_fitness(fitness)
+    return fitness / fitness.sum()
+
+
+def wheel_fitness(fitness: np.ndarray) -> np.ndarray:
+    fitness = np.asarray(fitness, dtype=float)
+    if (fitness < 0).any():
+        raise ValueError("fitness proportionate selection needs fitness >= 0")
+    if not fitness.sum() > 0:
+        raise ValueError("fitness proportionate selection needs a fitness > 0")
+    return fitness
+
+
+@dataclass
+class WheelTrace:
+    """
+    Where the wheel stopped for every selection.
+
+    parameters:
+        total (float): The total fitness, the length of the wheel
+        pointers (np.ndarray): Where on the wheel, from 0 to total, every selection landed
+        winners (np.ndarray): The individual at every pointer
+    """
+
+    total: float
+    pointers: np.ndarray
+    winners: np.ndarray
+
+    def turns(self) -> np.ndarray:
+        """
+        Every pointer as a fraction of a turn of the wheel.
+        """
+        return self.pointers / self.total
+
+
+@dataclass
+class TournamentTrace:
+    """
+    Who was in every tournament.
+
+    parameters:
+        entrants (np.ndarray): The entrants of every tournament, shape (tournaments, tournament size)
+        winners (np.ndarray): The winner of every tournament
+    """
+
+    entrants: np.ndarray
+    winners: np.ndarray
+
+
+def spin(
+    fitness: np.ndarray, pointers: np.ndarray, trace: bool, in_order: bool = False
+) -> np.ndarray | WheelTrace:
+    """
+    The individuals at `pointers`, fractions of a turn of the wheel.
+    """
+    cumulative = np.cumsum(fitness)
+    total = cumulative[-1]
+    pointers = pointers * total
+    # side="right" so individuals with a fitness of 0 are never picked.
+    # Searching in order walks the cumulative sum front to back instead of
+    # jumping around it, which is several times faster for big batches
+    if in_order:
+        winners = np.searchsorted(cumulative, pointers, side="right")
+    else:
+        order = np.argsort(pointers)
+        winners = np.empty(len(pointers), dtype=np.int64)
+        winners[order] = np.searchsorted(cumulative, pointers[order], side="right")
+    # float error can put a pointer just past the last edge, which belongs
+    # to the last individual that has a sector at all
+    np.minimum(winners, np.flatnonzero(fitness)[-1], out=winners)
+    if trace:
+        return WheelTrace(float(total), pointers, winners)
+    return winners
+
+
+def roulette(
+    fitness: np.ndarray,
+    num_selections: int,
+    rng: np.random.Generator,
+    trace: bool = False,
+) -> np.ndarray | WheelTrace:
+    """
+    Fitness proportionate selection, a spin of the wheel per selection.
+
+    parameters:
+        fitness (np.ndarray): The fitness of every individual, all >= 0
+        num_selections (int): How many to select
+        rng (np.random.Generator): Spins the wheel
+        trace (bool, default = False): Whether to return where the wheel stopped too
+
+    returns:
+        (np.ndarray | WheelTrace): The selected individuals, or how they were selected if `trace`
+    """
+    fitness = wheel_fitness(fitness)
+    return spin(fitness, rng.random(num_selections), trace)
+
+
+def stochastic_universal_sampling(
+    fitness: np.ndarray,
+    num_selections: int,
+    rng: np.random.Generator,
+    trace: bool = False,
+) -> np.ndarray | WheelTrace:
+    """
+    Stochastic universal sampling (Baker 1987): one spin of a wheel with
+    `num_selections` evenly spaced pointers. Every individual is selected
+    either the floor or the ceiling of its expected number of times.
+
+    parameters:
+        fitness (np.ndarray): The fitness of every individual, all >= 0
+        num_selections (int): How many to select
+        rng (np.random.Generator): Spins the wheel
+        trace (bool, default = False): Whether to return where the pointers stopped too
+
+    returns:
+        (np.ndarray | WheelTrace): The selected individuals, in wheel order, or how they were selected if `trace`
+    """
+    fitness = wheel_fitness(fitness)
+    pointers = (rng.random() + np.arange(num_selections)) / num_selections
+    return spin(fitness, pointers, trace, in_order=True)
+
+
+def tournament_entrants(
+    num_individuals: int,
+    num_tournaments: int,
+    tournament_size: int,
+    rng: np.random.Generator,
+    replace: bool = False,
+) -> np.ndarray:
+    """
+    The entrants of every tournament, a row per tournament. Without
+    replacement, rows are drawn by Floyd's algorithm, a column at a time
+    for all tournaments together.
+    """
+    if replace:
+        return rng.integers(0, num_individuals, (num_tournaments, tournament_size))
+    if tournament_size > num_individuals:
+        raise ValueError("tournament_size is bigger than the population")
+    entrants = np.empty((num_tournaments, tournament_size), dtype=np.int64)
+    for column, top in enumerate(
+        range(num_individuals - tournament_size, num_individuals)
+    ):
+        draws = rng.integers(0, top + 1, num_tournaments)
+        taken = (entrants[:, :column] == draws[:, None]).any(axis=1)
+        entrants[:, column] = np.where(taken, top, draws)
+    return entrants
+
+
+def tournament(
+    fitness: np.ndarray,
+    num_selections: int,
+    tournament_size: int,
+    rng: np.random.Generator,
+    replace: bool = False,
+    trace: bool = False,
+) -> np.ndarray | TournamentTrace:
+    """
+    Tournament selection: the fittest of `tournament_size` random
+    individuals, a tournament per selection. Ties go to the first entrant.
+
+    parameters:
+        fitness (np.ndarray): The fitness of every individual
+        num_selections (int): How many to select
+        tournament_size (int): How many individuals are in every tournament
+        rng (np.random.Generator): Draws the entrants
+        replace (bool, default = False): Whether an individual can be in a tournament more than once
+        trace (bool, default = False): Whether to return the entrants too
+
+    returns:
+        (np.ndarray | TournamentTrace): The selected individuals, or how they were selected if `trace`
+    """
+    fitness = np.asarray(fitness, dtype=float)
+    entrants = tournament_entrants(
+        len(fitness), num_selections, tournament_size, rng, replace
+    )
+    best = np.argmax(fitness[entrants], axis=1)
+    winners = np.take_along_axis(entrants, best[:, None], axis=1)[:, 0]
+    if trace:
+        return TournamentTrace(entrants, winners)
+    return winners
@@ -0,0 +1,86 @@
+"""
+Carries mobjects from the end of one slide to the start of the next.
+
+Every slide is its own Scene, and with render_tools every scene is its own
+process, so a mobject that stays on screen across slides (the EC loop
+pseudocode) used to be rebuilt by every slide. Here the slide that ends
+with it pickles it under `media/slide_state`, and the next slide starts by
+loading it.
+
+Scenes can render in any order, so every state gets its own file, named
+by a description of what the next slide expects, and stays there until
+the slide that wants it loads it. If the file isn't there yet, the next
+slide builds that state itself. Keys should change with the code that
+builds the state too, like ListingState's, or a slide can load a mobject
+built before that code changed.
+"""
+
+from manim import Mobject, config, logger
+from pathlib import Path
+from typing import Callable, Optional
+import hashlib
+import os
+import pickle
+import re
+import tempfile
+
+
+def slide_state_dir() -> Path:
+    return Path(config.media_dir) / "slide_state"
+
+
+def slide_state_path(name: str, key: str) -> Path:
+    """
+    The file of state `key` of `name`. Keys that aren't safe as file names
+    are hashed, the key itself is saved in the file too.
+    """
+    if not re.fullmatch(r"[\w.-]{1,100}", key):
+        key = hashlib.sha256(key.encode()).hexdigest()[:32]
+    return slide_state_dir() / f"{name}-{key}.pkl"
+
+
+def save_slide_state(name: str, key: str, mobject: Mobject) -> None:
+    """
+    Saves `mobject` as the state `key` of `name` for the next slide.
+
+    parameters:
+        name (str): What is being carried, e.g. "pseudocode"
+        key (str): The state the mobject is in
+        mobject (Mobject): The mobject to carry over
+    """
+    try:
+        data = pickle.dumps((key, mobject), protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError) as error:
+        logger.warning(f"Could not save slide state {name}: {error}")
+        return
+    state_dir = slide_state_dir()
+    state_dir.mkdir(parents=True, exist_ok=True)
+    # another scene process may be reading it
+    with tempfile.NamedTemporaryFile(dir=state_dir, delete=False) as fp:
+        fp.write(data)
+    os.replace(fp.name, slide_state_path(name, key))
+
+
+def load_slide_state(name: str, key: str) -> Optional[Mobject]:
+    """
+    The mobject saved as state `key` of `name`, or None if there isn't one.
+    """
+    try:
+        with slide_state_path(name, key).open("rb") as fp:
+            saved_key, mobject = pickle.load(fp)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+    if saved_key != key:
+        return None
+    return mobject
+
+
+def carry_over(name: str, key: str, build: Callable[[], Mobject]) -> Mobject:
+    """
+    The mobject the previous slide left as state `key` of `name`, or a new
+    one from `build` if it hasn't been saved.
+    """
+    mobject = load_slide_state(name, key)
+    if mobject is None:
+        return build()
+    return mobject
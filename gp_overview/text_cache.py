@@ -0,0 +1,95 @@
+"""
+A memoized Text factory.
+
+Every Text goes through Pango, an SVG file and SVG path parsing. The slides
+build the same labels over and over ("t=0" through "t=7", node labels, stack
+labels, the whole PSEUDOCODE listing on every EC loop slide), so each
+distinct text is built once per process and handed out as copies.
+"""
+
+from manim import DEFAULT_FONT_SIZE, NORMAL, Text, logger
+from typing import Final, Optional
+import atexit
+
+TextKey = tuple[str, str, float, str, str]
+
+_TEXT_CACHE: dict[TextKey, Text] = {}
+TEXT_CACHE_STATS: Final[dict[str, int]] = {"hits": 0, "misses": 0}
+
+
+def cached_text(
+    text: str,
+    font_size: float = DEFAULT_FONT_SIZE,
+    font: str = "",
+    weight: str = NORMAL,
+    slant: str = NORMAL,
+    color=None,
+    **kwargs,
+) -> Text:
+    """
+    A drop in for `Text(...)` that parses each distinct text once.
+
+    Texts are keyed by (text, font, font_size, weight, slant). The color is
+    applied to the copy, so the same label in different colors is still a
+    hit. Any other keyword argument (t2c, line_spacing, ...) bypasses the
+    cache and builds a plain Text.
+
+    parameters:
+        text (str): The string to display
+        font_size (float, default = DEFAULT_FONT_SIZE): The font size
+        font (str, default = ""): The font family, "" for Pango's default
+        weight (str, default = NORMAL): The font weight, e.g. BOLD
+        slant (str, default = NORMAL): The font slant, e.g. ITALIC
+        color (default = None): The color of the copy handed out
+
+    returns:
+        (Text): A copy of the cached Text
+    """
+    if kwargs:
+        TEXT_CACHE_STATS["misses"] += 1
+        return Text(
+            text,
+            font_size=font_size,
+            font=font,
+            weight=weight,
+            slant=slant,
+            color=color,
+            **kwargs,
+        )
+
+    key: TextKey = (text, font, font_size, weight, slant)
+    template: Optional[Text] = _TEXT_CACHE.get(key)
+    if template is None:
+        TEXT_CACHE_STATS["misses"] += 1
+        template = Text(
+            text, font_size=font_size, font=font, weight=weight, slant=slant
+        )
+        _TEXT_CACHE[key] = template
+    else:
+        TEXT_CACHE_STATS["hits"] += 1
+
+    text_mobject = template.copy()
+    if color is not None:
+        text_mobject.set_color(color)
+    return text_mobject
+
+
+def clear_text_cache() -> None:
+    _TEXT_CACHE.clear()
+    TEXT_CACHE_STATS["hits"] = 0
+    TEXT_CACHE_STATS["misses"] = 0
+
+
+@atexit.register
+def log_text_cache_stats() -> None:
+    """
+    Logs how many Text builds the cache saved. Every render process logs
+    its own counts when it exits.
+    """
+    total = TEXT_CACHE_STATS["hits"] + TEXT_CACHE_STATS["misses"]
+    if total:
+        logger.info(
+            f"Text cache: {TEXT_CACHE_STATS['hits']} hits, "
+            f"{TEXT_CACHE_STATS['misses']} misses "
+            f"({TEXT_CACHE_STATS['hits'] / total:.0%} of Text builds skipped)"
+        )
@@ -0,0 +1,273 @@
+"""
+A small tree-based GP core: Full, Grow and Ramped half-and-half
+initialization, and batched evaluation of whole populations with NumPy.
+
+Trees are prefix lists of tokens, `["+", "x", "*", "y", "1"]`, the same
+form `TreeDiagram(..., prefix=True)` draws.
+
+Populations are evaluated all at once. Every subtree in the population is
+interned, so a subtree that appears in many individuals (`x`, `(* x x)`,
+...) is evaluated once, as one NumPy operation over every fitness case,
+and its result is freed as soon as the last individual using it is done.
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, Final, Optional
+
+import numpy as np
+
+
+def protected_divide(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    a / b, or 1 where b is (close to) zero, the usual GP protected division.
+    """
+    a, b = np.broadcast_arrays(a, b)
+    safe = np.abs(b) > 1e-9
+    return np.divide(a, b, out=np.ones(a.shape), where=safe)
+
+
+@dataclass(frozen=True)
+class Function:
+    """
+    parameters:
+        name (str): The token of the function
+        arity (int): How many arguments it takes
+        apply (Callable[..., np.ndarray]): Computes it over arrays of fitness cases
+    """
+
+    name: str
+    arity: int
+    apply: Callable[..., np.ndarray]
+
+
+DEFAULT_FUNCTIONS: Final[tuple[Function, ...]] = (
+    Function("+", 2, np.add),
+    Function("-", 2, np.subtract),
+    Function("*", 2, np.multiply),
+    Function("/", 2, protected_divide),
+)
+
+
+@dataclass
+class PrimitiveSet:
+    """
+    The functions and terminals trees are built from.
+
+    parameters:
+        functions (tuple[Function, ...], default = DEFAULT_FUNCTIONS): The function set
+        variables (tuple[str, ...], default = ("x",)): Input variables
+        constants (tuple[float, ...], default = ()): Constant terminals
+    """
+
+    functions: tuple[Function, ...] = DEFAULT_FUNCTIONS
+    variables: tuple[str, ...] = ("x",)
+    constants: tuple[float, ...] = ()
+    by_name: dict[str, Function] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.by_name = {function.name: function for function in self.functions}
+
+    @property
+    def terminals(self) -> list[str]:
+        return [*self.variables, *(format_constant(c) for c in self.constants)]
+
+    @property
+    def arity(self) -> dict[str, int]:
+        return {function.name: function.arity for function in self.functions}
+
+
+def format_constant(constant: float) -> str:
+    return str(int(constant)) if float(constant).is_integer() else str(constant)
+
+
+def generate(
+    rng: np.random.Generator, pset: PrimitiveSet, max_depth: int, full: bool
+) -> list[str]:
+    """
+    One tree no deeper than `max_depth`, in prefix order.
+
+    With `full` every branch reaches `max_depth` (Full). Otherwise every
+    node is picked from functions and terminals together until `max_depth`,
+    so branches stop at random depths (Grow).
+    """
+    terminals = pset.terminals
+    functions = pset.functions
+    choices = len(functions) if full else len(functions) + len(terminals)
+    tokens: list[str] = []
+    # random numbers are drawn in blocks, one call per block instead of per node
+    draws = rng.random(2 ** min(max_depth + 1, 12))
+    drawn = 0
+    # depths of the nodes still to be generated, leftmost last
+    stack = [0]
+    while stack:
+        if drawn == len(draws):
+            draws = rng.random(2 * len(draws))
+            drawn = 0
+        draw = draws[drawn]
+        drawn += 1
+        depth = stack.pop()
+        if depth < max_depth:
+            pick = int(draw * choices)
+        else:
+            pick = len(functions) + int(draw * len(terminals))
+        if pick < len(functions):
+            function = functions[pick]
+            tokens.append(function.name)
+            stack.extend([depth + 1] * function.arity)
+        else:
+            tokens.append(terminals[pick - len(functions)])
+    return tokens
+
+
+def full(rng: np.random.Generator, pset: PrimitiveSet, max_depth: int) -> list[str]:
+    return generate(rng, pset, max_depth, full=True)
+
+
+def grow(rng: np.random.Generator, pset: PrimitiveSet, max_depth: int) -> list[str]:
+    return generate(rng, pset, max_depth, full=False)
+
+
+def ramped_half_and_half(
+    rng: np.random.Generator,
+    pset: PrimitiveSet,
+    population_size: int,
+    min_depth: int = 2,
+    max_depth: int = 6,
+) -> list[list[str]]:
+    """
+    A population split evenly over the depths `min_depth..max_depth`, with
+    half of every depth built by Full and the other half by Grow.
+    """
+    depths = range(min_depth, max_depth + 1)
+    return [
+        generate(rng, pset, depths[(n // 2) % len(depths)], full=n % 2 == 0)
+        for n in range(population_size)
+    ]
+
+
+class SubtreeTable:
+    """
+    Interns subtrees: every distinct subtree gets an id, with the ids of its
+    children always smaller than its own.
+    """
+
+    def __init__(self, pset: PrimitiveSet) -> None:
+        self.pset = pset
+        self.ids: dict[tuple, int] = {}
+        # token and child ids of every subtree
+        self.nodes: list[tuple] = []
+        self.uses: list[int] = []
+
+    def intern(self, key: tuple) -> int:
+        subtree = self.ids.get(key)
+        if subtree is None:
+            subtree = self.ids[key] = len(self.nodes)
+            self.nodes.append(key)
+            self.uses.append(0)
+            # counted once per distinct parent, the way they are evaluated
+            for child in key[1:]:
+                self.uses[child] += 1
+        return subtree
+
+    def add_tree(self, tokens: list[str]) -> int:
+        """
+        Interns every subtree of `tokens` and returns the id of the root.
+        """
+        functions = self.pset.by_name
+        stack: list[int] = []
+        for token in reversed(tokens):
+            function = functions.get(token)
+            if function is None:
+                stack.append(self.intern((token,)))
+                continue
+            if len(stack) < function.arity:
+                raise ValueError(f"Malformed tree: {' '.join(tokens)}")
+            # the leftmost child was interned last
+            children = tuple(stack[-1 : -function.arity - 1 : -1])
+            del stack[-function.arity :]
+            stack.append(self.intern((token, *children)))
+        if len(stack) != 1:
+            raise ValueError(f"Malformed tree: {' '.join(tokens)}")
+        return stack[0]
+
+
+def terminal_value(token: str, inputs: dict[str, np.ndarray]) -> np.ndarray | float:
+    if token in inputs:
+        return inputs[token]
+    return float(token)
+
+
+def evaluate_population(
+    population: list[list[str]],
+    pset: PrimitiveSet,
+    inputs: dict[str, np.ndarray],
+    target: np.ndarray,
+    error: Optional[Callable[[np.ndarray, np.ndarray], float]] = None,
+) -> np.ndarray:
+    """
+    The error of every individual over every fitness case.
+
+    parameters:
+        population (list[list[str]]): The trees, in prefix order
+        pset (PrimitiveSet): The primitives they are built from
+        inputs (dict[str, np.ndarray]): The value of every variable in every fitness case
+        target (np.ndarray): The expected output of every fitness case
+        error (Optional[Callable], default = None): Error of outputs against the target,
+            the mean squared error if None
+
+    returns:
+        (np.ndarray): The error of every individual, inf where it overflows
+    """
+    if error is None:
+
+        def error(outputs: np.ndarray, target: np.ndarray) -> float:
+            return float(np.mean((outputs - target) ** 2))
+
+    table = SubtreeTable(pset)
+    roots = [table.add_tree(tokens) for tokens in population]
+    individuals: dict[int, list[int]] = {}
+    for individual, root in enumerate(roots):
+        table.uses[root] += 1
+        individuals.setdefault(root, []).append(individual)
+
+    errors = np.empty(len(population))
+    values: dict[int, np.ndarray | float] = {}
+    with np.errstate(all="ignore"):
+        for subtree, (token, *children) in enumerate(table.nodes):
+            if children:
+                value = pset.by_name[token].apply(*(values[c] for c in children))
+                for child in children:
+                    table.uses[child] -= 1
+                    if table.uses[child] == 0:
+                        del values[child]
+            else:
+                value = terminal_value(token, inputs)
+            values[subtree] = value
+
+            for individual in individuals.get(subtree, ()):
+                outputs = np.broadcast_to(value, np.shape(target))
+                errors[individual] = error(outputs, target)
+                table.uses[subtree] -= 1
+            if table.uses[subtree] == 0:
+                del values[subtree]
+    errors[~np.isfinite(errors)] = np.inf
+    return errors
+
+
+def evaluate(
+    tokens: list[str], pset: PrimitiveSet, inputs: dict[str, np.ndarray]
+) -> np.ndarray:
+    """
+    The output of one tree in every fitness case.
+    """
+    table = SubtreeTable(pset)
+    root = table.add_tree(tokens)
+    values: list[np.ndarray | float] = []
+    with np.errstate(all="ignore"):
+        for token, *children in table.nodes:
+            if children:
+                values.append(pset.by_name[token].apply(*(values[c] for c in children)))
+            else:
+                values.append(terminal_value(token, inputs))
+    shape = np.shape(next(iter(inputs.values()))) if inputs else ()
+    return np.broadcast_to(values[root], shape)
@@ -0,0 +1,324 @@
+"""
+Lays out GP expression trees and draws them as nodes and edges.
+
+Trees are given either as nested tuples, `("+", ("*", "x", "y"), "1")`, or
+as a prefix list with the arity of every function, `["+", "*", "x", "y",
+"1"]`. Both are flattened into preorder arrays and laid out with the
+linear time tidy tree algorithm of Buchheim, Junger and Leipert (an
+improvement of Walker's), written without recursion so that bloated trees
+thousands of nodes deep are fine.
+"""
+
+from manim import (
+    BLUE,
+    DEFAULT_MOBJECT_TO_MOBJECT_BUFFER,
+    DOWN,
+    ORIGIN,
+    RIGHT,
+    Scene,
+    VGroup,
+)
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Optional, Sequence
+
+import numpy as np
+
+from edge_mesh import EdgeBucket, EdgeMesh, trimmed_segments
+from node import Node
+
+# arities of the functions used on the slides, anything else is a terminal
+DEFAULT_ARITY: dict[str, int] = {"+": 2, "-": 2, "*": 2, "/": 2}
+
+
+@dataclass
+class FlatTree:
+    """
+    A tree in preorder: node 0 is the root and every node comes before its
+    children.
+
+    parameters:
+        labels (list[str]): The label of every node
+        parent (list[int]): The parent of every node, -1 for the root
+        children (list[list[int]]): The children of every node, left to right
+        depth (list[int]): The depth of every node, 0 for the root
+    """
+
+    labels: list[str] = field(default_factory=list)
+    parent: list[int] = field(default_factory=list)
+    children: list[list[int]] = field(default_factory=list)
+    depth: list[int] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def add(self, label: Any, parent: int) -> int:
+        node = len(self.labels)
+        self.labels.append(str(label))
+        self.parent.append(parent)
+        self.children.append([])
+        self.depth.append(0 if parent < 0 else self.depth[parent] + 1)
+        if parent >= 0:
+            self.children[parent].append(node)
+        return node
+
+
+def flatten_tree(tree: Any) -> FlatTree:
+    """
+    Flattens a nested tuple tree, `(function, child, child, ...)` for
+    functions and anything else for terminals.
+    """
+    flat = FlatTree()
+    stack: list[tuple[Any, int]] = [(tree, -1)]
+    while stack:
+        subtree, parent = stack.pop()
+        if isinstance(subtree, tuple):
+            node = flat.add(subtree[0], parent)
+            stack.extend((child, node) for child in reversed(subtree[1:]))
+        else:
+            flat.add(subtree, parent)
+    return flat
+
+
+def flatten_prefix(
+    tokens: Sequence[Any], arity: Optional[dict[str, int]] = None
+) -> FlatTree:
+    """
+    Flattens a tree written in prefix order.
+
+    parameters:
+        tokens (Sequence[Any]): The tree in prefix order
+        arity (Optional[dict[str, int]], default = None): The arity of every function,
+            DEFAULT_ARITY if None. Tokens not in it are terminals.
+    """
+    arity = DEFAULT_ARITY if arity is None else arity
+    flat = FlatTree()
+    # (node, children it still needs)
+    open_nodes: list[list[int]] = []
+    for token in tokens:
+        parent = open_nodes[-1][0] if open_nodes else -1
+        if parent < 0 and len(flat):
+            raise ValueError("Prefix tree has tokens after its last node")
+        node = flat.add(token, parent)
+        if open_nodes:
+            open_nodes[-1][1] -= 1
+            if open_nodes[-1][1] == 0:
+                open_nodes.pop()
+        if arity.get(str(token), 0) > 0:
+            open_nodes.append([node, arity[str(token)]])
+    if open_nodes:
+        raise ValueError("Prefix tree is missing arguments")
+    return flat
+
+
+def postorder(tree: FlatTree) -> list[int]:
+    order = []
+    stack = [0] if len(tree) else []
+    while stack:
+        node = stack.pop()
+        order.append(node)
+        stack.extend(tree.children[node])
+    return order[::-1]
+
+
+def tidy_layout(tree: FlatTree, distance: float = 1.0) -> list[float]:
+    """
+    The x coordinate of every node, with the root at 0 and at least
+    `distance` between neighbouring nodes on the same level. Parents are
+    centered over their children and identical subtrees are drawn the same
+    way. Runs in linear time.
+    """
+    n = len(tree)
+    children = tree.children
+    parent = tree.parent
+    prelim = [0.0] * n
+    mod = [0.0] * n
+    shift = [0.0] * n
+    change = [0.0] * n
+    thread = [-1] * n
+    ancestor = list(range(n))
+    number = [0] * n
+    left_sibling = [-1] * n
+    default_ancestor = [-1] * n
+    for node in range(n):
+        for i, child in enumerate(children[node]):
+            number[child] = i
+            left_sibling[child] = children[node][i - 1] if i else -1
+        if children[node]:
+            default_ancestor[node] = children[node][0]
+
+    def next_left(node: int) -> int:
+        return children[node][0] if children[node] else thread[node]
+
+    def next_right(node: int) -> int:
+        return children[node][-1] if children[node] else thread[node]
+
+    def move_subtree(left: int, right: int, amount: float) -> None:
+        subtrees = number[right] - number[left]
+        change[right] -= amount / subtrees
+        shift[right] += amount
+        change[left] += amount / subtrees
+        prelim[right] += amount
+        mod[right] += amount
+
+    def apportion(node: int, default: int) -> int:
+        sibling = left_sibling[node]
+        if sibling < 0:
+            return default
+        # inside/outside contours of the right (p) and left (m) subtrees
+        v_ip = v_op = node
+        v_im = sibling
+        v_om = children[parent[node]][0]
+        s_ip, s_op, s_im, s_om = mod[v_ip], mod[v_op], mod[v_im], mod[v_om]
+        while next_right(v_im) >= 0 and next_left(v_ip) >= 0:
+            v_im = next_right(v_im)
+            v_ip = next_left(v_ip)
+            v_om = next_left(v_om)
+            v_op = next_right(v_op)
+            ancestor[v_op] = node
+            amount = (prelim[v_im] + s_im) - (prelim[v_ip] + s_ip) + distance
+            if amount > 0:
+                left = ancestor[v_im]
+                if parent[left] != parent[node]:
+                    left = default
+                move_subtree(left, node, amount)
+                s_ip += amount
+                s_op += amount
+            s_im += mod[v_im]
+            s_ip += mod[v_ip]
+            s_om += mod[v_om]
+            s_op += mod[v_op]
+        if next_right(v_im) >= 0 and next_right(v_op) < 0:
+            thread[v_op] = next_right(v_im)
+            mod[v_op] += s_im - s_op
+        if next_left(v_ip) >= 0 and next_left(v_om) < 0:
+            thread[v_om] = next_left(v_ip)
+            mod[v_om] += s_ip - s_om
+            default = node
+        return default
+
+    for node in postorder(tree):
+        sibling = left_sibling[node]
+        if children[node]:
+            # execute the shifts queued up by move_subtree
+            total_shift = 0.0
+            total_change = 0.0
+            for child in reversed(children[node]):
+                prelim[child] += total_shift
+                mod[child] += total_shift
+                total_change += change[child]
+                total_shift += shift[child] + total_change
+            midpoint = (prelim[children[node][0]] + prelim[children[node][-1]]) / 2
+            if sibling >= 0:
+                prelim[node] = prelim[sibling] + distance
+                mod[node] = prelim[node] - midpoint
+            else:
+                prelim[node] = midpoint
+        elif sibling >= 0:
+            prelim[node] = prelim[sibling] + distance
+        if parent[node] >= 0:
+            default_ancestor[parent[node]] = apportion(
+                node, default_ancestor[parent[node]]
+            )
+
+    # preorder, so every parent's offset is known before its children
+    x = [0.0] * n
+    offset = [0.0] * n
+    if n:
+        offset[0] = -prelim[0]
+    for node in range(n):
+        x[node] = prelim[node] + offset[node]
+        for child in children[node]:
+            offset[child] = offset[node] + mod[node]
+    return x
+
+
+class TreeDiagram(VGroup):
+    """
+    A laid out expression tree: a Node per tree node and one EdgeMesh for
+    all of the edges. `diagram.nodes[i]` is node i in preorder, and the edge
+    from its parent is edge i - 1 of `diagram.edges`.
+
+    parameters:
+        tree (Any): A nested tuple tree, or a prefix list if `prefix` is True
+        prefix (bool, default = False): Whether `tree` is a prefix list
+        arity (Optional[dict[str, int]], default = None): Function arities for prefix lists
+        radius (float, default = 0.7): The radius of every node
+        color (default = BLUE): The color of every node
+        font_size (float, default = 30): The font size of the labels
+        sibling_distance (Optional[float], default = None): Distance between neighbouring nodes,
+            a node's diameter plus the default buffer if None
+        level_distance (Optional[float], default = None): Distance between levels, the same as
+            sibling_distance if None
+        root_position (np.ndarray, default = ORIGIN): Where the root is placed
+    """
+
+    def __init__(
+        self,
+        tree: Any,
+        prefix: bool = False,
+        arity: Optional[dict[str, int]] = None,
+        radius: float = 0.7,
+        color=BLUE,
+        font_size: float = 30,
+        sibling_distance: Optional[float] = None,
+        level_distance: Optional[float] = None,
+        root_position: np.ndarray = ORIGIN,
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.tree = flatten_prefix(tree, arity) if prefix else flatten_tree(tree)
+        if sibling_distance is None:
+            sibling_distance = 2 * radius + DEFAULT_MOBJECT_TO_MOBJECT_BUFFER
+        if level_distance is None:
+            level_distance = sibling_distance
+
+        x = np.array(tidy_layout(self.tree), dtype=float)
+        depth = np.array(self.tree.depth, dtype=float)
+        self.positions = (
+            np.outer(x * sibling_distance, RIGHT)
+            + np.outer(depth * level_distance, DOWN)
+            + root_position
+        )
+
+        self.nodes = VGroup(
+            *[
+                Node(label, radius=radius, color=color, font_size=font_size).move_to(
+                    position
+                )
+                for label, position in zip(self.tree.labels, self.positions)
+            ]
+        )
+        parents = np.array(self.tree.parent[1:], dtype=int)
+        radii = np.full(len(parents), radius)
+        starts, ends = trimmed_segments(
+            self.positions[parents], radii, self.positions[1:], radii
+        )
+        self.edges = EdgeMesh(starts, ends)
+        self.edge_pieces: list[EdgeBucket] = []
+        self.add(self.edges, self.nodes)
+
+    def construction_steps(self) -> Iterator[tuple[Node, Optional[EdgeBucket]]]:
+        """
+        Every node in depth first order, with the edge from its parent as a
+        standalone mobject (None for the root). Once they have all been
+        shown, call `assemble` to swap them for the diagram itself.
+        """
+        for node, node_mobject in enumerate(self.nodes):
+            if node == 0:
+                yield node_mobject, None
+                continue
+            piece = self.edges.edge_subset(node - 1)
+            self.edge_pieces.append(piece)
+            yield node_mobject, piece
+
+    def assemble(self, scene: Scene) -> "TreeDiagram":
+        """
+        Replaces the nodes and edges shown by `construction_steps` with the
+        diagram. Writing a node adds it to the scene on its own, and adding
+        the diagram doesn't take it off, so it would be drawn twice and
+        stay on screen after the diagram is removed.
+        """
+        scene.remove(*self.nodes, *self.edge_pieces)
+        self.edge_pieces = []
+        scene.add(self)
+        return self
@@ -0,0 +1,247 @@
+"""
+Uniform Mutation by Addition and Deletion (UMAD, Helmuth, McPhee and
+Spector 2018) of whole populations of Push genomes at once.
+
+A population is one integer array, a genome per row and an instruction id
+(an index into the instruction list) per gene, padded with PAD past every
+genome's length. Addition and deletion are decided for every gene of every
+genome with one draw each, and genes are moved to where they end up with
+a cumulative sum and a scatter, rather than one Python list at a time.
+"""
+
+from dataclasses import dataclass
+from typing import Final, Optional, Sequence
+
+import numpy as np
+
+PAD: Final[int] = -1
+
+
+def encode(
+    genomes: Sequence[Sequence[str]], instructions: Sequence[str]
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Genomes of instruction names as an array of instruction ids and the
+    length of every genome.
+    """
+    ids = {}
+    for index, instruction in enumerate(instructions):
+        ids.setdefault(instruction, index)
+    lengths = np.array([len(genome) for genome in genomes], dtype=int)
+    encoded = np.full((len(genomes), lengths.max(initial=0)), PAD, dtype=np.int16)
+    for row, genome in enumerate(genomes):
+        encoded[row, : len(genome)] = [ids[instruction] for instruction in genome]
+    return encoded, lengths
+
+
+def decode(genome: np.ndarray, instructions: Sequence[str]) -> list[str]:
+    return [instructions[gene] for gene in genome if gene != PAD]
+
+
+def size_neutral_deletion_rate(addition_rate: float) -> float:
+    """
+    The deletion rate that keeps genomes the same length on average.
+    """
+    return addition_rate / (1 + addition_rate)
+
+
+@dataclass
+class UMADTrace:
+    """
+    How one genome was mutated.
+
+    parameters:
+        parent (np.ndarray): The genome before mutation
+        added (np.ndarray): Whether a gene was added in front of every gene of the parent
+        added_genes (np.ndarray): The gene added in front of every gene of the parent, PAD where none was
+        grown (np.ndarray): The genome after addition
+        deleted (np.ndarray): Whether every gene of `grown` was deleted
+        child (np.ndarray): The genome after deletion
+    """
+
+    parent: np.ndarray
+    added: np.ndarray
+    added_genes: np.ndarray
+    grown: np.ndarray
+    deleted: np.ndarray
+    child: np.ndarray
+
+
+@dataclass
+class UMADChunk:
+    """
+    The genomes and decisions of one batch of mutations, every array with
+    a row per genome.
+    """
+
+    grown: np.ndarray
+    grown_lengths: np.ndarray
+    added: np.ndarray
+    gene_positions: np.ndarray
+    deleted: np.ndarray
+    children: np.ndarray
+    child_lengths: np.ndarray
+
+    def trace(self, genomes: np.ndarray, lengths: np.ndarray, row: int) -> UMADTrace:
+        length = lengths[row]
+        grown_length = self.grown_lengths[row]
+        added = self.added[row, :length]
+        added_genes = np.full(length, PAD, dtype=self.grown.dtype)
+        added_genes[added] = self.grown[
+            row, self.gene_positions[row, :length][added] - 1
+        ]
+        return UMADTrace(
+            parent=genomes[row, :length].copy(),
+            added=added.copy(),
+            added_genes=added_genes,
+            grown=self.grown[row, :grown_length].copy(),
+            deleted=self.deleted[row, :grown_length].copy(),
+            child=self.children[row, : self.child_lengths[row]].copy(),
+        )
+
+
+def scatter(
+    out: np.ndarray, mask: np.ndarray, positions: np.ndarray, values: np.ndarray
+) -> None:
+    """
+    `out[row, positions[row, i]] = values[row, i]` wherever `mask[row, i]`,
+    with flat indices, which is a lot faster than pairs of index arrays.
+    """
+    sources = np.flatnonzero(mask)
+    rows = sources // mask.shape[1]
+    out.ravel()[rows * out.shape[1] + positions.ravel()[sources]] = values.ravel()[
+        sources
+    ]
+
+
+def packed(values: np.ndarray, mask: np.ndarray, dtype) -> np.ndarray:
+    """
+    The values where `mask` is set moved to the front of their rows, PAD
+    after them.
+    """
+    positions = np.cumsum(mask, axis=1, dtype=np.int32) - 1
+    lengths = mask.sum(axis=1)
+    out = np.full((len(mask), lengths.max(initial=0)), PAD, dtype=dtype)
+    scatter(out, mask, positions, values)
+    return out
+
+
+def mutate_chunk(
+    genomes: np.ndarray,
+    lengths: np.ndarray,
+    rng: np.random.Generator,
+    num_instructions: int,
+    addition_rate: float,
+    deletion_rate: float,
+) -> UMADChunk:
+    num_genomes, width = genomes.shape
+    genes = np.arange(width)
+    valid = genes < lengths[:, None]
+
+    # addition: a new gene goes in front of every gene that draws under the rate
+    added = (rng.random(genomes.shape, dtype=np.float32) < addition_rate) & valid
+    added_before = np.cumsum(added, axis=1, dtype=np.int32)
+    grown_lengths = lengths + added_before[:, -1] if width else lengths.copy()
+    gene_positions = genes + added_before
+    grown = np.full(
+        (num_genomes, grown_lengths.max(initial=0)), PAD, dtype=genomes.dtype
+    )
+    scatter(grown, valid, gene_positions, genomes)
+    new_genes = np.empty_like(genomes)
+    new_genes[added] = rng.integers(
+        0, num_instructions, int(added.sum()), dtype=genomes.dtype
+    )
+    scatter(grown, added, gene_positions - 1, new_genes)
+
+    # deletion: every gene of the grown genome that draws under the rate goes
+    grown_valid = np.arange(grown.shape[1]) < grown_lengths[:, None]
+    deleted = (rng.random(grown.shape, dtype=np.float32) < deletion_rate) & grown_valid
+    kept = grown_valid & ~deleted
+    return UMADChunk(
+        grown=grown,
+        grown_lengths=grown_lengths,
+        added=added,
+        gene_positions=gene_positions,
+        deleted=deleted,
+        children=packed(grown, kept, genomes.dtype),
+        child_lengths=kept.sum(axis=1),
+    )
+
+
+def chunks(num_genomes: int, chunk_size: int):
+    for start in range(0, num_genomes, chunk_size):
+        yield slice(start, min(start + chunk_size, num_genomes))
+
+
+def umad(
+    genomes: np.ndarray,
+    lengths: np.ndarray,
+    rng: np.random.Generator,
+    num_instructions: int,
+    addition_rate: float = 0.09,
+    deletion_rate: Optional[float] = None,
+    chunk_size: int = 8192,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Mutates every genome of a population.
+
+    parameters:
+        genomes (np.ndarray): The genomes, a row of instruction ids per genome padded with PAD
+        lengths (np.ndarray): The length of every genome
+        rng (np.random.Generator): Decides every addition and deletion, and the genes added
+        num_instructions (int): How many instructions there are to add
+        addition_rate (float, default = 0.09): The chance of adding a gene in front of every gene
+        deletion_rate (Optional[float], default = None): The chance of deleting every gene after addition,
+            size neutral if None
+        chunk_size (int, default = 8192): How many genomes are mutated in one batch, to bound memory
+
+    returns:
+        (tuple[np.ndarray, np.ndarray]): The children, padded with PAD, and their lengths
+    """
+    if deletion_rate is None:
+        deletion_rate = size_neutral_deletion_rate(addition_rate)
+    genomes = np.asarray(genomes)
+    lengths = np.asarray(lengths, dtype=int)
+    # only the children of every batch are kept, not its decisions
+    batches = []
+    for rows in chunks(len(genomes), chunk_size):
+        batch = mutate_chunk(
+            genomes[rows],
+            lengths[rows],
+            rng,
+            num_instructions,
+            addition_rate,
+            deletion_rate,
+        )
+        batches.append((rows, batch.children, batch.child_lengths))
+    child_lengths = np.zeros(len(genomes), dtype=int)
+    for rows, _, batch_lengths in batches:
+        child_lengths[rows] = batch_lengths
+    children = np.full(
+        (len(genomes), child_lengths.max(initial=0)), PAD, dtype=genomes.dtype
+    )
+    for rows, batch_children, _ in batches:
+        children[rows, : batch_children.shape[1]] = batch_children
+    return children, child_lengths
+
+
+def umad_traces(
+    genomes: np.ndarray,
+    lengths: np.ndarray,
+    rng: np.random.Generator,
+    num_instructions: int,
+    addition_rate: float = 0.09,
+    deletion_rate: Optional[float] = None,
+) -> list[UMADTrace]:
+    """
+    Like `umad`, for a small population, but returns how every genome was
+    mutated, gene by gene.
+    """
+    if deletion_rate is None:
+        deletion_rate = size_neutral_deletion_rate(addition_rate)
+    genomes = np.asarray(genomes)
+    lengths = np.asarray(lengths, dtype=int)
+    batch = mutate_chunk(
+        genomes, lengths, rng, num_instructions, addition_rate, deletion_rate
+    )
+    return [batch.trace(genomes, lengths, row) for row in range(len(genomes))]
@@ -0,0 +1,267 @@
+"""
+The roulette wheel of fitness proportionate selection, drawn as a mesh of
+sectors.
+
+A Sector per individual is one mobject each to build, copy and spin. A
+Wheel computes the outlines of all its sectors at once, a few cubic curves
+per sector from its start angle and width, and draws all the sectors that
+share a color as the subpaths of a single VMobject, like Heatmap does for
+cells. Spinning it rotates a handful of mobjects however many individuals
+there are.
+"""
+
+from manim import (
+    BLUE_B,
+    BLUE_E,
+    DOWN,
+    PI,
+    TAU,
+    UP,
+    WHITE,
+    YELLOW,
+    ManimColor,
+    Rotate,
+    Triangle,
+    VGroup,
+    VMobject,
+    color_gradient,
+    smooth,
+)
+from typing import Optional, Sequence
+
+import numpy as np
+
+from edge_mesh import line_curves
+from heatmap import Selection, as_indices
+from selection import WheelTrace, wheel_fitness
+from text_cache import cached_text
+
+# the longest arc drawn as one cubic curve
+MAX_ARC_ANGLE: float = PI / 4
+
+
+def sector_points(
+    center: np.ndarray,
+    radius: float,
+    starts: np.ndarray,
+    widths: np.ndarray,
+) -> np.ndarray:
+    """
+    The points of closed sectors from `starts` to `starts + widths`
+    (radians, counterclockwise), each a line out from the center, its arc
+    in as many cubic curves as it needs, and a line back.
+    """
+    pieces = np.maximum(1, np.ceil(widths / MAX_ARC_ANGLE)).astype(int)
+    curves = pieces + 2
+    first_curve = np.cumsum(curves) - curves
+    sector_of_piece = np.repeat(np.arange(len(starts)), pieces)
+    piece_index = np.arange(pieces.sum()) - np.repeat(
+        np.cumsum(pieces) - pieces, pieces
+    )
+
+    # every piece of arc, with the usual 4/3 tan(angle / 4) handles
+    piece_width = (widths / pieces)[sector_of_piece]
+    angle0 = starts[sector_of_piece] + piece_index * piece_width
+    angle1 = angle0 + piece_width
+    handle = 4 / 3 * np.tan(piece_width / 4)
+    unit0 = np.column_stack([np.cos(angle0), np.sin(angle0), np.zeros_like(angle0)])
+    unit1 = np.column_stack([np.cos(angle1), np.sin(angle1), np.zeros_like(angle1)])
+    normal0 = np.column_stack([-unit0[:, 1], unit0[:, 0], np.zeros_like(angle0)])
+    normal1 = np.column_stack([-unit1[:, 1], unit1[:, 0], np.zeros_like(angle1)])
+    arcs = center + radius * np.stack(
+        [
+            unit0,
+            unit0 + handle[:, None] * normal0,
+            unit1 - handle[:, None] * normal1,
+            unit1,
+        ],
+        axis=1,
+    )
+
+    # the lines out to the arcs and back to the center
+    centers = np.broadcast_to(center, (len(starts), 3))
+    rims0 = center + radius * np.column_stack(
+        [np.cos(starts), np.sin(starts), np.zeros_like(starts)]
+    )
+    ends = starts + widths
+    rims1 = center + radius * np.column_stack(
+        [np.cos(ends), np.sin(ends), np.zeros_like(ends)]
+    )
+
+    points = np.empty((curves.sum(), 4, 3))
+    points[first_curve] = line_curves(centers, rims0).reshape(-1, 4, 3)
+    points[np.repeat(first_curve + 1, pieces) + piece_index] = arcs
+    points[first_curve + curves - 1] = line_curves(rims1, centers).reshape(-1, 4, 3)
+    return points.reshape(-1, 3)
+
+
+class SectorBucket(VMobject):
+    """
+    The sectors of a Wheel with one color.
+
+    parameters:
+        individuals (np.ndarray): The individuals of these sectors
+    """
+
+    def __init__(self, individuals: np.ndarray, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.individuals = individuals
+
+
+class Wheel(VGroup):
+    """
+    A roulette wheel with a sector per individual, as wide as its share of
+    the total fitness, and a pointer at the top that the wheel spins under.
+    Individual 0 starts just counterclockwise of the pointer.
+
+    Sectors are colored by fitness, from the first of `colors` to the last.
+    Recolor them with `highlight`, not `wheel.animate`, they are regrouped
+    by color every time they change. The wheel can be moved, but not
+    scaled, pick its radius instead.
+
+    parameters:
+        fitness (np.ndarray): The fitness of every individual, all >= 0
+        radius (float, default = 1.5): The radius of the wheel
+        colors (Sequence, default = (BLUE_E, BLUE_B)): The colormap, from the lowest fitness to the highest
+        num_colors (int, default = 32): How many colors the colormap is cut into
+        stroke_color (default = WHITE): The color of the sectors' outlines
+        stroke_width (float, default = 2): The width of the outlines, 0 for big populations
+        labels (Optional[Sequence[str]], default = None): Written in the middle of every sector.
+            That is a Text per sector, only meant for small populations
+        font_size (float, default = 24): The font size of the labels
+    """
+
+    def __init__(
+        self,
+        fitness: np.ndarray,
+        radius: float = 1.5,
+        colors: Sequence = (BLUE_E, BLUE_B),
+        num_colors: int = 32,
+        stroke_color=WHITE,
+        stroke_width: float = 2,
+        labels: Optional[Sequence[str]] = None,
+        font_size: float = 24,
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.fitness = wheel_fitness(fitness)
+        self.radius = radius
+        self.stroke_color = stroke_color
+        self.stroke_width = stroke_width
+
+        cumulative = np.cumsum(self.fitness)
+        self.total = cumulative[-1]
+        self.widths = TAU * self.fitness / self.total
+        self.starts = PI / 2 + TAU * (cumulative - self.fitness) / self.total
+        # how far the wheel has been spun, counterclockwise
+        self.rotation = 0.0
+
+        low, high = self.fitness.min(), self.fitness.max()
+        levels = (self.fitness - low) / (high - low if high > low else 1.0)
+        self.palette: list[ManimColor] = list(color_gradient(colors, num_colors))
+        self.color_index = np.rint(levels * (num_colors - 1)).astype(int)
+
+        self.sector_layer = VGroup()
+        self.labels = VGroup()
+        # the sectors and their labels turn, the pointer doesn't
+        self.disk = VGroup(self.sector_layer, self.labels)
+        self.pointer = (
+            Triangle(color=YELLOW, fill_opacity=1)
+            .rotate(PI)
+            .scale_to_fit_height(radius / 5)
+            .move_to(radius * UP, aligned_edge=DOWN)
+        )
+        self.pointers = VGroup(self.pointer)
+        self.add(self.disk, self.pointers)
+        self.build_buckets()
+
+        if labels is not None:
+            middles = self.starts + self.widths / 2
+            for label, angle in zip(labels, middles):
+                self.labels.add(
+                    cached_text(label, font_size=font_size).move_to(
+                        0.65 * radius * np.array([np.cos(angle), np.sin(angle), 0])
+                    )
+                )
+
+    @property
+    def num_individuals(self) -> int:
+        return len(self.fitness)
+
+    def wheel_center(self) -> np.ndarray:
+        # not get_center, the pointers stick out of the wheel
+        return self.pointer.get_bottom() + self.radius * DOWN
+
+    def build_buckets(self) -> None:
+        center = self.wheel_center()
+        unique, inverse = np.unique(self.color_index, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        buckets = []
+        for bucket_index, color_index in enumerate(unique):
+            individuals = np.flatnonzero(inverse == bucket_index)
+            bucket = SectorBucket(
+                individuals,
+                fill_color=self.palette[int(color_index)],
+                fill_opacity=1,
+                stroke_color=self.stroke_color,
+                stroke_width=self.stroke_width,
+            )
+            bucket.points = sector_points(
+                center,
+                self.radius,
+                self.starts[individuals] + self.rotation,
+                self.widths[individuals],
+            )
+            buckets.append(bucket)
+        self.sector_layer.submobjects = []
+        self.sector_layer.add(*buckets)
+
+    def highlight(self, individuals: Selection, color) -> "Wheel":
+        """
+        Recolors the sectors of some individuals, e.g. the selected ones.
+        """
+        color = ManimColor(color)
+        if color not in self.palette:
+            self.palette.append(color)
+        self.color_index[as_indices(individuals, self.num_individuals)] = (
+            self.palette.index(color)
+        )
+        self.build_buckets()
+        return self
+
+    def add_pointers(self, num_pointers: int) -> "Wheel":
+        """
+        Evenly spaced pointers around the wheel, counting the one at the top,
+        for stochastic universal sampling. Spun with `spin_trace`, the i-th
+        counterclockwise from the top ends at the trace's i-th pointer.
+        """
+        for index in range(1, num_pointers):
+            self.pointers.add(
+                self.pointer.copy().rotate(
+                    index * TAU / num_pointers, about_point=self.wheel_center()
+                )
+            )
+        return self
+
+    def spin_to(self, turn: float, extra_turns: int = 2, **kwargs) -> Rotate:
+        """
+        Spins the wheel clockwise until the point `turn` of the way around
+        it, counterclockwise from where it started, is under the pointer.
+
+        parameters:
+            turn (float): Where on the wheel to stop, from 0 to 1, e.g. `WheelTrace.turns()`
+            extra_turns (int, default = 2): Whole turns before stopping, for show
+        """
+        # where that point is now, counterclockwise from the pointer
+        now = (turn * TAU + self.rotation) % TAU
+        angle = -(now + extra_turns * TAU)
+        self.rotation = (self.rotation + angle) % TAU
+        kwargs.setdefault("rate_func", smooth)
+        return Rotate(self.disk, angle=angle, about_point=self.wheel_center(), **kwargs)
+
+    def spin_trace(self, trace: WheelTrace, selection: int = 0, **kwargs) -> Rotate:
+        """
+        Spins the wheel to where it stopped for one selection of a trace, the
+        only one of stochastic universal sampling.
+        """
+        return self.spin_to(float(trace.turns()[selection]), **kwargs)
@@ -0,0 +1,8 @@
+"""
+Shared rendering tools for the manim projects in this repo.
+
+Every project is its own uv project, so this package is not installed
+anywhere. The makefiles run it from the project directory with
+`PYTHONPATH=.. python -m render_tools`, using whatever manim the project's
+venv provides.
+"""
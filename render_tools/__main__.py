@@ -0,0 +1,4 @@
+from render_tools.render import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+"""
+A content-addressed partial movie cache shared by every project.
+
+manim already names each partial movie file after a hash of the play call
+(camera, animations and mobjects on screen). The shared cache keys files by
+that hash plus the render settings that change the encoded output, so a
+segment rendered by one project directory is reused by any other that
+produces the same play at the same settings.
+
+The cache is bounded by bytes instead of manim's `max_files_cached` file
+count. Hits refresh a file's mtime and eviction removes the least recently
+used files first. Each process scans the cache once for its size and keeps
+a running total from then on, scanning again only when that total goes
+over the quota.
+"""
+
+from pathlib import Path
+from typing import Final, Optional
+import hashlib
+import json
+import os
+import shutil
+
+DEFAULT_CACHE_DIR: Final[Path] = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    / "manim-projects"
+    / "renders"
+)
+DEFAULT_CACHE_QUOTA: Final[str] = "20G"
+SIZE_SUFFIXES: Final[dict[str, int]] = {
+    "": 1,
+    "K": 1024,
+    "M": 1024**2,
+    "G": 1024**3,
+    "T": 1024**4,
+}
+
+
+def parse_size(size: str) -> int:
+    """
+    Turns a human readable size such as `500M` or `20G` into bytes.
+    """
+    size = size.strip().upper().removesuffix("B")
+    suffix = size[-1:] if size[-1:] in SIZE_SUFFIXES else ""
+    number = size[: len(size) - len(suffix)]
+    return int(float(number) * SIZE_SUFFIXES[suffix])
+
+
+def render_settings_key(play_hash: str, variant: Optional[str] = None) -> str:
+    """
+    Combines manim's play hash with the config values that change the
+    encoded file. Must be called inside a worker, after manim's config is
+    set up for the scene.
+
+    `variant` names anything else that changes how frames are drawn, like
+    a draft quality profile, so those renders never mix with normal ones.
+    """
+    from manim import config
+
+    fingerprint = {
+        "play_hash": play_hash,
+        "pixel_width": config.pixel_width,
+        "pixel_height": config.pixel_height,
+        "frame_rate": config.frame_rate,
+        "renderer": str(config.renderer),
+        "movie_file_extension": config.movie_file_extension,
+        "transparent": config.transparent,
+        "background_color": str(config.background_color),
+    }
+    if variant is not None:
+        fingerprint["variant"] = variant
+    return hashlib.sha256(json.dumps(fingerprint, sort_keys=True).encode()).hexdigest()
+
+
+class RenderCache:
+    """
+    A directory of cached files named by key, bounded to `quota` bytes.
+
+    Several render processes share one cache, so every write goes through a
+    temporary file and an atomic rename, and files that disappear under us
+    (evicted by another process) are treated as misses. The running total
+    doesn't see what other processes store, the rescan before evicting
+    does.
+
+    parameters:
+        root (Path): The directory the cache lives in
+        quota (int): Maximum number of bytes to keep
+        suffix (str, default = ".mp4"): File extension of cached files
+    """
+
+    def __init__(self, root: Path, quota: int, suffix: str = ".mp4") -> None:
+        self.root = Path(root)
+        self.quota = quota
+        self.suffix = suffix
+        self.root.mkdir(parents=True, exist_ok=True)
+        # bytes in the cache, scanned on the first store
+        self.total: Optional[int] = None
+
+    def path_for(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}{self.suffix}"
+
+    def contains(self, key: str) -> bool:
+        return self.path_for(key).exists()
+
+    def touch(self, key: str) -> None:
+        try:
+            os.utime(self.path_for(key))
+        except FileNotFoundError:
+            pass
+
+    def fetch(self, key: str, destination: Path) -> bool:
+        """
+        Places the cached file for `key` at `destination`.
+
+        returns:
+            (bool): Whether the key was in the cache
+        """
+        cached = self.path_for(key)
+        destination = Path(destination)
+        try:
+            os.utime(cached)
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            temp = destination.with_name(f".{destination.name}.{os.getpid()}")
+            link_or_copy(cached, temp)
+            os.replace(temp, destination)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def store(self, key: str, source: Path) -> None:
+        """
+        Adds `source` to the cache under `key` and evicts down to the quota.
+        If the key is already cached it is only marked as used.
+        """
+        cached = self.path_for(key)
+        if cached.exists():
+            self.touch(key)
+            return
+
+        if self.total is None:
+            self.total = self.size()
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        temp = cached.with_name(f".{cached.name}.{os.getpid()}")
+        link_or_copy(Path(source), temp)
+        os.replace(temp, cached)
+        try:
+            self.total += cached.stat().st_size
+        except FileNotFoundError:
+            pass
+        if self.total > self.quota:
+            self.evict()
+
+    def size(self) -> int:
+        total = 0
+        for path in self.root.glob(f"*/*{self.suffix}"):
+            try:
+                total += path.stat().st_size
+            except FileNotFoundError:
+                pass
+        return total
+
+    def evict(self) -> int:
+        """
+        Removes least recently used files until the cache fits the quota.
+
+        returns:
+            (int): The number of bytes freed
+        """
+        files: list[tuple[float, int, Path]] = []
+        total = 0
+        for path in self.root.glob(f"*/*{self.suffix}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        freed = 0
+        self.total = total
+        if total <= self.quota:
+            return freed
+
+        files.sort()
+        for _, size, path in files:
+            if total - freed <= self.quota:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            freed += size
+        self.total = total - freed
+        return freed
+
+
+def link_or_copy(source: Path, destination: Path) -> None:
+    """
+    Hard links `source` to `destination` so cached segments don't take up
+    space twice, falling back to a copy across file systems.
+    """
+    try:
+        os.link(source, destination)
+    except OSError:
+        if not source.exists():
+            raise FileNotFoundError(source)
+        shutil.copy2(source, destination)
+
+
+class SharedCacheFileWriter:
+    """
+    Mixin for manim's SceneFileWriter that backs the per-scene partial movie
+    directory with a RenderCache.
+
+    A play is cached if its partial movie file is already in the scene's own
+    directory or in the shared cache, in which case it is linked in. Every
+    partial movie file written is added to the shared cache. The local
+    directory only keeps the files used by the latest render, since the
+    shared cache holds everything else.
+    """
+
+    render_cache: Optional[RenderCache] = None
+    cache_variant: Optional[str] = None
+
+    def _local_partial_path(self, hash_invocation: str) -> Path:
+        from manim import config
+
+        return (
+            self.partial_movie_directory
+            / f"{hash_invocation}{config['movie_file_extension']}"
+        )
+
+    def is_already_cached(self, hash_invocation: str) -> bool:
+        locally_cached = super().is_already_cached(hash_invocation)
+        if self.render_cache is None or hash_invocation.startswith("uncached_"):
+            return locally_cached
+
+        local_path = self._local_partial_path(hash_invocation)
+        key = render_settings_key(hash_invocation, self.cache_variant)
+        if locally_cached:
+            self.render_cache.store(key, local_path)
+            return True
+        if not hasattr(self, "partial_movie_directory"):
+            return False
+        return self.render_cache.fetch(key, local_path)
+
+    def close_partial_movie_stream(self) -> None:
+        super().close_partial_movie_stream()
+        if self.render_cache is None:
+            return
+        path = Path(self.partial_movie_file_path)
+        if path.stem.startswith("uncached_"):
+            return
+        self.render_cache.store(
+            render_settings_key(path.stem, self.cache_variant), path
+        )
+
+    def clean_cache(self) -> None:
+        if self.render_cache is None:
+            super().clean_cache()
+            return
+        in_use = {Path(file).name for file in self.partial_movie_files if file}
+        for path in self.partial_movie_directory.iterdir():
+            if path.name not in in_use and path.suffix == self.render_cache.suffix:
+                path.unlink(missing_ok=True)
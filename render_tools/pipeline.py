@@ -0,0 +1,103 @@
+"""
+Bounded hand-off of frames from the rasterizer to the encoder.
+
+manim already encodes on a writer thread, but it hands every frame over
+through an unbounded queue. When the encoder falls behind, which it does
+on the 2160x3840 shorts at 33MB per frame, the queue keeps growing until
+the process runs out of memory or starts swapping, and every frame is a
+fresh allocation.
+
+Here every frame takes one of a fixed number of slots. A frame the
+renderer hands over straight from the camera is copied into the slot's
+preallocated buffer, its only copy; one the renderer already copied for
+itself (e.g. to hold it) is queued as it is. The writer thread encodes it
+and gives the slot back. With every slot in flight the rasterizer blocks
+until the encoder frees one, so both sides keep running at the pace of the
+slower one with a fixed amount of memory between them.
+"""
+
+from queue import Queue
+from typing import Optional
+
+import numpy as np
+
+DEFAULT_FRAME_BUFFERS: int = 4
+
+
+class FramePipelineRenderer:
+    """
+    Mixin for manim's CairoRenderer that hands the camera's pixel array to
+    the file writer as it is, instead of the copy `get_frame` makes, for
+    FramePipelineFileWriter to copy into its ring.
+
+    Renderers that keep frames around (static holds) override `render` and
+    still use `get_frame`, so their frames stay their own.
+    """
+
+    def render(self, scene, time, moving_mobjects) -> None:
+        self.update_frame(scene, moving_mobjects)
+        self.add_frame(self.camera.pixel_array)
+
+    def freeze_current_frame(self, duration: float) -> None:
+        dt = 1 / self.camera.frame_rate
+        self.add_frame(self.camera.pixel_array, num_frames=int(duration / dt))
+
+
+class FramePipelineFileWriter:
+    """
+    Mixin for manim's SceneFileWriter that passes frames to the writer
+    thread through `frame_buffers` slots.
+    """
+
+    frame_buffers: int = DEFAULT_FRAME_BUFFERS
+
+    def __init__(self, *args, **kwargs) -> None:
+        self.frame_ring: Optional[np.ndarray] = None
+        self.slot_frames: list[Optional[np.ndarray]] = [None] * self.frame_buffers
+        self.free_slots: Queue[int] = Queue()
+        for slot in range(self.frame_buffers):
+            self.free_slots.put(slot)
+        super().__init__(*args, **kwargs)
+
+    def borrowed(self, frame: np.ndarray) -> bool:
+        """
+        Whether `frame` is the camera's own pixel array, which the next
+        frame is drawn over.
+        """
+        return frame is getattr(self.renderer.camera, "pixel_array", None)
+
+    def write_frame(self, frame_or_renderer, num_frames: int = 1) -> None:
+        from manim import config
+        from manim.constants import RendererType
+        from manim.utils.file_ops import is_png_format, write_to_movie
+
+        if write_to_movie():
+            frame = (
+                frame_or_renderer.get_frame()
+                if config.renderer == RendererType.OPENGL
+                else frame_or_renderer
+            )
+            # blocks while the encoder is `frame_buffers` frames behind
+            slot = self.free_slots.get()
+            if self.borrowed(frame):
+                if self.frame_ring is None:
+                    self.frame_ring = np.empty(
+                        (self.frame_buffers, *frame.shape), frame.dtype
+                    )
+                np.copyto(self.frame_ring[slot], frame)
+                frame = self.frame_ring[slot]
+            self.slot_frames[slot] = frame
+            self.queue.put((num_frames, slot))
+
+        if is_png_format():
+            # write_to_movie() is False for png, so this only writes the image
+            super().write_frame(frame_or_renderer, num_frames)
+
+    def listen_and_write(self) -> None:
+        while True:
+            num_frames, slot = self.queue.get()
+            if slot is None:
+                break
+            self.encode_and_write_frame(self.slot_frames[slot], num_frames)
+            self.slot_frames[slot] = None
+            self.free_slots.put(slot)
@@ -0,0 +1,246 @@
+"""
+Per-play render profiling.
+
+With `--profile DIR` every `self.play`/`self.wait` of a scene is timed and
+written to `DIR/<Scene>.json`. Each play records:
+
+    construct   time spent in the scene's own code since the previous play
+                (building mobjects, compiling LaTeX, ...)
+    updaters    time spent advancing animations and running updaters
+    rasterize   time spent drawing frames with Cairo
+    encode      time the encoder spent on this play's frames (this runs on
+                manim's writer thread, so it overlaps the other columns)
+    frames      frames written
+    mobjects    mobjects on screen, counting submobjects
+    points      points across all of those mobjects
+
+Compare two reports with
+
+    python -m render_tools.profiler old.json new.json --threshold 0.25
+
+which lists the plays whose cost per frame regressed by more than the
+threshold and exits with 1 if there are any.
+"""
+
+from pathlib import Path
+from typing import Any, Optional
+import argparse
+import json
+import sys
+import time
+import traceback
+
+
+def call_site(python_file: Optional[str]) -> Optional[str]:
+    """
+    The `file:line` in the scene file that called `self.play`/`self.wait`.
+    """
+    if python_file is None:
+        return None
+    for frame in reversed(traceback.extract_stack()):
+        if Path(frame.filename) == Path(python_file):
+            return f"{Path(frame.filename).name}:{frame.lineno}"
+    return None
+
+
+class ProfilingRenderer:
+    """
+    Mixin for manim's CairoRenderer that times every play and keeps the
+    results in `self.play_profiles`.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.play_profiles: list[dict[str, Any]] = []
+        self.scene_start = time.perf_counter()
+        self.last_play_end = self.scene_start
+        self.rasterize_seconds = 0.0
+        self.updater_seconds = 0.0
+        self.frames_written = 0
+
+    def _time_scene_updates(self, scene) -> None:
+        # update_to_time lives on the scene, so wrap it once per scene
+        if getattr(scene, "_profiled_update_to_time", False):
+            return
+        update_to_time = scene.update_to_time
+
+        def timed_update_to_time(t):
+            start = time.perf_counter()
+            update_to_time(t)
+            self.updater_seconds += time.perf_counter() - start
+
+        scene.update_to_time = timed_update_to_time
+        scene._profiled_update_to_time = True
+
+    def play(self, scene, *args, **kwargs) -> None:
+        from manim import config
+        from manim.utils.family import extract_mobject_family_members
+
+        self._time_scene_updates(scene)
+        start = time.perf_counter()
+        construct_seconds = start - self.last_play_end
+        rasterize_before = self.rasterize_seconds
+        updaters_before = self.updater_seconds
+        frames_before = self.frames_written
+        encode_before = getattr(self.file_writer, "encode_seconds", 0.0)
+
+        super().play(scene, *args, **kwargs)
+
+        end = time.perf_counter()
+        family = extract_mobject_family_members(scene.mobjects)
+        self.play_profiles.append(
+            {
+                "index": len(self.play_profiles),
+                "call_site": call_site(config.input_file and str(config.input_file)),
+                "animations": [
+                    type(animation).__name__ for animation in scene.animations
+                ],
+                "cached": self.skip_animations,
+                "wall": end - start,
+                "construct": construct_seconds,
+                "updaters": self.updater_seconds - updaters_before,
+                "rasterize": self.rasterize_seconds - rasterize_before,
+                "encode": getattr(self.file_writer, "encode_seconds", 0.0)
+                - encode_before,
+                "frames": self.frames_written - frames_before,
+                "mobjects": len(family),
+                "points": sum(len(mobject.points) for mobject in family),
+            }
+        )
+        self.last_play_end = end
+
+    def update_frame(self, *args, **kwargs) -> None:
+        start = time.perf_counter()
+        super().update_frame(*args, **kwargs)
+        self.rasterize_seconds += time.perf_counter() - start
+
+    def add_frame(self, frame, num_frames: int = 1) -> None:
+        if not self.skip_animations:
+            self.frames_written += num_frames
+        super().add_frame(frame, num_frames)
+
+    def profile_report(self, scene) -> dict[str, Any]:
+        from manim import config
+
+        return {
+            "scene": type(scene).__name__,
+            "pixel_width": config.pixel_width,
+            "pixel_height": config.pixel_height,
+            "frame_rate": config.frame_rate,
+            "total": time.perf_counter() - self.scene_start,
+            "plays": self.play_profiles,
+        }
+
+
+class ProfilingFileWriter:
+    """
+    Mixin for manim's SceneFileWriter that adds up the time spent encoding
+    and flushing partial movie files in `self.encode_seconds`.
+    """
+
+    encode_seconds: float = 0.0
+
+    def encode_and_write_frame(self, frame, num_frames: int) -> None:
+        start = time.perf_counter()
+        super().encode_and_write_frame(frame, num_frames)
+        self.encode_seconds += time.perf_counter() - start
+
+    def close_partial_movie_stream(self) -> None:
+        start = time.perf_counter()
+        super().close_partial_movie_stream()
+        self.encode_seconds += time.perf_counter() - start
+
+
+def write_report(report: dict[str, Any], profile_dir: Path) -> Path:
+    profile_dir.mkdir(parents=True, exist_ok=True)
+    path = profile_dir / f"{report['scene']}.json"
+    with path.open("w") as fp:
+        json.dump(report, fp, indent=4)
+    return path
+
+
+def cost_per_frame(play: dict[str, Any]) -> Optional[float]:
+    """
+    Seconds of updater, rasterize and encode work per frame written, or None
+    for plays that wrote no frames (cached or skipped).
+    """
+    if not play["frames"]:
+        return None
+    return (play["updaters"] + play["rasterize"] + play["encode"]) / play["frames"]
+
+
+def compare_reports(
+    old: dict[str, Any], new: dict[str, Any], threshold: float
+) -> list[dict[str, Any]]:
+    """
+    Pairs up the plays of two reports of the same scene by index and returns
+    the ones whose cost per frame grew by more than `threshold` (0.25 = 25%).
+    """
+    regressions = []
+    for old_play, new_play in zip(old["plays"], new["plays"]):
+        old_cost = cost_per_frame(old_play)
+        new_cost = cost_per_frame(new_play)
+        if old_cost is None or new_cost is None or old_cost == 0:
+            continue
+        change = new_cost / old_cost - 1
+        if change > threshold:
+            regressions.append(
+                {
+                    "index": new_play["index"],
+                    "call_site": new_play["call_site"],
+                    "animations": new_play["animations"],
+                    "old": old_cost,
+                    "new": new_cost,
+                    "change": change,
+                }
+            )
+    return regressions
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="render_tools.profiler",
+        description="Flag plays whose render cost per frame regressed.",
+    )
+    parser.add_argument("old", type=Path, help="The baseline report")
+    parser.add_argument("new", type=Path, help="The report to check")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Relative increase in cost per frame to flag (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    old = json.loads(args.old.read_text())
+    new = json.loads(args.new.read_text())
+    if len(old["plays"]) != len(new["plays"]):
+        print(
+            f"warning: {old['scene']} had {len(old['plays'])} plays, "
+            f"now {len(new['plays'])}. Plays are compared by index.",
+            file=sys.stderr,
+        )
+    if (old["pixel_width"], old["pixel_height"], old["frame_rate"]) != (
+        new["pixel_width"],
+        new["pixel_height"],
+        new["frame_rate"],
+    ):
+        print(
+            "warning: the reports were rendered at different settings", file=sys.stderr
+        )
+
+    regressions = compare_reports(old, new, args.threshold)
+    for regression in regressions:
+        animations = ", ".join(regression["animations"])
+        print(
+            f"play {regression['index']} ({regression['call_site']}, {animations}): "
+            f"{regression['old'] * 1000:.2f}ms -> {regression['new'] * 1000:.2f}ms "
+            f"per frame (+{regression['change']:.0%})"
+        )
+    print(f"{len(regressions)} regressed plays in {new['scene']}")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+Named quality profiles, so iterating on a scene doesn't mean waiting on
+the full resolution render pinned in manim.cfg.
+
+    draft   480p at 15fps, quarter resolution Surfaces, no anti-aliasing
+    review  1080p at 30fps
+    final   whatever manim.cfg says
+
+Resolutions are given by the short side and keep manim.cfg's aspect ratio,
+so a 2160x3840 short drafts at 480x854 and a 1920x1080 deck at 854x480. A
+profile never raises the resolution or frame rate above manim.cfg's.
+
+Projects can change these or add their own in manim.cfg, manim ignores
+sections it doesn't know:
+
+    [render_tools.quality.draft]
+    short_side = 360
+    frame_rate = 10
+    surface_resolution_scale = 0.5
+    antialias = False
+"""
+
+from configparser import ConfigParser
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Final, Optional
+import inspect
+
+CFG_SECTION_PREFIX: Final[str] = "render_tools.quality."
+
+
+@dataclass(frozen=True)
+class QualityProfile:
+    """
+    parameters:
+        name (str): What the profile is selected by
+        short_side (Optional[int]): Pixels along the short side of the frame. None keeps manim.cfg's.
+        frame_rate (Optional[float]): Frames per second. None keeps manim.cfg's.
+        surface_resolution_scale (float, default = 1.0): Multiplies the resolution of every Surface
+        antialias (bool, default = True): Whether Cairo anti-aliases what it draws
+    """
+
+    name: str
+    short_side: Optional[int]
+    frame_rate: Optional[float]
+    surface_resolution_scale: float = 1.0
+    antialias: bool = True
+
+    def config_overrides(
+        self, pixel_width: int, pixel_height: int, frame_rate: float
+    ) -> dict[str, Any]:
+        """
+        The manim config values for this profile, given the ones manim.cfg set.
+        """
+        overrides: dict[str, Any] = {}
+        short, long = sorted((pixel_width, pixel_height))
+        if self.short_side is not None and self.short_side < short:
+            new_long = round(long * self.short_side / short / 2) * 2
+            if pixel_width <= pixel_height:
+                overrides["pixel_width"] = self.short_side
+                overrides["pixel_height"] = new_long
+            else:
+                overrides["pixel_width"] = new_long
+                overrides["pixel_height"] = self.short_side
+        if self.frame_rate is not None and self.frame_rate < frame_rate:
+            overrides["frame_rate"] = self.frame_rate
+        return overrides
+
+    @property
+    def cache_variant(self) -> Optional[str]:
+        """
+        Tells cached renders of this profile apart from normal ones, or None
+        if frames are drawn the normal way.
+        """
+        if self.surface_resolution_scale == 1.0 and self.antialias:
+            return None
+        return f"surfaces={self.surface_resolution_scale:g},antialias={self.antialias}"
+
+
+BUILTIN_PROFILES: Final[dict[str, QualityProfile]] = {
+    "draft": QualityProfile("draft", 480, 15, 0.25, False),
+    "review": QualityProfile("review", 1080, 30),
+    "final": QualityProfile("final", None, None),
+}
+
+
+def load_profiles(cfg_file: Path = Path("manim.cfg")) -> dict[str, QualityProfile]:
+    """
+    The built in profiles, updated with any `[render_tools.quality.<name>]`
+    sections in `cfg_file`.
+    """
+    profiles = dict(BUILTIN_PROFILES)
+    parser = ConfigParser(interpolation=None)
+    parser.read(cfg_file)
+    for section in parser.sections():
+        if not section.startswith(CFG_SECTION_PREFIX):
+            continue
+        name = section.removeprefix(CFG_SECTION_PREFIX)
+        values = parser[section]
+        base = profiles.get(name, BUILTIN_PROFILES["final"])
+        profiles[name] = QualityProfile(
+            name,
+            values.getint("short_side", fallback=base.short_side),
+            values.getfloat("frame_rate", fallback=base.frame_rate),
+            values.getfloat(
+                "surface_resolution_scale", fallback=base.surface_resolution_scale
+            ),
+            values.getboolean("antialias", fallback=base.antialias),
+        )
+    return profiles
+
+
+def scale_resolution(resolution: Any, scale: float) -> Any:
+    """
+    Scales an int or (u, v) Surface resolution, keeping at least 2 per axis.
+    """
+    if isinstance(resolution, int):
+        return max(2, round(resolution * scale))
+    return type(resolution)(max(2, round(res * scale)) for res in resolution)
+
+
+def install_surface_resolution_scale(scale: float) -> None:
+    """
+    Makes every Surface (and Sphere, Cylinder, ...) built from now on use
+    its resolution times `scale`.
+    """
+    from manim import Surface
+
+    # scenes rendered one after another in the same process share the class
+    original_init = getattr(Surface.__init__, "unscaled_init", Surface.__init__)
+    signature = inspect.signature(original_init)
+
+    def scaled_init(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        bound.arguments["resolution"] = scale_resolution(
+            bound.arguments["resolution"], scale
+        )
+        original_init(*bound.args, **bound.kwargs)
+
+    scaled_init.unscaled_init = original_init
+    Surface.__init__ = scaled_init
+
+
+class QualityRenderer:
+    """
+    Mixin for manim's CairoRenderer that turns off Cairo anti-aliasing when
+    `antialias` is False.
+    """
+
+    antialias: bool = True
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        if self.antialias:
+            return
+
+        import cairo
+
+        get_cairo_context = self.camera.get_cairo_context
+
+        def aliased_cairo_context(pixel_array):
+            ctx = get_cairo_context(pixel_array)
+            ctx.set_antialias(cairo.ANTIALIAS_NONE)
+            return ctx
+
+        self.camera.get_cairo_context = aliased_cairo_context
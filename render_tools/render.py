@@ -0,0 +1,314 @@
+"""
+Parallel replacement for `manim $(PYTHON_FILE) $(SCENE_LIST)`.
+
+Every scene in the list is rendered in its own process from a pool sized
+to the machine. Each scene writes its own movie and (for Slides) its own
+`slides/<Scene>.json`, so `manim-slides $(SCENE_LIST)` keeps working
+exactly as before. The only state scenes share is what a project saves
+for the next slide on disk, like gp_overview's slide_state, which
+doesn't depend on the order scenes render in.
+
+usage (from a project directory):
+    PYTHONPATH=.. python -m render_tools main.py NNSlide ShowPopulation ...
+"""
+
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Optional
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+import zlib
+
+from render_tools.cache import DEFAULT_CACHE_DIR, DEFAULT_CACHE_QUOTA, parse_size
+from render_tools.pipeline import DEFAULT_FRAME_BUFFERS
+from render_tools.quality import load_profiles
+from render_tools.shard import concat_segments, split_frames
+from render_tools.tex_cache import (
+    DEFAULT_TEX_CACHE_DIR,
+    DEFAULT_TEX_CACHE_QUOTA,
+    prewarm,
+)
+from render_tools.worker import RenderJob, RenderResult, render_scene
+
+
+def default_jobs(scene_count: int) -> int:
+    """
+    One process per usable core, never more processes than scenes.
+    """
+    return max(1, min(scene_count, os.process_cpu_count() or 1))
+
+
+def build_jobs(
+    python_file: str,
+    scene_names: list[str],
+    config_overrides: Optional[dict[str, Any]] = None,
+    **job_options: Any,
+) -> list[RenderJob]:
+    """
+    Turns the ordered SCENE_LIST into RenderJobs. The index of each job is
+    its position in the list, which is what results are reported by.
+    `job_options` are passed to every RenderJob.
+    """
+    project_dir = str(Path.cwd())
+    return [
+        RenderJob(
+            project_dir,
+            python_file,
+            scene_name,
+            index,
+            dict(config_overrides or {}),
+            **job_options,
+        )
+        for index, scene_name in enumerate(scene_names)
+    ]
+
+
+def render_sharded(
+    pool: ProcessPoolExecutor, job: RenderJob, shards: int
+) -> RenderResult:
+    """
+    Renders one scene as `shards` contiguous frame ranges on `pool` and
+    concatenates the segments into the scene's movie file.
+
+    Every shard replays construct with the same random seed and with
+    caching off, since a cached play would be skipped instead of counted.
+    Slides and scenes without frames fall back to a normal render.
+    """
+    start = time.perf_counter()
+    shard_job = replace(
+        job,
+        config_overrides={**job.config_overrides, "disable_caching": True},
+        cache_dir=None,
+        shard=(0, 0),
+        random_seed=zlib.crc32(job.scene_name.encode()),
+    )
+    count = pool.submit(render_scene, shard_job).result()
+    if not count.ok:
+        return count
+    if not count.frame_count:
+        return pool.submit(render_scene, job).result()
+
+    shard_futures = [
+        pool.submit(render_scene, replace(shard_job, shard=frame_range))
+        for frame_range in split_frames(count.frame_count, shards)
+    ]
+    shard_results = [future.result() for future in shard_futures]
+    for result in shard_results:
+        if not result.ok:
+            return result
+
+    segments = [Path(result.segment_file) for result in shard_results]
+    movie_file = Path(shard_results[0].movie_file)
+    concat_segments(segments, movie_file)
+    for segment in segments:
+        segment.unlink()
+
+    return RenderResult(
+        job.scene_name,
+        job.index,
+        time.perf_counter() - start,
+        movie_file=str(movie_file),
+        frame_count=count.frame_count,
+    )
+
+
+def render_all(
+    jobs: list[RenderJob], max_workers: int, shards: int = 1
+) -> list[RenderResult]:
+    """
+    Renders every job and returns the results in SCENE_LIST order,
+    regardless of the order the scenes finished in.
+
+    parameters:
+        jobs (list[RenderJob]): The scenes to render
+        max_workers (int): Size of the process pool. 1 renders in this process.
+        shards (int, default = 1): Split every scene's frames over this many
+            processes. Ignored when rendering in this process.
+
+    returns:
+        (list[RenderResult]): One result per job, ordered like `jobs`
+    """
+    if max_workers <= 1:
+        results = []
+        for job in jobs:
+            result = render_scene(job)
+            report(result, len(jobs))
+            results.append(result)
+        return results
+
+    # spawn instead of fork so every worker gets a clean manim config
+    context = multiprocessing.get_context("spawn")
+    with (
+        ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as pool,
+        ThreadPoolExecutor(max_workers=len(jobs)) as orchestrators,
+    ):
+        futures: list[Future[RenderResult]]
+        if shards > 1:
+            futures = [
+                orchestrators.submit(render_sharded, pool, job, shards) for job in jobs
+            ]
+        else:
+            futures = [pool.submit(render_scene, job) for job in jobs]
+        for future in futures:
+            future.add_done_callback(lambda f: report(f.result(), len(jobs)))
+        return [future.result() for future in futures]
+
+
+def report(result: RenderResult, total: int) -> None:
+    status = "done" if result.ok else "FAILED"
+    print(
+        f"[{result.index + 1}/{total}] {result.scene_name} {status} "
+        f"in {result.seconds:.1f}s",
+        flush=True,
+    )
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="render_tools",
+        description="Render the scenes of a SCENE_LIST in parallel.",
+    )
+    parser.add_argument("python_file", help="The file holding the scenes")
+    parser.add_argument("scenes", nargs="+", help="Scene names, in SCENE_LIST order")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of processes to render with (default: one per core)",
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=1,
+        help="Split the frames of every (non-Slide) scene over this many processes",
+    )
+    parser.add_argument(
+        "-q",
+        "--quality",
+        default="final",
+        help="Quality profile to render with: draft, review, final or one from "
+        "manim.cfg (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Encode every scene through one open stream instead of a file per play "
+        "(skips the shared cache)",
+    )
+    parser.add_argument(
+        "--frame-buffers",
+        type=int,
+        default=DEFAULT_FRAME_BUFFERS,
+        metavar="N",
+        help="Frames the rasterizer may get ahead of the encoder before it waits, "
+        "0 for manim's unbounded queue (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--no-static-holds",
+        action="store_true",
+        help="Rasterize every frame even when nothing on screen changed",
+    )
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        default=None,
+        metavar="DIR",
+        help="Write a per-play timing report for every scene to DIR/<Scene>.json",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=Path(os.environ.get("MANIM_RENDER_CACHE", DEFAULT_CACHE_DIR)),
+        help="Partial movie cache shared by all projects "
+        "(default: $MANIM_RENDER_CACHE or %(default)s)",
+    )
+    parser.add_argument(
+        "--cache-quota",
+        type=parse_size,
+        default=DEFAULT_CACHE_QUOTA,
+        help="Size limit of the shared cache, e.g. 500M or 20G (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Only use each scene's own partial_movie_dir, like plain manim",
+    )
+    parser.add_argument(
+        "--tex-cache-dir",
+        type=Path,
+        default=Path(os.environ.get("MANIM_TEX_CACHE", DEFAULT_TEX_CACHE_DIR)),
+        help="LaTeX cache shared by all projects "
+        "(default: $MANIM_TEX_CACHE or %(default)s)",
+    )
+    parser.add_argument(
+        "--tex-cache-quota",
+        type=parse_size,
+        default=DEFAULT_TEX_CACHE_QUOTA,
+        help="Size limit of the LaTeX cache (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--no-tex-cache",
+        action="store_true",
+        help="Compile LaTeX into each project's own tex_dir only, and don't pre-warm",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    args = parse_args(argv)
+    profiles = load_profiles()
+    if args.quality not in profiles:
+        sys.exit(
+            f"unknown quality profile {args.quality!r}, "
+            f"pick one of {', '.join(profiles)}"
+        )
+    max_workers = args.jobs or default_jobs(len(args.scenes) * args.shards)
+
+    config_overrides: dict[str, Any] = {}
+    if max_workers > 1:
+        # interleaved progress bars from several processes are unreadable
+        config_overrides["progress_bar"] = "none"
+
+    tex_cache_dir = None if args.no_tex_cache else args.tex_cache_dir.expanduser()
+    if tex_cache_dir is not None and max_workers > 1:
+        start = time.perf_counter()
+        for error in prewarm(
+            Path(args.python_file), tex_cache_dir, args.tex_cache_quota, max_workers
+        ):
+            # the scene will fail on it again, with the full traceback
+            print(f"LaTeX pre-warm: {error}", file=sys.stderr)
+        print(f"LaTeX cache warmed in {time.perf_counter() - start:.1f}s", flush=True)
+
+    jobs = build_jobs(
+        args.python_file,
+        args.scenes,
+        config_overrides,
+        cache_dir=(
+            None if args.no_cache or args.stream else str(args.cache_dir.expanduser())
+        ),
+        cache_quota=args.cache_quota,
+        static_holds=not args.no_static_holds,
+        profile_dir=str(args.profile.absolute()) if args.profile else None,
+        quality=profiles[args.quality],
+        stream=args.stream,
+        frame_buffers=args.frame_buffers,
+        tex_cache_dir=str(tex_cache_dir) if tex_cache_dir is not None else None,
+        tex_cache_quota=args.tex_cache_quota,
+    )
+    results = render_all(jobs, max_workers, args.shards)
+
+    failed = [result for result in results if not result.ok]
+    for result in failed:
+        print(f"\n{result.scene_name} failed:\n{result.error}", file=sys.stderr)
+
+    for result in results:
+        if result.ok and result.movie_file is not None:
+            print(f"{result.scene_name}: {result.movie_file}")
+
+    if failed:
+        sys.exit(1)
@@ -0,0 +1,142 @@
+"""
+Renders one long scene across several processes.
+
+Every shard process replays the whole `construct`, so updaters, camera
+rotation and everything else that builds up scene state run exactly like
+they do in a normal render. Only frames inside the shard's range are
+rasterized and encoded though, and rasterizing is what dominates the heavy
+3D shorts. The encoded segments are then concatenated without re-encoding.
+
+A first pass with an empty range counts the frames of the scene so the
+timeline can be split into contiguous shards of equal length.
+"""
+
+from pathlib import Path
+from typing import Optional
+import math
+
+
+def split_frames(total_frames: int, shards: int) -> list[tuple[int, int]]:
+    """
+    Splits `total_frames` into at most `shards` contiguous, non-empty
+    [start, end) ranges of (nearly) equal length.
+    """
+    shards = max(1, min(shards, total_frames))
+    bounds = [total_frames * n // shards for n in range(shards + 1)]
+    return [(bounds[n], bounds[n + 1]) for n in range(shards)]
+
+
+def concat_segments(segments: list[Path], output_file: Path) -> None:
+    """
+    Joins encoded segments into `output_file` by copying packets, the same
+    way manim combines its partial movie files. Nothing is re-encoded.
+    """
+    import av
+
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    file_list = output_file.with_name(f"{output_file.stem}_shards.txt")
+    with file_list.open("w", encoding="utf-8") as fp:
+        for segment in segments:
+            fp.write(f"file 'file:{Path(segment).absolute().as_posix()}'\n")
+
+    segments_input = av.open(
+        str(file_list), options={"safe": "0", "an": "1"}, format="concat"
+    )
+    segments_stream = segments_input.streams.video[0]
+    output_container = av.open(str(output_file), mode="w")
+    output_stream = output_container.add_stream(template=segments_stream)
+    for packet in segments_input.demux(segments_stream):
+        if packet.dts is None:
+            continue
+        packet.dts = None
+        packet.stream = output_stream
+        output_container.mux(packet)
+    segments_input.close()
+    output_container.close()
+    file_list.unlink()
+
+
+class ShardRenderer:
+    """
+    Mixin for manim's CairoRenderer that counts every frame of the scene
+    but only rasterizes and writes the ones in `shard_range`.
+
+    An empty range, (0, 0), renders nothing and is used to count frames.
+    """
+
+    shard_range: tuple[int, int] = (0, 0)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.frame_index = 0
+        self.play_in_shard = True
+
+    def frames_in_shard(self, first_frame: int, num_frames: int) -> int:
+        start, end = self.shard_range
+        return max(0, min(first_frame + num_frames, end) - max(first_frame, start))
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        # Called once at the start of every play, before any of its frames.
+        # Plays that never reach the shard skip rasterizing altogether.
+        play_frames = math.ceil(scene.duration * self.camera.frame_rate) + 1
+        self.play_in_shard = self.frames_in_shard(self.frame_index, play_frames) > 0
+        if not self.play_in_shard:
+            self.static_image = None
+            return None
+        return super().save_static_frame_data(scene, static_mobjects)
+
+    def update_frame(self, *args, **kwargs) -> None:
+        if self.play_in_shard:
+            super().update_frame(*args, **kwargs)
+
+    def get_frame(self):
+        if not self.play_in_shard:
+            return None
+        return super().get_frame()
+
+    def render(self, scene, time, moving_mobjects) -> None:
+        if self.frames_in_shard(self.frame_index, 1):
+            super().render(scene, time, moving_mobjects)
+        else:
+            self.add_frame(None)
+
+    def add_frame(self, frame, num_frames: int = 1) -> None:
+        if self.skip_animations:
+            return
+        frames_to_write = self.frames_in_shard(self.frame_index, num_frames)
+        self.frame_index += num_frames
+        self.time += num_frames / self.camera.frame_rate
+        if frames_to_write:
+            self.file_writer.write_frame(frame, num_frames=frames_to_write)
+
+
+class ShardFileWriter:
+    """
+    Mixin for manim's SceneFileWriter that writes every frame it receives
+    into one segment file instead of one partial movie file per play.
+    """
+
+    segment_file: Optional[Path] = None
+
+    def begin_animation(self, allow_write: bool = False, file_path=None) -> None:
+        pass
+
+    def end_animation(self, allow_write: bool = False) -> None:
+        pass
+
+    def write_frame(self, frame_or_renderer, num_frames: int = 1) -> None:
+        if self.segment_file is None:
+            from manim import config
+
+            start, end = self.renderer.shard_range
+            segment_dir = self.partial_movie_directory / "shards"
+            segment_dir.mkdir(parents=True, exist_ok=True)
+            self.segment_file = (
+                segment_dir / f"{start:07}_{end:07}{config.movie_file_extension}"
+            )
+            self.open_partial_movie_stream(file_path=str(self.segment_file))
+        super().write_frame(frame_or_renderer, num_frames=num_frames)
+
+    def finish(self) -> None:
+        if self.segment_file is not None:
+            self.close_partial_movie_stream()
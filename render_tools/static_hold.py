@@ -0,0 +1,148 @@
+"""
+Skips re-rasterizing and re-converting frames that can't have changed.
+
+manim already freezes a `self.wait()` when nothing on screen has a
+time-based updater, but it still converts and encodes the held frame once
+per output frame. Holds that do have updaters, and stretches of a play
+where the moving mobjects come to rest, are rasterized every frame.
+
+The renderer mixin fingerprints the moving mobjects and camera before each
+frame. If nothing changed since the last rasterized frame, that frame is
+handed out again instead of drawing a new one. The file writer mixin then
+collapses runs of the same frame into one write and converts the held
+frame to the encoder's pixel format once for the whole run.
+"""
+
+from typing import Any, Optional
+import hashlib
+
+import numpy as np
+
+ARRAY_ATTRS: tuple[str, ...] = (
+    "points",
+    "fill_rgbas",
+    "stroke_rgbas",
+    "background_stroke_rgbas",
+    "pixel_array",
+)
+SCALAR_ATTRS: tuple[str, ...] = (
+    "stroke_width",
+    "background_stroke_width",
+    "z_index",
+    "shade_in_3d",
+)
+
+
+def frame_fingerprint(mobjects: list, camera: Any) -> bytes:
+    """
+    Hashes everything about `mobjects` and `camera` that ends up in a
+    rasterized frame: points, colors, stroke widths, draw order and the
+    camera's position and orientation.
+    """
+    from manim.utils.family import extract_mobject_family_members
+
+    digest = hashlib.blake2b(digest_size=16)
+    for mobject in extract_mobject_family_members(mobjects):
+        digest.update(id(mobject).to_bytes(8, "little"))
+        for attr in ARRAY_ATTRS:
+            value = getattr(mobject, attr, None)
+            if isinstance(value, np.ndarray):
+                digest.update(np.ascontiguousarray(value).data)
+        digest.update(
+            repr([getattr(mobject, attr, None) for attr in SCALAR_ATTRS]).encode()
+        )
+
+    digest.update(np.ascontiguousarray(camera.frame_center).data)
+    digest.update(repr((camera.frame_width, camera.frame_height)).encode())
+    if hasattr(camera, "get_value_trackers"):
+        digest.update(
+            repr(
+                [tracker.get_value() for tracker in camera.get_value_trackers()]
+            ).encode()
+        )
+    return digest.digest()
+
+
+class StaticHoldRenderer:
+    """
+    Mixin for manim's CairoRenderer that reuses the previous frame when the
+    moving mobjects and the camera haven't changed since it was drawn.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.last_fingerprint: Optional[bytes] = None
+        self.last_frame: Optional[np.ndarray] = None
+        self.held_frames = 0
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        # the static background is redrawn for every play
+        self.last_fingerprint = None
+        self.last_frame = None
+        return super().save_static_frame_data(scene, static_mobjects)
+
+    def render(self, scene, time, moving_mobjects) -> None:
+        fingerprint = frame_fingerprint(moving_mobjects, self.camera)
+        if fingerprint == self.last_fingerprint and self.last_frame is not None:
+            self.held_frames += 1
+            self.add_frame(self.last_frame)
+            return
+
+        self.update_frame(scene, moving_mobjects)
+        self.last_frame = self.get_frame()
+        self.last_fingerprint = fingerprint
+        self.add_frame(self.last_frame)
+
+
+class StaticHoldFileWriter:
+    """
+    Mixin for manim's SceneFileWriter that merges consecutive writes of the
+    same frame into one write, and encodes repeated frames from a single
+    pixel format conversion.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        self.held_frame: Optional[np.ndarray] = None
+        self.held_count = 0
+        super().__init__(*args, **kwargs)
+
+    def write_frame(self, frame_or_renderer, num_frames: int = 1) -> None:
+        if frame_or_renderer is not None and frame_or_renderer is self.held_frame:
+            self.held_count += num_frames
+            return
+        self.flush_held_frame()
+        self.held_frame = frame_or_renderer
+        self.held_count = num_frames
+
+    def flush_held_frame(self) -> None:
+        if self.held_frame is not None and self.held_count:
+            super().write_frame(self.held_frame, num_frames=self.held_count)
+        self.held_frame = None
+        self.held_count = 0
+
+    def end_animation(self, allow_write: bool = False) -> None:
+        self.flush_held_frame()
+        super().end_animation(allow_write)
+
+    def finish(self) -> None:
+        self.flush_held_frame()
+        super().finish()
+
+    def encode_and_write_frame(self, frame, num_frames: int) -> None:
+        if num_frames == 1 or self.video_stream.pix_fmt != "yuv420p":
+            super().encode_and_write_frame(frame, num_frames)
+            return
+
+        import av
+
+        # Convert RGBA -> YUV once. The encoder needs a fresh VideoFrame
+        # per output frame, but copying planes is far cheaper than swscale.
+        planes = (
+            av.VideoFrame.from_ndarray(frame, format="rgba")
+            .reformat(format="yuv420p")
+            .to_ndarray()
+        )
+        for _ in range(num_frames):
+            av_frame = av.VideoFrame.from_ndarray(planes, format="yuv420p")
+            for packet in self.video_stream.encode(av_frame):
+                self.video_container.mux(packet)
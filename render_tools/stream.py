@@ -0,0 +1,183 @@
+"""
+Encodes a whole scene through one open video stream.
+
+Normally every `self.play`/`self.wait` opens its own partial movie file:
+a new container, a new x264 encoder with its lookahead to fill and drain,
+and a file to write and read back when the partials are concatenated. For
+decks with hundreds of short plays that overhead is most of the render.
+
+In streaming mode the encoder is opened once per scene and every frame goes
+straight into it. The first frame of each play is forced to be a keyframe,
+so the stream can afterwards be cut at play boundaries by copying packets.
+That gives back the per-play partial movie files manim-slides (and manim's
+sections) split on, without encoding anything twice. The play boundaries
+are also written to `stream.json` next to the partial movie files.
+"""
+
+from pathlib import Path
+from typing import Any, Optional
+import bisect
+import json
+import os
+
+
+def split_stream(
+    stream_file: Path, plays: list[tuple[str, int, int]], frame_rate: float
+) -> None:
+    """
+    Cuts `stream_file` into one file per play by copying packets.
+
+    parameters:
+        stream_file (Path): The encoded scene, with a keyframe at the start of every play
+        plays (list[tuple[str, int, int]]): Output path and [start, end) frames of every play
+        frame_rate (float): Frames per second of the stream
+    """
+    import av
+
+    starts = [start for _, start, _ in plays]
+    with av.open(str(stream_file)) as stream_input:
+        stream = stream_input.streams.video[0]
+        output = None
+        output_stream = None
+        current = -1
+        offset = 0
+        for packet in stream_input.demux(stream):
+            if packet.dts is None:
+                continue
+            frame = round(packet.pts * stream.time_base * frame_rate)
+            play = bisect.bisect_right(starts, frame) - 1
+            if play > current:
+                if output is not None:
+                    output.close()
+                current = play
+                output = av.open(plays[play][0], mode="w")
+                output_stream = output.add_stream(template=stream)
+                # every partial movie file starts at 0, like manim's own
+                offset = round(starts[play] / frame_rate / stream.time_base)
+            packet.pts -= offset
+            packet.dts -= offset
+            packet.stream = output_stream
+            output.mux(packet)
+        if output is not None:
+            output.close()
+
+
+class StreamFileWriter:
+    """
+    Mixin for manim's SceneFileWriter that keeps one video stream open for
+    the whole scene and splits it into the usual partial movie files at the
+    end.
+    """
+
+    stream_file: Optional[Path] = None
+
+    def __init__(self, *args, **kwargs) -> None:
+        self.stream_frames = 0
+        self.encoded_frames = 0
+        self.keyframes: set[int] = set()
+        self.play_ranges: list[list[Any]] = []
+        super().__init__(*args, **kwargs)
+
+    def open_stream(self) -> None:
+        from manim import config
+
+        self.stream_file = (
+            self.partial_movie_directory / f"stream{config.movie_file_extension}"
+        )
+        self.open_partial_movie_stream(file_path=str(self.stream_file))
+        codec_context = self.video_stream.codec_context
+        if codec_context.name == "libx264":
+            # forced keyframes must be IDR frames, or the cut files won't decode
+            codec_context.options = {**codec_context.options, "forced-idr": "1"}
+
+    def begin_animation(self, allow_write: bool = False, file_path=None) -> None:
+        from manim.utils.file_ops import write_to_movie
+
+        if not (write_to_movie() and allow_write):
+            return
+        if self.stream_file is None:
+            self.open_stream()
+        if file_path is None:
+            file_path = self.partial_movie_files[self.renderer.num_plays]
+        self.keyframes.add(self.stream_frames)
+        self.play_ranges.append(
+            [str(file_path), self.stream_frames, self.stream_frames]
+        )
+
+    def end_animation(self, allow_write: bool = False) -> None:
+        from manim.utils.file_ops import write_to_movie
+
+        # lets the other mixins finish the play without closing the stream
+        super().end_animation(allow_write=False)
+        if write_to_movie() and allow_write and self.play_ranges:
+            self.play_ranges[-1][2] = self.stream_frames
+
+    def write_frame(self, frame_or_renderer, num_frames: int = 1) -> None:
+        from manim.utils.file_ops import write_to_movie
+
+        if write_to_movie():
+            self.stream_frames += num_frames
+        super().write_frame(frame_or_renderer, num_frames)
+
+    def encode_and_write_frame(self, frame, num_frames: int) -> None:
+        # runs on the writer thread, in the order the frames were written
+        if self.encoded_frames in self.keyframes:
+            import av
+
+            av_frame = av.VideoFrame.from_ndarray(frame, format="rgba")
+            av_frame.pict_type = av.video.frame.PictureType.I
+            for packet in self.video_stream.encode(av_frame):
+                self.video_container.mux(packet)
+            self.encoded_frames += 1
+            num_frames -= 1
+        if num_frames:
+            super().encode_and_write_frame(frame, num_frames)
+            self.encoded_frames += num_frames
+
+    def write_markers(self) -> None:
+        from manim import config
+
+        markers = [
+            {
+                "file": file,
+                "start_frame": start,
+                "end_frame": end,
+                "start": start / config.frame_rate,
+                "end": end / config.frame_rate,
+            }
+            for file, start, end in self.play_ranges
+        ]
+        with (self.partial_movie_directory / "stream.json").open("w") as fp:
+            json.dump(markers, fp, indent=4)
+
+    def finish(self) -> None:
+        from manim import config
+
+        if self.stream_file is not None:
+            self.close_partial_movie_stream()
+            split_stream(
+                self.stream_file,
+                [tuple(play) for play in self.play_ranges if play[2] > play[1]],
+                config.frame_rate,
+            )
+            self.write_markers()
+        super().finish()
+        if self.stream_file is not None:
+            self.stream_file.unlink(missing_ok=True)
+
+    def combine_to_movie(self) -> None:
+        from manim.utils.file_ops import is_gif_format
+
+        partial_movie_files = [file for file in self.partial_movie_files if file]
+        streamed = {file for file, _, _ in self.play_ranges}
+        if (
+            self.stream_file is None
+            or self.includes_sound
+            or is_gif_format()
+            or any(str(file) not in streamed for file in partial_movie_files)
+        ):
+            # cached plays aren't in the stream, sound and gifs need manim's combine
+            super().combine_to_movie()
+            return
+        os.replace(self.stream_file, self.movie_file_path)
+        self.print_file_ready_message(str(self.movie_file_path))
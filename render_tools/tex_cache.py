@@ -0,0 +1,296 @@
+"""
+A LaTeX -> SVG cache shared by every project, and a pre-warm step that
+compiles a scene file's MathTex/Tex strings in parallel before rendering.
+
+manim compiles every MathTex and Tex one at a time into the project's own
+`tex_dir`, one latex and one dvisvgm run each, so the same `x + y = 0`
+is compiled again by every short that uses it. Here compiled SVGs are
+stored under a hash of the complete .tex source (template preamble
+included), the compiler and its output format, and linked into a
+project's `tex_dir` the first time that project asks for them.
+
+Misses are compiled in a private build directory, so render processes
+running side by side never delete each other's .aux and .dvi files.
+
+Pre-warming reads the scene file with `ast` and collects every MathTex,
+Tex and SingleStringMathTex call whose strings are literals. Each one is
+built once in a process pool, which compiles whatever isn't cached yet.
+Strings built at runtime (`r"\\mathbf{v} = " + str(v)`) are left for the
+render itself.
+
+    PYTHONPATH=.. python -m render_tools.tex_cache main.py
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Final, Optional
+import argparse
+import ast
+import hashlib
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+from render_tools.cache import RenderCache, parse_size
+
+DEFAULT_TEX_CACHE_DIR: Final[Path] = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    / "manim-projects"
+    / "tex"
+)
+DEFAULT_TEX_CACHE_QUOTA: Final[str] = "1G"
+# the cache of a pool process, kept across calls so its size is scanned once
+POOL_CACHES: dict[tuple[str, int], RenderCache] = {}
+TEX_CLASSES: Final[tuple[str, ...]] = ("MathTex", "Tex", "SingleStringMathTex")
+# keyword arguments that change what gets compiled
+TEX_KWARGS: Final[tuple[str, ...]] = (
+    "arg_separator",
+    "substrings_to_isolate",
+    "tex_environment",
+)
+
+
+@dataclass(frozen=True)
+class TexCall:
+    """
+    A MathTex/Tex call found in a scene file.
+
+    parameters:
+        class_name (str): MathTex, Tex or SingleStringMathTex
+        args (tuple[str, ...]): The tex strings
+        kwargs (dict[str, Any]): Keyword arguments that change what gets compiled
+        lineno (int): Where the call is in the file
+    """
+
+    class_name: str
+    args: tuple[str, ...]
+    kwargs: dict[str, Any] = field(default_factory=dict, hash=False)
+    lineno: int = field(default=0, compare=False)
+
+
+def tex_cache_key(source: str, tex_template: Any) -> str:
+    fingerprint = {
+        "source": source,
+        "tex_compiler": tex_template.tex_compiler,
+        "output_format": tex_template.output_format,
+    }
+    return hashlib.sha256(json.dumps(fingerprint, sort_keys=True).encode()).hexdigest()
+
+
+def install_tex_cache(cache: RenderCache) -> None:
+    """
+    Makes every MathTex/Tex built in this process go through `cache`.
+    """
+    import manim.mobject.text.tex_mobject as tex_mobject
+    from manim import config
+    from manim.utils.tex_file_writing import tex_hash, tex_to_svg_file
+
+    def cached_tex_to_svg_file(
+        expression: str,
+        environment: Optional[str] = None,
+        tex_template: Optional[Any] = None,
+    ) -> Path:
+        if tex_template is None:
+            tex_template = config["tex_template"]
+        if environment is not None:
+            source = tex_template.get_texcode_for_expression_in_env(
+                expression, environment
+            )
+        else:
+            source = tex_template.get_texcode_for_expression(expression)
+
+        key = tex_cache_key(source, tex_template)
+        svg_file = config.get_dir("tex_dir") / f"{tex_hash(source)}.svg"
+        if svg_file.exists():
+            cache.store(key, svg_file)
+            return svg_file
+        if cache.fetch(key, svg_file):
+            return svg_file
+
+        tex_dir = config.tex_dir
+        with tempfile.TemporaryDirectory(prefix="manim-tex-") as build_dir:
+            config.tex_dir = build_dir
+            try:
+                built = tex_to_svg_file(expression, environment, tex_template)
+            finally:
+                config.tex_dir = tex_dir
+            cache.store(key, built)
+        cache.fetch(key, svg_file)
+        return svg_file
+
+    tex_mobject.tex_to_svg_file = cached_tex_to_svg_file
+
+
+def literal_string(node: ast.expr) -> Optional[str]:
+    """
+    The value of a string literal, including literals joined with `+`.
+    """
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        left = literal_string(node.left)
+        right = literal_string(node.right)
+        if left is not None and right is not None:
+            return left + right
+    return None
+
+
+def tex_call(node: ast.Call) -> Optional[TexCall]:
+    """
+    The TexCall for `node`, or None if it isn't a MathTex/Tex call or
+    anything that changes what gets compiled isn't a literal.
+    """
+    func = node.func
+    name = func.id if isinstance(func, ast.Name) else getattr(func, "attr", None)
+    if name not in TEX_CLASSES:
+        return None
+
+    args = tuple(literal_string(arg) for arg in node.args)
+    if not args or None in args:
+        return None
+
+    kwargs: dict[str, Any] = {}
+    for keyword in node.keywords:
+        if keyword.arg is None or keyword.arg == "tex_template":
+            return None
+        if keyword.arg == "tex_to_color_map":
+            # only the keys change how the string is split up
+            if not isinstance(keyword.value, ast.Dict):
+                return None
+            keys = [literal_string(key) for key in keyword.value.keys if key]
+            if None in keys:
+                return None
+            kwargs["substrings_to_isolate"] = [
+                *kwargs.get("substrings_to_isolate", []),
+                *keys,
+            ]
+        elif keyword.arg in TEX_KWARGS:
+            try:
+                value = ast.literal_eval(keyword.value)
+            except ValueError:
+                return None
+            if keyword.arg == "substrings_to_isolate":
+                value = [*kwargs.get("substrings_to_isolate", []), *value]
+            kwargs[keyword.arg] = value
+    return TexCall(name, args, kwargs, node.lineno)
+
+
+def collect_tex_calls(python_file: Path) -> list[TexCall]:
+    """
+    Every distinct MathTex/Tex call with literal strings in `python_file`,
+    in the order they appear.
+    """
+    tree = ast.parse(Path(python_file).read_text(encoding="utf-8"))
+    calls: dict[tuple, TexCall] = {}
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        call = tex_call(node)
+        if call is not None:
+            signature = (call.class_name, call.args, repr(sorted(call.kwargs.items())))
+            calls.setdefault(signature, call)
+    return sorted(calls.values(), key=lambda call: call.lineno)
+
+
+def build_tex(
+    project_dir: str, cache_dir: str, cache_quota: int, call: TexCall
+) -> Optional[str]:
+    """
+    Builds one MathTex/Tex in a pool process, compiling it if it isn't
+    cached. Returns the error if it failed to compile.
+    """
+    os.chdir(project_dir)
+    try:
+        import manim
+
+        if (cache_dir, cache_quota) not in POOL_CACHES:
+            cache = RenderCache(Path(cache_dir), cache_quota, ".svg")
+            POOL_CACHES[cache_dir, cache_quota] = cache
+            install_tex_cache(cache)
+        getattr(manim, call.class_name)(*call.args, **call.kwargs)
+    except Exception as error:
+        return f"line {call.lineno}: {call.class_name}{call.args}: {error}"
+    return None
+
+
+def prewarm(
+    python_file: Path,
+    cache_dir: Path,
+    cache_quota: int,
+    max_workers: int,
+) -> list[str]:
+    """
+    Compiles every literal MathTex/Tex string in `python_file` that isn't in
+    the cache yet, `max_workers` at a time. Must be run from the project
+    directory.
+
+    returns:
+        (list[str]): The calls that failed to compile
+    """
+    calls = collect_tex_calls(python_file)
+    if not calls:
+        return []
+
+    project_dir = str(Path.cwd())
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=max(1, min(max_workers, len(calls))), mp_context=context
+    ) as pool:
+        errors = pool.map(
+            build_tex,
+            [project_dir] * len(calls),
+            [str(cache_dir)] * len(calls),
+            [cache_quota] * len(calls),
+            calls,
+        )
+        return [error for error in errors if error is not None]
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="render_tools.tex_cache",
+        description="Compile the MathTex/Tex strings of a scene file into the shared cache.",
+    )
+    parser.add_argument("python_file", type=Path, help="The file holding the scenes")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.process_cpu_count() or 1,
+        help="Number of processes to compile with (default: one per core)",
+    )
+    parser.add_argument(
+        "--tex-cache-dir",
+        type=Path,
+        default=Path(os.environ.get("MANIM_TEX_CACHE", DEFAULT_TEX_CACHE_DIR)),
+        help="LaTeX cache shared by all projects "
+        "(default: $MANIM_TEX_CACHE or %(default)s)",
+    )
+    parser.add_argument(
+        "--tex-cache-quota",
+        type=parse_size,
+        default=DEFAULT_TEX_CACHE_QUOTA,
+        help="Size limit of the LaTeX cache (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    errors = prewarm(
+        args.python_file,
+        args.tex_cache_dir.expanduser(),
+        args.tex_cache_quota,
+        args.jobs,
+    )
+    for error in errors:
+        print(error, file=sys.stderr)
+    print(f"LaTeX cache warmed in {time.perf_counter() - start:.1f}s")
+    if errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
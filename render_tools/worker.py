@@ -0,0 +1,280 @@
+"""
+Renders a single scene. This is what runs inside each process of the pool.
+
+manim is imported lazily so the driver process never has to pay for it.
+`manim` reads `manim.cfg` from the working directory on import, so the
+worker changes into the project directory before anything else happens.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+import os
+import random
+import time
+import traceback
+
+from render_tools.pipeline import DEFAULT_FRAME_BUFFERS
+from render_tools.quality import QualityProfile
+
+
+@dataclass
+class RenderJob:
+    """
+    Everything a worker needs to render one scene.
+
+    parameters:
+        project_dir (str): The directory holding the project's manim.cfg
+        python_file (str): The scene file, relative to project_dir
+        scene_name (str): The class name of the scene to render
+        index (int): Position of the scene in the SCENE_LIST
+        config_overrides (dict[str, Any]): Values set on manim's config before rendering
+        cache_dir (Optional[str], default = None): Shared render cache to use, if any
+        cache_quota (int, default = 0): Size limit of the shared render cache in bytes
+        shard (Optional[tuple[int, int]], default = None): Only rasterize frames in this
+            [start, end) range into a segment file. (0, 0) only counts the scene's frames.
+        random_seed (Optional[int], default = None): Seeds `random` and numpy before
+            the scene is built, so shards of one scene replay the same construct
+        static_holds (bool, default = True): Reuse the last frame while nothing on
+            screen changes instead of rasterizing and converting it again
+        profile_dir (Optional[str], default = None): Write a per-play timing report
+            for the scene into this directory
+        quality (Optional[QualityProfile], default = None): Render at this profile's
+            resolution, frame rate and drawing settings instead of manim.cfg's
+        stream (bool, default = False): Encode the whole scene through one open
+            stream and cut it into partial movie files afterwards
+        frame_buffers (int, default = DEFAULT_FRAME_BUFFERS): Frames that can wait for
+            the encoder before rasterizing blocks. 0 uses manim's unbounded queue.
+        tex_cache_dir (Optional[str], default = None): Shared LaTeX cache to use, if any
+        tex_cache_quota (int, default = 0): Size limit of the LaTeX cache in bytes
+    """
+
+    project_dir: str
+    python_file: str
+    scene_name: str
+    index: int
+    config_overrides: dict[str, Any] = field(default_factory=dict)
+    cache_dir: Optional[str] = None
+    cache_quota: int = 0
+    shard: Optional[tuple[int, int]] = None
+    random_seed: Optional[int] = None
+    static_holds: bool = True
+    profile_dir: Optional[str] = None
+    quality: Optional[QualityProfile] = None
+    stream: bool = False
+    frame_buffers: int = DEFAULT_FRAME_BUFFERS
+    tex_cache_dir: Optional[str] = None
+    tex_cache_quota: int = 0
+
+
+@dataclass
+class RenderResult:
+    """
+    What a worker reports back to the driver once a scene is done.
+
+    parameters:
+        scene_name (str): The class name of the rendered scene
+        index (int): Position of the scene in the SCENE_LIST
+        seconds (float): Wall time spent rendering the scene
+        movie_file (Optional[str]): Path of the combined scene movie, if one was written
+        error (Optional[str]): The formatted traceback if rendering failed
+        frame_count (Optional[int]): Frames in the scene, set by shard jobs
+        segment_file (Optional[str]): The segment a shard job wrote, if any
+    """
+
+    scene_name: str
+    index: int
+    seconds: float
+    movie_file: Optional[str] = None
+    error: Optional[str] = None
+    frame_count: Optional[int] = None
+    segment_file: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def load_scene_class(python_file: Path, scene_name: str) -> type:
+    """
+    Imports `python_file` the same way the manim CLI does and returns the
+    scene class called `scene_name`.
+    """
+    from manim.utils.module_ops import get_module
+
+    module = get_module(python_file)
+    scene_cls = getattr(module, scene_name, None)
+    if scene_cls is None:
+        raise LookupError(f"{scene_name} not found in {python_file}")
+    return scene_cls
+
+
+def install_renderer(job: RenderJob) -> None:
+    """
+    Makes every scene created in this process use a CairoRenderer and
+    SceneFileWriter extended with the mixins `job` asks for.
+
+    Scenes build their renderer inside `Scene.__init__`, so swapping the
+    class manim.scene.scene refers to is the one place that covers Scene,
+    ThreeDScene and Slide alike without touching the projects.
+    """
+    import manim.scene.scene as scene_module
+    from manim import config
+    from manim.renderer.cairo_renderer import CairoRenderer
+    from manim.scene.scene_file_writer import SceneFileWriter
+
+    renderer_mixins: list[type] = []
+    renderer_attrs: dict[str, Any] = {}
+    file_writer_mixins: list[type] = []
+    file_writer_attrs: dict[str, Any] = {}
+
+    if job.shard is not None:
+        from render_tools.shard import ShardFileWriter, ShardRenderer
+
+        renderer_mixins.append(ShardRenderer)
+        renderer_attrs["shard_range"] = job.shard
+        file_writer_mixins.append(ShardFileWriter)
+
+    if job.static_holds:
+        from render_tools.static_hold import StaticHoldFileWriter, StaticHoldRenderer
+
+        # must wrap the shard writer, whose end_animation doesn't chain up
+        renderer_mixins.append(StaticHoldRenderer)
+        file_writer_mixins.insert(0, StaticHoldFileWriter)
+
+    if job.cache_dir is not None:
+        from render_tools.cache import RenderCache, SharedCacheFileWriter
+
+        file_writer_mixins.append(SharedCacheFileWriter)
+        file_writer_attrs["render_cache"] = RenderCache(
+            Path(job.cache_dir), job.cache_quota, config.movie_file_extension
+        )
+        if job.quality is not None:
+            file_writer_attrs["cache_variant"] = job.quality.cache_variant
+
+    if job.quality is not None and not job.quality.antialias:
+        from render_tools.quality import QualityRenderer
+
+        renderer_mixins.append(QualityRenderer)
+        renderer_attrs["antialias"] = False
+
+    if job.frame_buffers > 0:
+        from render_tools.pipeline import (
+            FramePipelineFileWriter,
+            FramePipelineRenderer,
+        )
+
+        # innermost, they replace how frames get from the camera to the writer thread
+        renderer_mixins.append(FramePipelineRenderer)
+        file_writer_mixins.append(FramePipelineFileWriter)
+        file_writer_attrs["frame_buffers"] = job.frame_buffers
+
+    if job.stream and job.shard is None:
+        from render_tools.stream import StreamFileWriter
+
+        # wraps the static hold writer, so it sees every frame before holds merge them
+        file_writer_mixins.insert(0, StreamFileWriter)
+
+    if job.profile_dir is not None:
+        from render_tools.profiler import ProfilingFileWriter, ProfilingRenderer
+
+        # outermost, so the timers include everything the other mixins do
+        renderer_mixins.insert(0, ProfilingRenderer)
+        file_writer_mixins.insert(0, ProfilingFileWriter)
+
+    file_writer_class = type(
+        "ToolsFileWriter", (*file_writer_mixins, SceneFileWriter), file_writer_attrs
+    )
+    renderer_base = type(
+        "ToolsRendererBase", (*renderer_mixins, CairoRenderer), renderer_attrs
+    )
+
+    class ToolsRenderer(renderer_base):
+        def __init__(self, file_writer_class=file_writer_class, **kwargs):
+            super().__init__(file_writer_class=file_writer_class, **kwargs)
+
+    scene_module.CairoRenderer = ToolsRenderer
+
+
+def apply_quality(quality: QualityProfile) -> None:
+    """
+    Sets manim's config to `quality`'s resolution and frame rate and scales
+    down every Surface the scene will build.
+    """
+    from manim import config
+
+    overrides = quality.config_overrides(
+        config.pixel_width, config.pixel_height, config.frame_rate
+    )
+    for key, value in overrides.items():
+        config[key] = value
+    if quality.surface_resolution_scale != 1.0:
+        from render_tools.quality import install_surface_resolution_scale
+
+        install_surface_resolution_scale(quality.surface_resolution_scale)
+
+
+def render_scene(job: RenderJob) -> RenderResult:
+    """
+    Renders `job.scene_name` and returns a RenderResult. Exceptions are
+    caught and returned as part of the result so one broken scene does not
+    take the rest of the pool down with it.
+    """
+    os.chdir(job.project_dir)
+    start = time.perf_counter()
+    try:
+        from manim import config
+
+        python_file = Path(job.python_file).absolute()
+        config.input_file = python_file
+        for key, value in job.config_overrides.items():
+            config[key] = value
+        if job.quality is not None:
+            apply_quality(job.quality)
+        install_renderer(job)
+        if job.tex_cache_dir is not None:
+            from render_tools.cache import RenderCache
+            from render_tools.tex_cache import install_tex_cache
+
+            install_tex_cache(
+                RenderCache(Path(job.tex_cache_dir), job.tex_cache_quota, ".svg")
+            )
+
+        scene_cls = load_scene_class(python_file, job.scene_name)
+        if job.shard is not None and hasattr(scene_cls, "next_slide"):
+            # slides need one partial movie file per play, so they can't be sharded
+            return RenderResult(job.scene_name, job.index, time.perf_counter() - start)
+
+        if job.random_seed is not None:
+            import numpy as np
+
+            random.seed(job.random_seed)
+            np.random.seed(job.random_seed)
+
+        scene = scene_cls()
+        scene.render()
+        if job.profile_dir is not None:
+            from render_tools.profiler import write_report
+
+            write_report(
+                scene.renderer.profile_report(scene), Path(job.profile_dir).absolute()
+            )
+
+        file_writer = scene.renderer.file_writer
+        movie_file = getattr(file_writer, "movie_file_path", None)
+        segment_file = getattr(file_writer, "segment_file", None)
+        return RenderResult(
+            job.scene_name,
+            job.index,
+            time.perf_counter() - start,
+            movie_file=str(movie_file) if movie_file is not None else None,
+            frame_count=getattr(scene.renderer, "frame_index", None),
+            segment_file=str(segment_file) if segment_file is not None else None,
+        )
+    except Exception:
+        return RenderResult(
+            job.scene_name,
+            job.index,
+            time.perf_counter() - start,
+            error=traceback.format_exc(),
+        )